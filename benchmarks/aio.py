@@ -0,0 +1,133 @@
+# Measures batch latency and event loop lag for an asyncio ingestion service validating feature
+# batches from a queue, with validation inline on the event loop and through `AsyncValidator`
+# with a thread pool and a process pool. A stand-in producer puts batches of synthetic polygons
+# of 100 vertices, with one of 100k vertices in about one batch in ten, on a bounded queue at a
+# fixed rate; consumers validate them. Latency runs from when a batch was due to be produced to
+# when its results are back, so it includes waiting in the queue. Lag is how late a 5 ms timer on
+# the event loop fires.
+#
+#     python benchmarks/aio.py [--rate BATCHES_PER_SECOND] [--batches N] [--workers N]
+
+from overture_schema_pydantic.aio import AsyncValidator
+from overture_schema_pydantic.feature import Feature
+
+import argparse
+import asyncio
+import os
+import random
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from synthetic import features
+
+
+class GenericFeature(Feature):
+    pass
+
+
+BATCH_SIZE = 20
+
+CONSUMERS = 4
+
+QUEUE_SIZE = 16
+
+TICK = 0.005
+
+
+def make_batches(count: int) -> list[list[dict]]:
+    # Every tenth batch or so carries one very large polygon.
+    small = features("place", "polygon-100", "minimal", 200)
+    large = features("place", "multipolygon-100k", "minimal", 5)
+    rng = random.Random(0)
+    batches = []
+    for _ in range(count):
+        batch = [rng.choice(small) for _ in range(BATCH_SIZE)]
+        if rng.random() < 0.1:
+            batch[0] = rng.choice(large)
+        batches.append(batch)
+    return batches
+
+
+async def produce(queue: asyncio.Queue, batches: list, rate: float):
+    start = time.perf_counter()
+    for i, batch in enumerate(batches):
+        due = start + i / rate
+        await asyncio.sleep(max(0, due - time.perf_counter()))
+        # Waits while the queue is full: the service pushes back on its source.
+        await queue.put((due, batch))
+    for _ in range(CONSUMERS):
+        await queue.put(None)
+
+
+async def consume(queue: asyncio.Queue, validate, latencies: list):
+    while (item := await queue.get()) is not None:
+        due, batch = item
+        results = await validate(batch)
+        assert len(results) == len(batch)
+        latencies.append(time.perf_counter() - due)
+
+
+async def tick(lags: list, done: asyncio.Event):
+    while not done.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(TICK)
+        lags.append(time.perf_counter() - start - TICK)
+
+
+async def run(validate, batches: list, rate: float) -> tuple[list, list]:
+    queue = asyncio.Queue(QUEUE_SIZE)
+    latencies, lags = [], []
+    done = asyncio.Event()
+    ticker = asyncio.create_task(tick(lags, done))
+    await asyncio.gather(
+        produce(queue, batches, rate),
+        *(consume(queue, validate, latencies) for _ in range(CONSUMERS)),
+    )
+    done.set()
+    await ticker
+    return latencies, lags
+
+
+async def inline(batch: list) -> list:
+    return [GenericFeature.model_validate(value) for value in batch]
+
+
+def report(name: str, latencies: list, lags: list):
+    latency = np.percentile(np.array(latencies) * 1000, [50, 90, 99, 100])
+    lag = np.percentile(np.array(lags) * 1000, [50, 99, 100])
+    print(
+        f"{name:10} latency p50 {latency[0]:7.1f} p90 {latency[1]:7.1f} p99 {latency[2]:7.1f} max {latency[3]:7.1f} ms"
+        f" | loop lag p50 {lag[0]:6.1f} p99 {lag[1]:6.1f} max {lag[2]:6.1f} ms"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rate", type=float, default=50)
+    parser.add_argument("--batches", type=int, default=250)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args()
+
+    batches = make_batches(args.batches)
+    print(
+        f"{args.batches} batches of {BATCH_SIZE} features at {args.rate:g} batches/s, {args.workers} workers"
+    )
+    report("inline", *asyncio.run(run(inline, batches, args.rate)))
+    for name, executor_type in (
+        ("threads", ThreadPoolExecutor),
+        ("processes", ProcessPoolExecutor),
+    ):
+        with executor_type(args.workers) as executor:
+            validator = AsyncValidator(
+                GenericFeature, executor, max_in_flight=args.workers, chunk_size=5
+            )
+            report(
+                name,
+                *asyncio.run(run(validator.validate_batch, batches, args.rate)),
+            )
+
+
+if __name__ == "__main__":
+    main()
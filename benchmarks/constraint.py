@@ -0,0 +1,58 @@
+# Compares native (pydantic-core) and Python enforcement of `MinItems` on `Names.common`, for
+# valid input and for input that fails the constraint.
+#
+#     python benchmarks/constraint.py
+
+from overture_schema_pydantic.constraint import MinItems, NoAdditionalProperties
+from overture_schema_pydantic.language import LanguageTag
+from overture_schema_pydantic.names import Names
+
+import timeit
+from typing import Annotated, Any, Dict, Optional
+
+from pydantic import BaseModel, ValidationError
+from pydantic_core import core_schema
+
+
+NUMBER = 50_000
+
+
+class PythonMinItems(MinItems):
+    # The previous implementation: always an after-validator calling back into Python.
+    def __get_pydantic_core_schema__(self, source, handler):
+        return core_schema.with_info_after_validator_function(
+            self.validate, handler(source)
+        )
+
+
+class PythonNames(BaseModel):
+    primary: str
+    common: Optional[
+        Annotated[Dict[LanguageTag, str], PythonMinItems(1), NoAdditionalProperties()]
+    ] = None
+
+
+INPUTS = {
+    "valid": {"primary": "foo", "common": {"en": "foo", "fr": "feu"}},
+    "invalid": {"primary": "foo", "common": {}},
+}
+
+
+def validate(model: type[BaseModel], data: dict[str, Any]):
+    try:
+        model.model_validate(data)
+    except ValidationError:
+        pass
+
+
+def main():
+    for input_name, data in INPUTS.items():
+        for name, model in (("python", PythonNames), ("native", Names)):
+            seconds = min(
+                timeit.repeat(lambda: validate(model, data), number=NUMBER, repeat=5)
+            )
+            print(f"{input_name:8} {name:7} {NUMBER / seconds:12,.0f} validations/s")
+
+
+if __name__ == "__main__":
+    main()
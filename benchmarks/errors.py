@@ -0,0 +1,58 @@
+# Measures error reporting on a broken feed in which every row has two errors: formatting every
+# error into `validate_table`'s table, collecting structured records without messages, and
+# collecting with a cap, so that only counts are kept past the first thousand errors.
+#
+#     python benchmarks/errors.py
+
+from overture_schema_pydantic.batch import collect_table_errors, validate_table
+from overture_schema_pydantic.divisions import Division
+from overture_schema_pydantic.errors import ErrorCollector
+
+import timeit
+
+import pyarrow as pa
+import shapely
+
+
+COUNT = 200_000
+
+
+def make_table() -> pa.Table:
+    line_string = shapely.to_wkb(shapely.LineString([(0, 0), (1, 1)]))
+    return pa.table(
+        {
+            "id": pa.array([""] * COUNT),
+            "geometry": pa.array([line_string] * COUNT),
+            "type": pa.array(["division"] * COUNT),
+            "sources": pa.array(
+                [[{"property": "", "dataset": "foo"}]] * COUNT,
+                pa.list_(
+                    pa.struct([("property", pa.string()), ("dataset", pa.string())])
+                ),
+            ),
+        }
+    )
+
+
+def collect(table: pa.Table, max_errors=None) -> ErrorCollector:
+    errors = ErrorCollector(max_errors)
+    collect_table_errors(Division, table, errors)
+    return errors
+
+
+def main():
+    table = make_table()
+    for name, func in (
+        ("validate_table (messages)", lambda: validate_table(Division, table)),
+        ("collect + to_table", lambda: collect(table).to_table()),
+        ("collect, max 1000 + to_table", lambda: collect(table, 1000).to_table()),
+        ("collect, max 1000 + summary", lambda: collect(table, 1000).summary()),
+    ):
+        seconds = min(timeit.repeat(func, number=1, repeat=3))
+        print(f"{name:30} {2 * COUNT / seconds:14,.0f} errors/s")
+    for row in collect(table, 1000).summary().to_pylist():
+        print(f"{row['count']:>10,}  {row['code']:32} {row['path']}")
+
+
+if __name__ == "__main__":
+    main()
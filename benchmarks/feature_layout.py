@@ -0,0 +1,80 @@
+# Compares validating GeoJSON Feature lines in place, through the `properties` alias paths, with
+# the previous approach of flattening each parsed Feature into the model's layout first. Also times
+# dumping back to each layout.
+#
+#     python benchmarks/feature_layout.py
+
+from overture_schema_pydantic.divisions import Division
+from overture_schema_pydantic.geometry import parse_json_with_raw_geometry
+
+import json
+import timeit
+
+
+COUNT = 10_000
+
+
+def division(i: int) -> dict:
+    return {
+        "type": "Feature",
+        "id": f"division-{i}",
+        "geometry": {"type": "Point", "coordinates": [i % 180, i % 90]},
+        "properties": {
+            "type": "division",
+            "sources": [{"property": "", "dataset": "foo", "record_id": str(i)}],
+            "names": {"primary": f"name {i}", "common": {"en": "name", "fr": "nom"}},
+        },
+    }
+
+
+def flatten(value: dict) -> dict:
+    # What `validate_stream` used to do to every record.
+    flat = dict(value.get("properties") or {})
+    for name in ("id", "geometry"):
+        if name in value:
+            flat[name] = value[name]
+    return flat
+
+
+def report(label: str, funcs: dict):
+    results = {
+        name: min(timeit.repeat(func, number=1, repeat=5)) / COUNT
+        for name, func in funcs.items()
+    }
+    baseline = next(iter(results.values()))
+    print(
+        label
+        + "".join(
+            f" | {name} {1 / seconds:10,.0f}/s ({baseline / seconds:.2f}x)"
+            for name, seconds in results.items()
+        )
+    )
+
+
+def main():
+    lines = [json.dumps(division(i)).encode() for i in range(COUNT)]
+    features = [Division.model_validate_json(line) for line in lines]
+
+    report(
+        "validate",
+        {
+            "flatten": lambda: [
+                Division.model_validate(flatten(parse_json_with_raw_geometry(line)))
+                for line in lines
+            ],
+            "in place": lambda: [Division.model_validate_json(line) for line in lines],
+        },
+    )
+    report(
+        "dump    ",
+        {
+            "flat": lambda: Division.dump_many(features, mode="json"),
+            "geo_json": lambda: Division.dump_many(
+                features, mode="json", layout="geo_json"
+            ),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
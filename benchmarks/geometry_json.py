@@ -0,0 +1,134 @@
+# Compares Feature.model_validate_json, which splits the raw geometry JSON text out of large
+# features before validating, against pydantic's standard JSON path, for eager and lazy geometry,
+# from a single point up to large MultiPolygons. "raw (forced)" splits every feature, whatever its
+# size. Also compares geometry construction from GeoJSON: shapely's `shape()`, GEOS' GeoJSON
+# reader, and `Geometry.from_geo_json_text`.
+#
+#     python benchmarks/geometry_json.py
+
+from overture_schema_pydantic import geometry as geometry_module
+from overture_schema_pydantic.feature import Feature
+from overture_schema_pydantic.geometry import Geometry
+
+import json
+import timeit
+
+import shapely
+from pydantic import BaseModel
+from pydantic_core import from_json
+from shapely.geometry import mapping, shape
+
+
+class GenericFeature(Feature):
+    pass
+
+
+def multi_polygon(num_parts: int, vertices_per_part: int) -> shapely.MultiPolygon:
+    return shapely.MultiPolygon(
+        [
+            shapely.Point(i * 3, 0).buffer(1, quad_segs=vertices_per_part // 4)
+            for i in range(num_parts)
+        ]
+    )
+
+
+def feature_json(geometry) -> bytes:
+    return json.dumps(
+        {
+            "id": "foo",
+            "type": "foo",
+            "geometry": mapping(geometry),
+            "sources": [{"property": "", "dataset": "foo"}],
+        }
+    ).encode()
+
+
+def report(label: str, funcs: dict, number: int):
+    results = {
+        name: min(timeit.repeat(func, number=number, repeat=3)) / number
+        for name, func in funcs.items()
+    }
+    baseline = next(iter(results.values()))
+    print(
+        label
+        + "".join(
+            f" | {name} {1 / seconds:8,.1f}/s ({baseline / seconds:.2f}x)"
+            for name, seconds in results.items()
+        )
+    )
+
+
+def forced_raw(data: bytes, context=None) -> Feature:
+    # The raw geometry path, even for features below its size thresholds.
+    sizes = (
+        geometry_module._RAW_GEOMETRY_MIN_SIZE,
+        geometry_module._LAZY_RAW_GEOMETRY_MIN_SIZE,
+    )
+    geometry_module._RAW_GEOMETRY_MIN_SIZE = 0
+    geometry_module._LAZY_RAW_GEOMETRY_MIN_SIZE = 0
+    try:
+        return GenericFeature.model_validate_json(data, context=context)
+    finally:
+        (
+            geometry_module._RAW_GEOMETRY_MIN_SIZE,
+            geometry_module._LAZY_RAW_GEOMETRY_MIN_SIZE,
+        ) = sizes
+
+
+def main():
+    standard = BaseModel.model_validate_json.__func__
+    lazy = {"lazy_geometry": True}
+    cases = [("point", shapely.Point(1, 2))]
+    cases += [
+        (
+            f"{num_parts} parts x {vertices_per_part} vertices",
+            multi_polygon(num_parts, vertices_per_part),
+        )
+        for num_parts, vertices_per_part in (
+            (1, 16),
+            (1, 100),
+            (1, 400),
+            (10, 1_000),
+            (100, 1_000),
+        )
+    ]
+    for name, geometry in cases:
+        geometry_text = json.dumps(mapping(geometry))
+        data = feature_json(geometry)
+        number = min(max(1, 2_000_000 // len(data)), 20_000)
+        label = f"{name:26} ({len(data) / 1024:8,.1f} KiB)"
+        report(
+            label + " geometry",
+            {
+                "shape(json)": lambda: shape(from_json(geometry_text)),
+                "from_geojson": lambda: shapely.from_geojson(geometry_text),
+                "from_geo_json_text": lambda: Geometry.from_geo_json_text(
+                    geometry_text
+                ),
+            },
+            number,
+        )
+        report(
+            label + " feature",
+            {
+                "standard": lambda: standard(GenericFeature, data),
+                "model_validate_json": lambda: GenericFeature.model_validate_json(data),
+                "raw (forced)": lambda: forced_raw(data),
+            },
+            number,
+        )
+        report(
+            label + " lazy",
+            {
+                "standard": lambda: standard(GenericFeature, data, context=lazy),
+                "model_validate_json": lambda: GenericFeature.model_validate_json(
+                    data, context=lazy
+                ),
+                "raw (forced)": lambda: forced_raw(data, lazy),
+            },
+            number,
+        )
+
+
+if __name__ == "__main__":
+    main()
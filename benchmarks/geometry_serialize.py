@@ -0,0 +1,67 @@
+# Compares per-feature `model_dump` with `Feature.dump_many` for each geometry format.
+#
+#     python benchmarks/geometry_serialize.py
+
+from overture_schema_pydantic.feature import Feature
+from overture_schema_pydantic.geometry import GEOMETRY_FORMATS
+
+import timeit
+
+import shapely
+from shapely.geometry import mapping
+
+
+NUMBER = 5
+
+COUNT = 1_000
+
+
+class DummyFeature(Feature):
+    pass
+
+
+GEOMETRIES = {
+    "Point": shapely.Point(1, 2),
+    "Polygon": shapely.Point(0, 0).buffer(1, quad_segs=64),
+}
+
+
+def make_features(geom) -> list[DummyFeature]:
+    data = {
+        "id": "foo",
+        "type": "bar",
+        "geometry": mapping(geom),
+        "sources": [{"property": "", "dataset": "foo"}],
+    }
+    return [DummyFeature.model_validate(data) for _ in range(COUNT)]
+
+
+def main():
+    for geometry_name, geom in GEOMETRIES.items():
+        features = make_features(geom)
+        for geometry_format in GEOMETRY_FORMATS:
+            for mode in ("python", "json"):
+                context = {"geometry_format": geometry_format}
+                one_by_one = min(
+                    timeit.repeat(
+                        lambda: [
+                            f.model_dump(mode=mode, context=context) for f in features
+                        ],
+                        number=NUMBER,
+                        repeat=3,
+                    )
+                )
+                many = min(
+                    timeit.repeat(
+                        lambda: DummyFeature.dump_many(features, geometry_format, mode),
+                        number=NUMBER,
+                        repeat=3,
+                    )
+                )
+                print(
+                    f"{geometry_name:8} {geometry_format:15} {mode:6} model_dump {NUMBER * COUNT / one_by_one:10,.0f} features/s   dump_many {NUMBER * COUNT / many:10,.0f} features/s"
+                )
+
+
+if __name__ == "__main__":
+    main()
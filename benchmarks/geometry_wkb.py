@@ -0,0 +1,47 @@
+# Compares validating WKB geometry directly against the old round trip through a GeoJSON dict.
+#
+#     python benchmarks/geometry_wkb.py
+
+from overture_schema_pydantic.divisions import Division
+
+import timeit
+
+import shapely
+from shapely.geometry import mapping
+
+
+NUMBER = 20_000
+
+SOURCES = [{"property": "", "dataset": "foo"}]
+
+WKB = shapely.to_wkb(shapely.Point(1, 2))
+
+
+def via_geo_json():
+    return Division(
+        id="foo",
+        type="division",
+        sources=SOURCES,
+        geometry=mapping(shapely.from_wkb(WKB)),
+    )
+
+
+def via_wkb():
+    return Division(id="foo", type="division", sources=SOURCES, geometry=WKB)
+
+
+def main():
+    results = {}
+    for name, func in (
+        ("wkb -> geojson -> Geometry", via_geo_json),
+        ("wkb -> Geometry", via_wkb),
+    ):
+        seconds = min(timeit.repeat(func, number=NUMBER, repeat=5))
+        results[name] = seconds
+        print(f"{name:30} {NUMBER / seconds:12,.0f} features/s")
+    baseline, direct = results.values()
+    print(f"speedup: {baseline / direct:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# Measures the cold import time of the modules used for validation with `python -X importtime`,
+# and exits with status 1 if any of them takes longer than its budget, so that it can be run in CI
+# to catch startup regressions. Each module is imported in a fresh interpreter several times and
+# the fastest run counts. The packages that take longest to load are listed for each module.
+#
+#     python benchmarks/import_time.py [--budget-scale FACTOR]
+
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+
+SRC = Path(__file__).parent.parent / "src"
+
+REPEAT = 5
+
+TOP = 5
+
+# Cumulative import time budgets, in milliseconds, with headroom over what the modules took when
+# the budgets were set. Most of each is NumPy, Shapely and pydantic.
+BUDGETS_MS = {
+    "overture_schema_pydantic.divisions": 350,
+    "overture_schema_pydantic.registry": 350,
+    "overture_schema_pydantic.stream": 350,
+    "overture_schema_pydantic.batch": 450,
+}
+
+
+def import_times(module: str) -> tuple[int, dict[str, int]]:
+    # The cumulative time, in microseconds, to import `module` in a fresh interpreter, and the
+    # time spent in each top-level package that it loads.
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    packages: dict[str, int] = {}
+    for line in result.stderr.splitlines()[1:]:
+        self_us, cumulative_us, name = line.partition("import time:")[2].split("|")
+        # Modules are listed after those they import, indented by nesting depth, so everything
+        # listed between the previous unindented module and `module` is loaded by `module`.
+        if not name.startswith("  "):
+            if name.strip() == module:
+                return int(cumulative_us), packages
+            packages = {}
+            continue
+        package = name.strip().split(".")[0]
+        packages[package] = packages.get(package, 0) + int(self_us)
+    raise ValueError(f"{module} isn't in the output of `python -X importtime`")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--budget-scale",
+        type=float,
+        default=1.0,
+        help="multiply every budget by this factor (e.g. for slower machines)",
+    )
+    args = parser.parse_args()
+
+    failed = False
+    for module, budget in BUDGETS_MS.items():
+        total, packages = min(import_times(module) for _ in range(REPEAT))
+        ms = total / 1000
+        budget *= args.budget_scale
+        status = "ok" if ms <= budget else "OVER BUDGET"
+        failed = failed or ms > budget
+        print(f"{module:40} {ms:8.1f} ms (budget {budget:.0f} ms) {status}")
+        for name, us in sorted(packages.items(), key=lambda item: -item[1])[:TOP]:
+            print(f"    {name:36} {us / 1000:8.1f} ms")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+# Measures the cost of validator instrumentation: validating divisions without instrumentation,
+# which is what every validation pays for the hooks, and with it.
+#
+#     python benchmarks/instrumentation.py
+
+from overture_schema_pydantic.divisions import Division
+from overture_schema_pydantic.instrumentation import Instrumentation
+
+import timeit
+
+
+NUMBER = 50_000
+
+VALUE = {
+    "type": "Feature",
+    "id": "foo",
+    "geometry": {"type": "Point", "coordinates": [1, 2]},
+    "properties": {
+        "type": "division",
+        "sources": [{"property": "", "dataset": "foo"}],
+    },
+}
+
+
+def main():
+    instrumentation = Instrumentation()
+    results = {}
+    for name, context in (
+        ("disabled", None),
+        ("enabled", {"instrumentation": instrumentation}),
+    ):
+        seconds = min(
+            timeit.repeat(
+                lambda: Division.model_validate(VALUE, context=context),
+                number=NUMBER,
+                repeat=5,
+            )
+        )
+        results[name] = seconds
+        baseline = results["disabled"]
+        print(
+            f"{name:10} {NUMBER / seconds:10,.0f} features/s ({seconds / baseline:.2f}x time)"
+        )
+    print(instrumentation.to_prometheus(), end="")
+
+
+if __name__ == "__main__":
+    main()
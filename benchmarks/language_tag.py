@@ -0,0 +1,111 @@
+# Measures language tag validation on a synthetic multilingual names dataset: how often tags hit
+# the `COMMON_LANGUAGE_TAGS` lookup table, and the validation throughput and memory retained by
+# the validated `Names.common` keys with `LanguageTag` (regex alone) and `InternedLanguageTag`
+# (table, then regex).
+#
+#     python benchmarks/language_tag.py
+
+from overture_schema_pydantic.batch import validate_table
+from overture_schema_pydantic.constraint import MinItems
+from overture_schema_pydantic.language import (
+    COMMON_LANGUAGE_TAGS,
+    InternedLanguageTag,
+)
+from overture_schema_pydantic.names import Names
+
+import json
+import timeit
+import tracemalloc
+from typing import Annotated, Dict, Optional
+
+import numpy as np
+import pyarrow as pa
+from pydantic import BaseModel
+
+
+COUNT = 20_000
+
+# Valid tags that aren't in the table, standing in for the long tail of real data.
+RARE_TAGS = [
+    "en-GB-oxendict",
+    "yue-Hant",
+    "nan-Latn-pehoeji",
+    "sr-Latn-RS",
+    "de-1901",
+    "zh-Hant-TW",
+    "hak-Latn",
+    "ja-Latn-hepburn",
+    "pt-Latn-BR",
+    "ko-KP",
+]
+
+
+class InternedNames(BaseModel):
+    # `Names`, with interned language tags.
+    primary: str
+    common: Optional[Annotated[Dict[InternedLanguageTag, str], MinItems(1)]] = None
+
+
+def make_names(rng: np.random.Generator) -> list[str]:
+    # Names as JSON lines, so that every record's keys are distinct `str` objects once parsed,
+    # like records read from a file. Tag popularity follows a Zipf distribution.
+    tags = list(COMMON_LANGUAGE_TAGS) + RARE_TAGS
+    rng.shuffle(tags)
+    weights = 1 / np.arange(1, len(tags) + 1)
+    weights /= weights.sum()
+    lines = []
+    for _ in range(COUNT):
+        size = rng.integers(1, 12)
+        common = {t: "name" for t in rng.choice(tags, size, replace=False, p=weights)}
+        lines.append(json.dumps({"primary": "name", "common": common}))
+    return lines
+
+
+def retained_bytes(model: type[BaseModel], lines: list[str]) -> float:
+    # Each line is parsed with `json.loads` and then dropped, so only what validation keeps is
+    # retained, as when reading records from a file.
+    tracemalloc.start()
+    validated = [model.model_validate(json.loads(line)) for line in lines]
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del validated
+    return size / len(lines)
+
+
+def main():
+    lines = make_names(np.random.default_rng(0))
+    records = [json.loads(line) for line in lines]
+
+    table = set(COMMON_LANGUAGE_TAGS)
+    keys = [k for r in records for k in r["common"]]
+    hits = sum(k in table for k in keys)
+    print(
+        f"{len(keys):,} tags, {len(set(keys))} distinct: {hits / len(keys):.1%} table hits"
+    )
+
+    for name, model in (("regex", Names), ("table", InternedNames)):
+        seconds = min(
+            timeit.repeat(
+                lambda: [model.model_validate(r) for r in records], number=1, repeat=5
+            )
+        )
+        print(
+            f"{name:6} {len(keys) / seconds:12,.0f} tags/s {retained_bytes(model, lines):8,.0f} retained bytes/record"
+        )
+
+    names_type = pa.struct(
+        [("primary", pa.string()), ("common", pa.map_(pa.string(), pa.string()))]
+    )
+    arrow = pa.table({"names": pa.array(records, names_type)})
+    seconds = min(
+        timeit.repeat(lambda: validate_table(_Wrapper, arrow), number=1, repeat=5)
+    )
+    print(f"arrow  {len(keys) / seconds:12,.0f} tags/s (validate_table)")
+
+
+class _Wrapper(BaseModel):
+    names: Names
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+# Compares finding the `@scoped` values that apply at positions along a geometry with
+# `LinearReferenceIndex` against a linear scan of every value for each position, for thousands of
+# scoped rules with random ranges, points and headings, as in a long road with many speed limits,
+# or with ranges nested inside each other.
+#
+#     python benchmarks/linear_reference.py [--rules N] [--positions N] [--layout random|nested]
+
+from overture_schema_pydantic.linear_reference import LinearReferenceIndex
+from overture_schema_pydantic.scoping import Heading, Scope, scoped
+
+import argparse
+import random
+import time
+
+import numpy as np
+from pydantic import BaseModel
+
+
+@scoped([Scope.GEOMETRIC_POINT, Scope.GEOMETRIC_RANGE, Scope.HEADING])
+class Rule(BaseModel):
+    value: int
+
+
+def make_rules(count: int, layout: str) -> list[Rule]:
+    rng = random.Random(0)
+    if layout == "nested":
+        # Each range inside the one before, as in rules for ever shorter stretches of a road.
+        return [
+            Rule(
+                value=i,
+                between=[i / (3 * count), 1 - i / (3 * count)],
+                when=(
+                    {"heading": rng.choice(list(Heading))}
+                    if rng.random() < 0.3
+                    else None
+                ),
+            )
+            for i in range(count)
+        ]
+    rules = []
+    for i in range(count):
+        when = {"heading": rng.choice(list(Heading))} if rng.random() < 0.3 else None
+        if rng.random() < 0.2:
+            rules.append(Rule(value=i, at=round(rng.random(), 4), when=when))
+        else:
+            start = rng.random()
+            end = min(start + rng.expovariate(count / 4), 1)
+            rules.append(Rule(value=i, between=[start, end], when=when))
+    return rules
+
+
+def scan(
+    rules: list[Rule], positions: np.ndarray, heading: Heading
+) -> list[list[Rule]]:
+    result = []
+    for position in positions.tolist():
+        found = []
+        for rule in rules:
+            if rule.when is not None and rule.when.heading not in (None, heading):
+                continue
+            if rule.between is not None:
+                if rule.between[0] <= position <= rule.between[1]:
+                    found.append(rule)
+            elif rule.at is not None and rule.at == position:
+                found.append(rule)
+        result.append(found)
+    return result
+
+
+def timed(func, *args):
+    start = time.perf_counter()
+    result = func(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rules", type=int, default=5_000)
+    parser.add_argument("--positions", type=int, default=100_000)
+    parser.add_argument("--layout", choices=("random", "nested"), default="random")
+    args = parser.parse_args()
+
+    rules = make_rules(args.rules, args.layout)
+    rng = np.random.default_rng(0)
+    positions = rng.random(args.positions)
+    # Some positions land exactly on points.
+    positions[::10] = np.round(positions[::10], 4)
+    starts = rng.random(args.positions)
+    ends = np.minimum(starts + 0.01, 1)
+
+    # The index builds its slots for a heading on the first query in that heading.
+    _, build = timed(lambda: LinearReferenceIndex(rules).at([0], Heading.FORWARD))
+    index = LinearReferenceIndex(rules)
+    index.at([0], Heading.FORWARD)
+    found, query = timed(index.at, positions, Heading.FORWARD)
+    _, indices = timed(index.at_indices, positions, Heading.FORWARD)
+    _, ranges = timed(index.between_indices, starts, ends, Heading.FORWARD)
+
+    # The scan is too slow for every position; time a sample and scale it.
+    sample = max(args.positions // 100, 1)
+    scanned, scan_seconds = timed(scan, rules, positions[:sample], Heading.FORWARD)
+    scan_seconds *= args.positions / sample
+    assert scanned == found[:sample]
+
+    print(f"{args.rules} {args.layout} rules, {args.positions} positions")
+    print(f"{'build index':24} {build * 1000:10.1f} ms")
+    print(f"{'at (models)':24} {query * 1000:10.1f} ms")
+    print(f"{'at_indices':24} {indices * 1000:10.1f} ms")
+    print(f"{'between_indices':24} {ranges * 1000:10.1f} ms")
+    print(f"{'linear scan (estimated)':24} {scan_seconds * 1000:10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+# Reports the memory retained per validated feature, for each feature type, with eager and lazy
+# geometry. Resident set size includes GEOS allocations but is only available on Linux; the
+# Python heap figure (from tracemalloc) is available everywhere.
+#
+#     python benchmarks/memory.py
+
+from overture_schema_pydantic.divisions import Division
+
+import gc
+import os
+import tracemalloc
+from typing import Any, Optional
+
+from shapely.geometry import mapping
+import shapely
+
+
+COUNT = 100_000
+
+# Sample input for each feature type.
+FEATURE_TYPES = {
+    Division: {
+        "id": "085f4f4bffffffff01a4c1e7dc0b7b2f",
+        "type": "division",
+        "geometry": mapping(shapely.Point(-122.33, 47.61)),
+        "sources": [{"property": "", "dataset": "OpenStreetMap", "record_id": "n1"}],
+        "names": {"primary": "Seattle", "common": {"en": "Seattle"}},
+    },
+}
+
+
+def resident_bytes() -> Optional[int]:
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return None
+
+
+def measure(model: type, data: dict[str, Any], context: Optional[dict]) -> tuple:
+    gc.collect()
+    rss_before = resident_bytes()
+    tracemalloc.start()
+    features = [model.model_validate(data, context=context) for _ in range(COUNT)]
+    heap, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    gc.collect()
+    rss_after = resident_bytes()
+    rss = (rss_after - rss_before) / COUNT if rss_before is not None else None
+    del features
+    return heap / COUNT, rss
+
+
+def main():
+    for model, data in FEATURE_TYPES.items():
+        for mode, context in (("eager", None), ("lazy", {"lazy_geometry": True})):
+            heap, rss = measure(model, data, context)
+            rss = f"{rss:10,.0f}" if rss is not None else "       n/a"
+            print(
+                f"{model.__name__:12} {mode:5} {heap:10,.0f} heap bytes/feature {rss} resident bytes/feature"
+            )
+
+
+if __name__ == "__main__":
+    main()
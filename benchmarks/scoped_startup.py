@@ -0,0 +1,77 @@
+# Measures the time and memory it takes to define many `@scoped` property types, as a schema does
+# at import time, with the scoped field and `When` model factories memoized and with their caches
+# cleared before every class (as when each class built its own `When` models). The types cycle
+# through a few common scope combinations.
+#
+#     python benchmarks/scoped_startup.py [--types N]
+
+from overture_schema_pydantic import scoping
+from overture_schema_pydantic.scoping import Scope, scoped
+
+import argparse
+import gc
+import time
+import tracemalloc
+
+from pydantic import BaseModel, create_model
+
+
+COMBINATIONS = [
+    ([Scope.GEOMETRIC_RANGE, Scope.HEADING], None),
+    ([Scope.GEOMETRIC_POINT, Scope.GEOMETRIC_RANGE, Scope.HEADING], None),
+    ([Scope.GEOMETRIC_RANGE, Scope.HEADING], Scope.HEADING),
+    ([Scope.HEADING], None),
+    ([Scope.GEOMETRIC_POINT, Scope.HEADING], None),
+]
+
+
+def clear_caches():
+    scoping._make_scoped_fields.cache_clear()
+    scoping._make_when_field.cache_clear()
+
+
+def define(count: int, cached: bool) -> list[type[BaseModel]]:
+    models = []
+    for i in range(count):
+        if not cached:
+            clear_caches()
+        allowed, required = COMBINATIONS[i % len(COMBINATIONS)]
+        base = create_model(f"Property{i}", value=(int, ...))
+        models.append(scoped(allowed, required)(base))
+    return models
+
+
+def measure(count: int, cached: bool) -> tuple[float, int, int]:
+    clear_caches()
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    models = define(count, cached)
+    seconds = time.perf_counter() - start
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    whens = {
+        model.model_fields["when"].annotation
+        for model in models
+        if "when" in model.model_fields
+    }
+    return seconds, retained, len(whens)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--types", type=int, default=200)
+    args = parser.parse_args()
+
+    print(f"{args.types} scoped types over {len(COMBINATIONS)} scope combinations")
+    for name, cached in (("uncached", False), ("memoized", True)):
+        seconds, retained, whens = measure(args.types, cached)
+        print(
+            f"{name:10} {seconds * 1000:8.1f} ms {retained / 2**20:8.1f} MiB retained"
+            f" {whens:5} distinct `when` types"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+# Compares the `@scoped` "at least one of" check on `when`, which only looks at the set of fields
+# given, with an equivalent check that dumps every validated `when` (as the original
+# implementation did) and with no check at all, on a list of thousands of scoped rules. Only
+# `heading` is a `when` field so far, so the benchmark builds its `When` models with a second,
+# stand-in field.
+#
+#     python benchmarks/scoping.py
+
+from overture_schema_pydantic.scoping import Heading, _make_when
+
+import timeit
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict, create_model, model_validator
+
+
+RULES = 5_000
+
+NUMBER = 20
+
+WHEN_FIELDS = {"heading": (Heading, None), "label": (str, None)}
+
+
+def when_model(check) -> type[BaseModel]:
+    validators = (
+        {} if check is None else {"check": model_validator(mode="after")(check)}
+    )
+    return create_model(
+        "When",
+        **WHEN_FIELDS,
+        __config__=ConfigDict(extra="forbid"),
+        __validators__=validators,
+    )
+
+
+def dump_check(model):
+    if not any(v is not None for v in model.model_dump().values()):
+        raise ValueError("at least one of `heading`, `label` must be set")
+    return model
+
+
+def rule_model(when: type[BaseModel]) -> type[BaseModel]:
+    return create_model(
+        "Rule",
+        value=(int, ...),
+        between=(Optional[list[float]], None),
+        when=(Optional[when], None),
+    )
+
+
+def rules_model(rule: type[BaseModel]) -> type[BaseModel]:
+    return create_model("Rules", rules=(list[rule], ...))
+
+
+def main():
+    values = {
+        "rules": [
+            {
+                "value": i,
+                "when": ({"heading": "forward"} if i % 3 == 0 else {"label": "foo"}),
+            }
+            for i in range(RULES)
+        ]
+    }
+    results = {}
+    for name, model in (
+        ("no check", rules_model(rule_model(when_model(None)))),
+        ("model_dump check", rules_model(rule_model(when_model(dump_check)))),
+        (
+            "fields-set check (@scoped)",
+            rules_model(rule_model(_make_when(WHEN_FIELDS, require_at_least_one=True))),
+        ),
+    ):
+        seconds = min(
+            timeit.repeat(lambda: model.model_validate(values), number=NUMBER, repeat=5)
+        )
+        results[name] = seconds
+        baseline = results["no check"]
+        print(
+            f"{name:28} {RULES * NUMBER / seconds:12,.0f} rules/s ({seconds / baseline:.2f}x time)"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+# Measures validation throughput for each feature type, geometry size and property set in
+# benchmarks/synthetic.py, from dict, JSON bytes and Arrow input. For each case it reports
+# features per second and input bytes per feature: the size of the JSON encoding for dict and
+# JSON input, and of the Arrow buffers for Arrow input. Results can be written to a JSON file and
+# compared with an earlier one (e.g. from the previous schema release), in which case the run
+# fails if any case got slower than the tolerance allows.
+#
+#     python benchmarks/suite.py [--filter TEXT] [--scale FACTOR] [--output RESULTS.json]
+#                                [--baseline BASELINE.json] [--tolerance FRACTION]
+
+from overture_schema_pydantic.batch import validate_table
+from overture_schema_pydantic.divisions import Division
+from overture_schema_pydantic.feature import Feature
+
+import argparse
+import datetime
+import importlib.metadata
+import json
+import platform
+import subprocess
+import sys
+import timeit
+from pathlib import Path
+from typing import Any, Callable
+
+from synthetic import features, table, vertices, GEOMETRIES, PROPERTIES
+
+
+class GenericFeature(Feature):
+    pass
+
+
+# Feature types and the geometries each is benchmarked with. Divisions can only be points.
+MODELS = {
+    "Division": (Division, "division", ("point",)),
+    "Feature": (GenericFeature, "place", tuple(GEOMETRIES)),
+}
+
+INPUTS = ("dict", "json", "arrow")
+
+REPEAT = 3
+
+# Roughly how many vertices each case validates per repetition, which sets its feature count.
+VERTICES_PER_CASE = 1_000_000
+
+MAX_FEATURES_PER_CASE = 2_000
+
+MIN_FEATURES_PER_CASE = 10
+
+DISTRIBUTIONS = (
+    "overture-schema-pydantic",
+    "pydantic",
+    "pydantic-core",
+    "shapely",
+    "numpy",
+    "pyarrow",
+)
+
+
+def inputs(model: type[Feature], values: list[dict[str, Any]]) -> dict[str, tuple]:
+    # For each input kind, a function validating every feature and the input bytes per feature.
+    lines = [json.dumps(v).encode() for v in values]
+    json_bytes = sum(map(len, lines)) / len(values)
+    arrow = table(values)
+    return {
+        "dict": (lambda: [model.model_validate(v) for v in values], json_bytes),
+        "json": (
+            lambda: [model.model_validate_json(line) for line in lines],
+            json_bytes,
+        ),
+        "arrow": (lambda: validate_table(model, arrow), arrow.nbytes / len(values)),
+    }
+
+
+def measure(func: Callable[[], Any], count: int) -> float:
+    return count / min(timeit.repeat(func, number=1, repeat=REPEAT))
+
+
+def run(pattern: str, scale: float) -> list[dict[str, Any]]:
+    results = []
+    for model_name, (model, feature_type, geometries) in MODELS.items():
+        for geometry in geometries:
+            count = max(
+                MIN_FEATURES_PER_CASE,
+                round(
+                    scale
+                    * min(
+                        MAX_FEATURES_PER_CASE, VERTICES_PER_CASE // vertices(geometry)
+                    )
+                ),
+            )
+            for properties in PROPERTIES:
+                prefix = f"{model_name}/{geometry}/{properties}"
+                if not any(pattern in f"{prefix}/{kind}" for kind in INPUTS):
+                    continue
+                values = features(feature_type, geometry, properties, count)
+                for kind, (func, bytes_per_feature) in inputs(model, values).items():
+                    case = f"{prefix}/{kind}"
+                    if pattern not in case:
+                        continue
+                    result = {
+                        "case": case,
+                        "model": model_name,
+                        "geometry": geometry,
+                        "vertices": vertices(geometry),
+                        "properties": properties,
+                        "input": kind,
+                        "features": count,
+                        "features_per_second": measure(func, count),
+                        "bytes_per_feature": bytes_per_feature,
+                    }
+                    print(
+                        f"{case:42} {result['features_per_second']:12,.1f} features/s {bytes_per_feature:14,.0f} bytes/feature",
+                        flush=True,
+                    )
+                    results.append(result)
+    return results
+
+
+def environment() -> dict[str, Any]:
+    versions = {}
+    for name in DISTRIBUTIONS:
+        try:
+            versions[name] = importlib.metadata.version(name)
+        except importlib.metadata.PackageNotFoundError:
+            versions[name] = None
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "time": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+        "commit": commit,
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "versions": versions,
+    }
+
+
+def compare(
+    results: list[dict[str, Any]], baseline_path: str, tolerance: float
+) -> bool:
+    # Prints each case's throughput relative to the baseline, and returns whether any case is
+    # slower than the tolerance allows.
+    with open(baseline_path) as f:
+        baseline = {r["case"]: r for r in json.load(f)["results"]}
+    slower = False
+    print(f"\ncompared with {baseline_path}:")
+    for result in results:
+        before = baseline.get(result["case"])
+        if before is None:
+            print(f"{result['case']:42} (not in baseline)")
+            continue
+        ratio = result["features_per_second"] / before["features_per_second"]
+        regressed = ratio < 1 - tolerance
+        slower = slower or regressed
+        print(f"{result['case']:42} {ratio:6.2f}x{'  SLOWER' if regressed else ''}")
+    return slower
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--filter", default="", help="only run cases whose name contains this"
+    )
+    parser.add_argument(
+        "--scale",
+        type=float,
+        default=1.0,
+        help="multiply the number of features in every case by this factor",
+    )
+    parser.add_argument("--output", help="write the results to this JSON file")
+    parser.add_argument(
+        "--baseline", help="compare the results with this earlier JSON file"
+    )
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.1,
+        help="fraction by which a case may be slower than the baseline (default: 0.1)",
+    )
+    args = parser.parse_args()
+
+    results = run(args.filter, args.scale)
+    if args.output is not None:
+        with open(args.output, "w") as f:
+            json.dump({"environment": environment(), "results": results}, f, indent=2)
+            f.write("\n")
+    if args.baseline is not None and compare(results, args.baseline, args.tolerance):
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,161 @@
+# Generates reproducible synthetic features for the benchmarks, as GeoJSON Feature dicts and as
+# Arrow tables in the flat layout with WKB geometry. The same seed always yields the same
+# features. Not a benchmark itself; see benchmarks/suite.py.
+
+from overture_schema_pydantic.language import COMMON_LANGUAGE_TAGS
+
+import math
+from typing import Any
+
+import numpy as np
+import pyarrow as pa
+import shapely
+from shapely.geometry import mapping
+
+
+# Geometry shapes by name, as (geometry type, parts, vertices per part).
+GEOMETRIES = {
+    "point": ("Point", 1, 1),
+    "polygon-100": ("Polygon", 1, 100),
+    "polygon-1k": ("Polygon", 1, 1_000),
+    "multipolygon-10k": ("MultiPolygon", 10, 1_000),
+    "multipolygon-100k": ("MultiPolygon", 10, 10_000),
+}
+
+# Property sets by name, as (languages in `names.common`, number of sources). `None` leaves
+# `names` out altogether.
+PROPERTIES = {
+    "minimal": (None, 1),
+    "rich": (len(COMMON_LANGUAGE_TAGS), 50),
+}
+
+TABLE_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("geometry", pa.binary()),
+        ("type", pa.string()),
+        (
+            "sources",
+            pa.list_(
+                pa.struct(
+                    [
+                        ("property", pa.string()),
+                        ("dataset", pa.string()),
+                        ("record_id", pa.string()),
+                        ("confidence", pa.float64()),
+                    ]
+                )
+            ),
+        ),
+        (
+            "names",
+            pa.struct(
+                [
+                    ("primary", pa.string()),
+                    ("common", pa.map_(pa.string(), pa.string())),
+                ]
+            ),
+        ),
+    ]
+)
+
+
+def vertices(geometry: str) -> int:
+    _, parts, per_part = GEOMETRIES[geometry]
+    return parts * per_part
+
+
+def geometries(geometry: str, count: int, seed: int = 0) -> list[shapely.Geometry]:
+    geometry_type, parts, per_part = GEOMETRIES[geometry]
+    rng = np.random.default_rng(seed)
+    centres = rng.uniform((-170, -80), (170, 80), (count, 2))
+    if geometry_type == "Point":
+        return list(shapely.points(centres))
+    result = []
+    for centre in centres:
+        # Star-shaped rings, so each is simple however many vertices it has. The parts of a
+        # multipolygon are spaced far enough apart not to overlap.
+        polygons = []
+        for part in range(parts):
+            angles = np.linspace(0, 2 * math.pi, per_part, endpoint=False)
+            radii = rng.uniform(0.5, 1, per_part) * 0.1
+            x = centre[0] + 0.25 * part + radii * np.cos(angles)
+            y = centre[1] + radii * np.sin(angles)
+            ring = np.column_stack((np.append(x, x[0]), np.append(y, y[0])))
+            polygons.append(shapely.Polygon(ring))
+        result.append(
+            polygons[0]
+            if geometry_type == "Polygon"
+            else shapely.MultiPolygon(polygons)
+        )
+    return result
+
+
+def features(
+    feature_type: str,
+    geometry: str,
+    properties: str,
+    count: int,
+    seed: int = 0,
+) -> list[dict[str, Any]]:
+    # `count` GeoJSON Feature dicts.
+    languages, sources = PROPERTIES[properties]
+    return [
+        {
+            "type": "Feature",
+            "id": f"{feature_type}-{seed}-{i}",
+            "geometry": mapping(g),
+            "properties": {
+                "type": feature_type,
+                "sources": _sources(i, sources),
+                **({} if languages is None else {"names": _names(i, languages)}),
+            },
+        }
+        for i, g in enumerate(geometries(geometry, count, seed))
+    ]
+
+
+def table(values: list[dict[str, Any]]) -> pa.Table:
+    # The features generated by `features` as an Arrow table in `TABLE_SCHEMA`.
+    rows = []
+    for value in values:
+        properties = value["properties"]
+        names = properties.get("names")
+        rows.append(
+            {
+                "id": value["id"],
+                "geometry": shapely.to_wkb(shapely.geometry.shape(value["geometry"])),
+                "type": properties["type"],
+                "sources": properties["sources"],
+                "names": (
+                    None
+                    if names is None
+                    else {
+                        "primary": names["primary"],
+                        "common": list(names["common"].items()),
+                    }
+                ),
+            }
+        )
+    return pa.Table.from_pylist(rows, TABLE_SCHEMA)
+
+
+def _sources(i: int, count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "property": "" if j == 0 else f"/names/common/{j}",
+            "dataset": "synthetic",
+            "record_id": f"{i}-{j}",
+            "confidence": 0.5,
+        }
+        for j in range(count)
+    ]
+
+
+def _names(i: int, languages: int) -> dict[str, Any]:
+    return {
+        "primary": f"name {i}",
+        "common": {
+            tag: f"name {i} ({tag})" for tag in COMMON_LANGUAGE_TAGS[:languages]
+        },
+    }
@@ -0,0 +1,92 @@
+# Measures how `validate_files` scales with 1 to N worker threads, against worker processes, on
+# an NDJSON file and a Parquet file of synthetic polygon features. Parquet validation is
+# vectorized in Arrow and Shapely, which release the GIL, so it scales with threads on any build;
+# NDJSON validation runs Python-side validators per feature, which only scale with threads on a
+# free-threaded build (e.g. `python3.13t`). Run it on both builds to compare.
+#
+#     python benchmarks/threads.py [--max-workers N] [--count COUNT]
+
+from overture_schema_pydantic.feature import Feature
+from overture_schema_pydantic.parallel import validate_files
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pyarrow.parquet as pq
+
+from synthetic import features, table
+
+
+class GenericFeature(Feature):
+    pass
+
+
+def gil_enabled() -> bool:
+    # `sys._is_gil_enabled` only exists from Python 3.13.
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return True if is_gil_enabled is None else is_gil_enabled()
+
+
+def measure(path: Path, workers: int, executor: str, count: int) -> float:
+    best = float("inf")
+    for _ in range(3):
+        start = time.perf_counter()
+        summary = validate_files(
+            GenericFeature,
+            [str(path)],
+            max_workers=workers,
+            chunk_rows=count // (4 * workers) or 1,
+            chunk_bytes=path.stat().st_size // (4 * workers) + 1,
+            executor=executor,
+        )
+        best = min(best, time.perf_counter() - start)
+        assert summary.records == count and summary.invalid == 0
+    return count / best
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--max-workers", type=int, default=os.cpu_count())
+    parser.add_argument("--count", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(
+        f"Python {sys.version.split()[0]}, GIL {'enabled' if gil_enabled() else 'disabled'}, {os.cpu_count()} CPUs"
+    )
+    values = features("place", "polygon-100", "minimal", args.count)
+    workers = [1]
+    while workers[-1] * 2 <= args.max_workers:
+        workers.append(workers[-1] * 2)
+    if workers[-1] != args.max_workers:
+        workers.append(args.max_workers)
+
+    with tempfile.TemporaryDirectory() as directory:
+        ndjson_path = Path(directory) / "features.geojsonl"
+        with open(ndjson_path, "w") as f:
+            for value in values:
+                f.write(json.dumps(value) + "\n")
+        parquet_path = Path(directory) / "features.parquet"
+        # Small row groups, so the file can be split into as many chunks as there are workers.
+        pq.write_table(
+            table(values), parquet_path, row_group_size=max(1, args.count // 256)
+        )
+
+        for name, path in (("ndjson", ndjson_path), ("parquet", parquet_path)):
+            for executor in ("thread", "process"):
+                baseline = None
+                for n in workers:
+                    rate = measure(path, n, executor, args.count)
+                    baseline = baseline or rate
+                    print(
+                        f"{name:8} {executor:8} {n:3} workers {rate:12,.0f} features/s ({rate / baseline:5.2f}x)",
+                        flush=True,
+                    )
+
+
+if __name__ == "__main__":
+    main()
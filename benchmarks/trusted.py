@@ -0,0 +1,150 @@
+# Compares full validation of a stream of GeoJSON Feature lines, with eager and lazy geometry,
+# against the trusted path, which constructs features without validating them and only fully
+# validates a 1 in 1000 sample. Also compares `validate_table` on the whole table and on a
+# sample. Geometries are polygons of a few hundred vertices.
+#
+#     python benchmarks/trusted.py
+
+from overture_schema_pydantic.batch import validate_table
+from overture_schema_pydantic.feature import Feature
+from overture_schema_pydantic.language import COMMON_LANGUAGE_TAGS
+from overture_schema_pydantic.sampling import Sample
+from overture_schema_pydantic.stream import validate_stream
+
+import json
+import timeit
+
+import pyarrow as pa
+import shapely
+from shapely.geometry import mapping
+
+
+COUNT = 10_000
+
+RATE = 0.001
+
+
+class GenericFeature(Feature):
+    pass
+
+
+TABLE_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("geometry", pa.binary()),
+        ("type", pa.string()),
+        (
+            "sources",
+            pa.list_(
+                pa.struct(
+                    [
+                        ("property", pa.string()),
+                        ("dataset", pa.string()),
+                        ("record_id", pa.string()),
+                    ]
+                )
+            ),
+        ),
+        (
+            "names",
+            pa.struct(
+                [
+                    ("primary", pa.string()),
+                    ("common", pa.map_(pa.string(), pa.string())),
+                ]
+            ),
+        ),
+    ]
+)
+
+
+def feature(i: int) -> dict:
+    polygon = shapely.Point(i % 180, i % 90).buffer(0.01, quad_segs=64)
+    return {
+        "type": "Feature",
+        "id": f"feature-{i}",
+        "geometry": mapping(polygon),
+        "properties": {
+            "type": "place",
+            "sources": [
+                {
+                    "property": "",
+                    "dataset": "foo",
+                    "record_id": str(i),
+                    "update_time": "2025-06-20T16:44:01Z",
+                }
+            ]
+            * 2,
+            "names": {
+                "primary": f"name {i}",
+                "common": {tag: "name" for tag in COMMON_LANGUAGE_TAGS[:10]},
+            },
+        },
+    }
+
+
+def report(label: str, funcs: dict):
+    results = {
+        name: min(timeit.repeat(func, number=1, repeat=3)) / COUNT
+        for name, func in funcs.items()
+    }
+    baseline = next(iter(results.values()))
+    print(
+        label
+        + "".join(
+            f" | {name} {1 / seconds:10,.0f}/s ({baseline / seconds:.2f}x)"
+            for name, seconds in results.items()
+        )
+    )
+
+
+def main():
+    values = [feature(i) for i in range(COUNT)]
+    lines = [json.dumps(v).encode() for v in values]
+    lazy = {"lazy_geometry": True}
+
+    def stream(**kwargs):
+        for _ in validate_stream(GenericFeature, lines, **kwargs):
+            pass
+
+    report(
+        "stream",
+        {
+            "full": stream,
+            "full lazy": lambda: stream(context=lazy),
+            "trusted": lambda: stream(sample=Sample(RATE, seed=0)),
+        },
+    )
+
+    table = pa.Table.from_pylist(
+        [
+            {
+                "id": v["id"],
+                "geometry": shapely.to_wkb(shapely.geometry.shape(v["geometry"])),
+                "type": v["properties"]["type"],
+                "sources": [
+                    {k: s[k] for k in ("property", "dataset", "record_id")}
+                    for s in v["properties"]["sources"]
+                ],
+                "names": {
+                    "primary": v["properties"]["names"]["primary"],
+                    "common": list(v["properties"]["names"]["common"].items()),
+                },
+            }
+            for v in values
+        ],
+        TABLE_SCHEMA,
+    )
+    report(
+        "table ",
+        {
+            "full": lambda: validate_table(GenericFeature, table),
+            "sampled": lambda: validate_table(
+                GenericFeature, table, Sample(RATE, seed=0)
+            ),
+        },
+    )
+
+
+if __name__ == "__main__":
+    main()
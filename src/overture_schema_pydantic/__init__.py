@@ -1,6 +1,108 @@
-def main():
-    print("Hello, world!")
+import json
+import sys
+from typing import Optional
+
+
+def main(argv: Optional[list[str]] = None) -> int:
+    # Imports are deferred to the functions that need them, so that importing a module of this
+    # package for validation loads only what validation needs.
+    import argparse
+
+    parser = argparse.ArgumentParser(prog="overture-schema-pydantic")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    validate_parser = subparsers.add_parser(
+        "validate",
+        help="validate newline-delimited GeoJSON features (GeoJSONSeq or NDJSON)",
+    )
+    validate_parser.add_argument(
+        "--type",
+        dest="feature_type",
+        help="feature type name (e.g. `division`) or `module:Class` (default: any registered feature type, chosen by each record's `type`)",
+    )
+    validate_parser.add_argument(
+        "--sample-rate",
+        type=float,
+        help="trust the input: fully validate only this fraction of the features (e.g. 0.001), and estimate the error rate of the rest",
+    )
+    validate_parser.add_argument(
+        "path",
+        nargs="?",
+        default="-",
+        help="input file, or `-` to read standard input (the default)",
+    )
+
+    schema_parser = subparsers.add_parser(
+        "schema",
+        help="print a JSON Schema bundle for one or more feature types",
+    )
+    schema_parser.add_argument(
+        "--type",
+        dest="feature_types",
+        action="append",
+        help="feature type name (e.g. `division`) or `module:Class`; may be repeated (default: all registered feature types)",
+    )
+    schema_parser.add_argument(
+        "--cache-dir",
+        help="directory in which to cache bundles, keyed by schema fingerprint",
+    )
+
+    args = parser.parse_args(argv)
+
+    if args.command == "schema":
+        return _schema(args.feature_types, args.cache_dir)
+    return _validate(args.feature_type, args.path, args.sample_rate)
+
+
+def _validate(
+    feature_type: Optional[str], path: str, sample_rate: Optional[float]
+) -> int:
+    from overture_schema_pydantic.registry import default_registry
+    from overture_schema_pydantic.sampling import Sample
+    from overture_schema_pydantic.stream import open_lines, validate_stream, StreamStats
+
+    if feature_type is None:
+        model = default_registry()
+    else:
+        model = _load_feature_type(feature_type)
+    try:
+        sample = None if sample_rate is None else Sample(sample_rate)
+    except ValueError as e:
+        raise SystemExit(str(e))
+    stats = StreamStats()
+    with open_lines(path) as lines:
+        for result in validate_stream(model, lines, stats, sample=sample):
+            if not result.valid:
+                print(
+                    json.dumps(
+                        {"line": result.line, "errors": result.errors}, default=str
+                    )
+                )
+    print(stats, file=sys.stderr)
+    if sample is not None:
+        print(sample, file=sys.stderr)
+    return 1 if stats.invalid else 0
+
+
+def _schema(feature_types: Optional[list[str]], cache_dir: Optional[str]) -> int:
+    from overture_schema_pydantic.json_schema import schema_bundle_json
+
+    if feature_types is None:
+        models = None
+    else:
+        models = [_load_feature_type(t) for t in feature_types]
+    print(schema_bundle_json(models, cache_dir))
+    return 0
+
+
+def _load_feature_type(feature_type: str) -> type:
+    from overture_schema_pydantic.registry import load_feature_type
+
+    try:
+        return load_feature_type(feature_type)
+    except ValueError as e:
+        raise SystemExit(str(e))
 
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
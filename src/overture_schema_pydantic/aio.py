@@ -0,0 +1,155 @@
+from overture_schema_pydantic.feature import Feature
+
+import asyncio
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import Any, Optional, Sequence
+
+from pydantic import ValidationError
+
+
+DEFAULT_MAX_IN_FLIGHT = 8
+
+DEFAULT_CHUNK_SIZE = 64
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    # Position of the value in its batch.
+    index: int
+    feature: Optional[Feature] = None
+    errors: Optional[list[dict[str, Any]]] = None
+
+    @property
+    def valid(self) -> bool:
+        return self.errors is None
+
+
+class AsyncValidator:
+    """
+    Validate features from asyncio code without blocking the event loop.
+
+    Validation runs in `executor`, or in the event loop's default executor if it's `None`. With
+    a thread pool, geometry parsing in Shapely runs outside the GIL; a process pool avoids the
+    GIL altogether, at the cost of pickling values and features. `model` is a feature model, or
+    a `FeatureRegistry` to validate several feature types.
+
+    Batches are split into chunks of `chunk_size` values, each validated as one executor task,
+    and at most `max_in_flight` tasks of this validator run at once. Callers beyond that wait
+    their turn, so a fast producer is held back rather than queueing unbounded work. Results
+    come back in the order of the batch.
+    """
+
+    def __init__(
+        self,
+        model: type[Feature],
+        executor: Optional[Executor] = None,
+        max_in_flight: int = DEFAULT_MAX_IN_FLIGHT,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        context: Optional[dict[str, Any]] = None,
+    ):
+        if max_in_flight < 1:
+            raise ValueError(
+                f"max_in_flight must be positive; but it is {repr(max_in_flight)}"
+            )
+        if chunk_size < 1:
+            raise ValueError(
+                f"chunk_size must be positive; but it is {repr(chunk_size)}"
+            )
+        self.__model = model
+        self.__executor = executor
+        self.__max_in_flight = max_in_flight
+        self.__chunk_size = chunk_size
+        self.__context = context
+        self.__semaphore = asyncio.Semaphore(max_in_flight)
+        self.__in_flight = 0
+
+    @property
+    def max_in_flight(self) -> int:
+        return self.__max_in_flight
+
+    @property
+    def in_flight(self) -> int:
+        # Executor tasks of this validator currently running.
+        return self.__in_flight
+
+    async def validate(self, value: Any) -> Feature:
+        # Like `model.model_validate`, raising `ValidationError` if `value` is invalid.
+        return await self.__run(
+            _validate_one, self.__model, value, self.__context, False
+        )
+
+    async def validate_json(self, json_data: str | bytes | bytearray) -> Feature:
+        # Like `model.model_validate_json`.
+        return await self.__run(
+            _validate_one, self.__model, json_data, self.__context, True
+        )
+
+    async def validate_batch(self, values: Sequence[Any]) -> list[BatchResult]:
+        return await self.__validate_batch(values, json_input=False)
+
+    async def validate_json_batch(
+        self, values: Sequence[str | bytes | bytearray]
+    ) -> list[BatchResult]:
+        return await self.__validate_batch(values, json_input=True)
+
+    async def __validate_batch(
+        self, values: Sequence[Any], json_input: bool
+    ) -> list[BatchResult]:
+        size = self.__chunk_size
+        chunks = await asyncio.gather(
+            *(
+                self.__run(
+                    _validate_chunk,
+                    self.__model,
+                    start,
+                    values[start : start + size],
+                    self.__context,
+                    json_input,
+                )
+                for start in range(0, len(values), size)
+            )
+        )
+        return [result for chunk in chunks for result in chunk]
+
+    async def __run(self, func, *args) -> Any:
+        async with self.__semaphore:
+            self.__in_flight += 1
+            try:
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(self.__executor, func, *args)
+            finally:
+                self.__in_flight -= 1
+
+
+def _validate_one(
+    model: type[Feature],
+    value: Any,
+    context: Optional[dict[str, Any]],
+    json_input: bool,
+) -> Feature:
+    if json_input:
+        return model.model_validate_json(value, context=context)
+    return model.model_validate(value, context=context)
+
+
+def _validate_chunk(
+    model: type[Feature],
+    start: int,
+    values: Sequence[Any],
+    context: Optional[dict[str, Any]],
+    json_input: bool,
+) -> list[BatchResult]:
+    results = []
+    for index, value in enumerate(values, start):
+        try:
+            feature = _validate_one(model, value, context, json_input)
+        except ValidationError as e:
+            results.append(
+                BatchResult(
+                    index, errors=e.errors(include_url=False, include_input=False)
+                )
+            )
+        else:
+            results.append(BatchResult(index, feature=feature))
+    return results
@@ -0,0 +1,563 @@
+from overture_schema_pydantic.constraint import MinItems
+from overture_schema_pydantic.errors import ErrorCollector, _escape
+from overture_schema_pydantic.geometry import (
+    Geometry,
+    GeometryTypeConstraint,
+    _GEOMETRY_TYPE_NAMES,
+)
+from overture_schema_pydantic.sampling import Sample
+
+import datetime
+import functools
+import json
+from typing import (
+    get_args,
+    get_origin,
+    Annotated,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import shapely
+from annotated_types import Ge, Gt, Le, Lt, MaxLen, MinLen
+from pydantic import BaseModel, TypeAdapter
+from pydantic.fields import FieldInfo
+
+
+ERROR_TABLE_SCHEMA = pa.schema(
+    [
+        pa.field("row", pa.int64(), nullable=False),
+        pa.field("property", pa.string(), nullable=False),
+        pa.field("error", pa.string(), nullable=False),
+    ]
+)
+
+
+def validate_table(
+    model: type[BaseModel],
+    table: pa.Table | pa.RecordBatch,
+    sample: Optional[Sample] = None,
+) -> pa.Table:
+    """
+    Validate every row of an Arrow table against a model, column by column, without
+    constructing model instances.
+
+    The result has one row per error with the zero-based input row number, a JSON Pointer to
+    the offending property, and an error message. Geometry columns are expected to contain
+    WKB, as in GeoParquet.
+
+    If `sample` is given, the table is trusted: only the rows sampled from each record batch
+    are validated, and `sample` is updated with the counts from which the error rate of the
+    whole table is estimated.
+    """
+    errors = ErrorCollector()
+    collect_table_errors(model, table, errors, sample)
+    result = errors.to_table(messages=True)
+    return pa.table(
+        [result.column(name) for name in ("row", "property", "message")],
+        schema=ERROR_TABLE_SCHEMA,
+    )
+
+
+def collect_table_errors(
+    model: type[BaseModel],
+    table: pa.Table | pa.RecordBatch,
+    errors: ErrorCollector,
+    sample: Optional[Sample] = None,
+):
+    # Like `validate_table`, but adds the errors to `errors` as structured records, so that
+    # nothing is formatted unless it's asked for.
+    if isinstance(table, pa.RecordBatch):
+        batches = [table]
+    elif isinstance(table, pa.Table):
+        batches = table.to_batches()
+    else:
+        raise TypeError(
+            f"table must be a `pyarrow.Table` or `pyarrow.RecordBatch`; but it has type {type(table).__name__}"
+        )
+
+    table_errors = _Errors(errors, table.num_rows)
+    row_offset = 0
+    for batch in batches:
+        num_rows = batch.num_rows
+        if sample is None:
+            rows = np.arange(row_offset, row_offset + num_rows, dtype=np.int64)
+        else:
+            indices = sample.select(num_rows)
+            sample.update(records=num_rows, sampled=len(indices))
+            batch = batch.take(pa.array(indices))
+            rows = row_offset + indices.astype(np.int64)
+        columns = dict(zip(batch.schema.names, batch.columns))
+        _check_model_fields(model, columns, _Path(rows, ()), table_errors)
+        row_offset += num_rows
+
+    if sample is not None:
+        sample.update(invalid=int(table_errors.invalid.sum()))
+
+
+# GeoParquet 1.1 bounding box covering column type.
+BBOX_TYPE = pa.struct(
+    [
+        pa.field("xmin", pa.float64()),
+        pa.field("ymin", pa.float64()),
+        pa.field("xmax", pa.float64()),
+        pa.field("ymax", pa.float64()),
+    ]
+)
+
+
+def bbox_covering(geometry: pa.Array | pa.ChunkedArray) -> pa.StructArray:
+    # Computes a `BBOX_TYPE` bounding box for every WKB geometry. Null and empty geometries get a
+    # null bounding box.
+    if isinstance(geometry, pa.ChunkedArray):
+        geometry = geometry.combine_chunks()
+    bounds = shapely.bounds(shapely.from_wkb(geometry.to_numpy(zero_copy_only=False)))
+    mask = pa.array(np.isnan(bounds[:, 0]))
+    return pa.StructArray.from_arrays(
+        [pa.array(bounds[:, i], pa.float64()) for i in range(4)],
+        fields=list(BBOX_TYPE),
+        mask=mask,
+    )
+
+
+def add_bbox_covering(
+    table: pa.Table, geometry_column: str = "geometry", bbox_column: str = "bbox"
+) -> pa.Table:
+    """
+    Add a GeoParquet 1.1 bounding box covering column for a WKB geometry column.
+
+    The column is registered as the geometry column's `covering` in the table's `geo` metadata,
+    which is created if missing. Parquet writes min/max statistics for the bounding box fields,
+    so readers can skip row groups by bounding box without decoding any geometry.
+    """
+    bbox = bbox_covering(table.column(geometry_column))
+    index = table.schema.get_field_index(bbox_column)
+    if index >= 0:
+        table = table.set_column(index, bbox_column, bbox)
+    else:
+        table = table.append_column(bbox_column, bbox)
+
+    metadata = dict(table.schema.metadata or {})
+    geo = json.loads(metadata.get(b"geo", b"{}"))
+    geo["version"] = "1.1.0"
+    geo.setdefault("primary_column", geometry_column)
+    column = geo.setdefault("columns", {}).setdefault(geometry_column, {})
+    column.setdefault("encoding", "WKB")
+    column.setdefault("geometry_types", [])
+    column["covering"] = {
+        "bbox": {name: [bbox_column, name] for name in BBOX_TYPE.names}
+    }
+    metadata[b"geo"] = json.dumps(geo).encode()
+    return table.replace_schema_metadata(metadata)
+
+
+########################################################################
+# Error collection
+########################################################################
+
+
+class _Path:
+    # A JSON Pointer for every element of an array being checked. Parts that are the same for all
+    # elements are plain strings; parts that vary by element (list indices, map keys) are numpy
+    # arrays aligned with `rows`. Pointer strings are only built for elements that have errors.
+
+    def __init__(self, rows: np.ndarray, parts: tuple):
+        self.rows = rows
+        self.parts = parts
+
+    def child(self, name: str) -> "_Path":
+        return _Path(self.rows, self.parts + (name,))
+
+    def take(self, indices: np.ndarray) -> "_Path":
+        return _Path(
+            self.rows[indices],
+            tuple(p if isinstance(p, str) else p[indices] for p in self.parts),
+        )
+
+    def items(self, parents: np.ndarray, keys: np.ndarray) -> "_Path":
+        parent = self.take(parents)
+        return _Path(parent.rows, parent.parts + (keys,))
+
+    def pattern(self) -> str:
+        # The pointer with every varying part replaced by `*`.
+        return "".join(
+            "/" + (_escape(p) if isinstance(p, str) else "*") for p in self.parts
+        )
+
+    def pointers(self, indices: np.ndarray) -> list[str]:
+        return [
+            "".join(
+                "/" + _escape(p if isinstance(p, str) else str(p[i]))
+                for p in self.parts
+            )
+            for i in indices
+        ]
+
+
+class _Errors:
+    # Adds the errors found by the column checks to a collector, keeping track of which rows
+    # are invalid. Parameters are values shared by all the elements of the path, or numpy
+    # arrays aligned with them.
+
+    def __init__(self, collector: ErrorCollector, num_rows: int):
+        self.__collector = collector
+        self.invalid = np.zeros(num_rows, dtype=bool)
+
+    def add(self, path: _Path, mask: Optional[np.ndarray], code: str, **params: Any):
+        indices = np.arange(len(path.rows)) if mask is None else np.flatnonzero(mask)
+        if not len(indices):
+            return
+        rows = path.rows[indices]
+        self.invalid[rows] = True
+        self.__collector.add_many(
+            rows,
+            path.pattern(),
+            code,
+            {
+                k: v[indices] if isinstance(v, np.ndarray) else v
+                for k, v in params.items()
+            },
+            lambda kept: path.pointers(indices[kept]),
+        )
+
+
+########################################################################
+# Column checks
+########################################################################
+
+
+def _check_model_fields(
+    model: type[BaseModel],
+    columns: dict[str, pa.Array],
+    path: _Path,
+    errors: _Errors,
+):
+    for field_name, field_info in model.model_fields.items():
+        column_name = field_info.alias or field_name
+        field_path = path.child(column_name)
+        column = columns.get(column_name)
+        if column is None:
+            if field_info.is_required():
+                errors.add(field_path, None, "column_missing")
+            continue
+        _check_field(field_info, column, field_path, errors)
+
+
+def _check_field(field_info: FieldInfo, array: pa.Array, path: _Path, errors: _Errors):
+    nullable = not field_info.is_required()
+    _check_value(
+        field_info.annotation, field_info.metadata, array, path, errors, nullable
+    )
+
+
+def _check_value(
+    py_type: Any,
+    metadata: list[Any],
+    array: pa.Array,
+    path: _Path,
+    errors: _Errors,
+    nullable: bool = False,
+):
+    origin = get_origin(py_type)
+    args = get_args(py_type)
+
+    if origin is Annotated:
+        return _check_value(
+            args[0],
+            metadata + _flatten_metadata(args[1:]),
+            array,
+            path,
+            errors,
+            nullable,
+        )
+
+    if origin is Union and type(None) in args:
+        non_none = [a for a in args if a is not type(None)]
+        if len(non_none) == 1:
+            return _check_value(non_none[0], metadata, array, path, errors, True)
+        raise TypeError(f"Unsupported Union: {py_type}")
+
+    if array.null_count:
+        valid = array.is_valid().to_numpy(zero_copy_only=False)
+        if not nullable:
+            errors.add(path, ~valid, "null_value")
+        indices = np.flatnonzero(valid)
+        array = array.take(pa.array(indices))
+        path = path.take(indices)
+
+    if not len(array):
+        return
+
+    if origin in (list, List, tuple, Tuple):
+        return _check_list(args[0], metadata, array, path, errors)
+
+    if origin in (dict, Dict):
+        return _check_dict(args[0], args[1], metadata, array, path, errors)
+
+    if origin is Literal:
+        return _check_literal(args, array, path, errors)
+
+    if isinstance(py_type, type) and issubclass(py_type, BaseModel):
+        return _check_struct(py_type, array, path, errors)
+
+    if py_type is Geometry:
+        return _check_geometry(metadata, array, path, errors)
+
+    if isinstance(py_type, type) and issubclass(py_type, str):
+        return _check_str(py_type, metadata, array, path, errors)
+
+    if py_type in (int, float):
+        return _check_number(metadata, array, path, errors)
+
+    if py_type in (bool, datetime.date, datetime.datetime):
+        return
+
+    raise TypeError(f"Unsupported type: {py_type}, origin={origin}")
+
+
+def _flatten_metadata(items: tuple) -> list[Any]:
+    metadata = []
+    for item in items:
+        if isinstance(item, FieldInfo):
+            metadata.extend(item.metadata)
+        else:
+            metadata.append(item)
+    return metadata
+
+
+def _require_arrow_type(path: _Path, array: pa.Array, predicate, expected: str):
+    if not predicate(array.type):
+        raise TypeError(
+            f"column {repr(path.pointers([0])[0])} must have an Arrow {expected} type; but it has type {array.type}"
+        )
+
+
+def _check_list(
+    item_type: Any,
+    metadata: list[Any],
+    array: pa.Array,
+    path: _Path,
+    errors: _Errors,
+):
+    _require_arrow_type(
+        path,
+        array,
+        lambda t: pa.types.is_list(t) or pa.types.is_large_list(t),
+        "list",
+    )
+    lengths = _check_length(metadata, array, path, errors, "List")
+    parents, positions = _item_positions(array, lengths)
+    values = array.values.slice(array.offsets[0].as_py(), len(parents))
+    _check_value(item_type, [], values, path.items(parents, positions), errors)
+
+
+def _check_dict(
+    key_type: Any,
+    value_type: Any,
+    metadata: list[Any],
+    array: pa.Array,
+    path: _Path,
+    errors: _Errors,
+):
+    _require_arrow_type(path, array, pa.types.is_map, "map")
+    lengths = _check_length(metadata, array, path, errors, "Dictionary")
+    parents, _ = _item_positions(array, lengths)
+    start = array.offsets[0].as_py()
+    keys = array.keys.slice(start, len(parents))
+    items = array.items.slice(start, len(parents))
+    item_path = path.items(parents, keys.to_numpy(zero_copy_only=False))
+    _check_value(key_type, [], keys, item_path, errors)
+    _check_value(value_type, [], items, item_path, errors)
+
+
+def _item_positions(
+    array: pa.Array, lengths: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    parents = np.repeat(np.arange(len(array)), lengths)
+    starts = np.cumsum(lengths) - lengths
+    positions = np.arange(len(parents)) - starts[parents]
+    return parents, positions
+
+
+def _check_length(
+    metadata: list[Any],
+    array: pa.Array,
+    path: _Path,
+    errors: _Errors,
+    field_type: str,
+) -> np.ndarray:
+    lengths = np.diff(array.offsets.to_numpy(zero_copy_only=False))
+    for m in metadata:
+        min_length = None
+        if isinstance(m, MinItems):
+            min_length = m.min_items
+        elif isinstance(m, MinLen):
+            min_length = m.min_length
+        if min_length is not None:
+            errors.add(
+                path,
+                lengths < min_length,
+                "too_short",
+                field_type=field_type,
+                min_length=min_length,
+                actual_length=lengths,
+            )
+        if isinstance(m, MaxLen):
+            errors.add(
+                path,
+                lengths > m.max_length,
+                "too_long",
+                field_type=field_type,
+                max_length=m.max_length,
+                actual_length=lengths,
+            )
+    return lengths
+
+
+def _check_literal(expected: tuple, array: pa.Array, path: _Path, errors: _Errors):
+    mask = pc.is_in(array, value_set=pa.array(expected)).to_numpy(zero_copy_only=False)
+    # Formatted as pydantic does.
+    literals = [repr(e) for e in expected]
+    if len(literals) > 1:
+        literals = [", ".join(literals[:-1]), literals[-1]]
+    errors.add(path, ~mask, "literal_error", expected=" or ".join(literals))
+
+
+def _check_struct(
+    model: type[BaseModel], array: pa.Array, path: _Path, errors: _Errors
+):
+    _require_arrow_type(path, array, pa.types.is_struct, "struct")
+    columns = {
+        array.type.field(i).name: child for i, child in enumerate(array.flatten())
+    }
+    _check_model_fields(model, columns, path, errors)
+
+
+def _check_str(
+    py_type: type,
+    metadata: list[Any],
+    array: pa.Array,
+    path: _Path,
+    errors: _Errors,
+):
+    _require_arrow_type(
+        path,
+        array,
+        lambda t: pa.types.is_string(t) or pa.types.is_large_string(t),
+        "string",
+    )
+
+    min_length, max_length, pattern = _str_subclass_constraints(py_type)
+    for m in metadata:
+        if isinstance(m, MinLen):
+            min_length = m.min_length
+        elif isinstance(m, MaxLen):
+            max_length = m.max_length
+        elif getattr(m, "pattern", None) is not None:
+            pattern = m.pattern
+
+    # Like pydantic, only report the first constraint each string fails.
+    failed = np.zeros(len(array), dtype=bool)
+    if min_length is not None or max_length is not None:
+        lengths = pc.utf8_length(array).to_numpy(zero_copy_only=False)
+        if min_length is not None:
+            mask = lengths < min_length
+            errors.add(path, mask, "string_too_short", min_length=min_length)
+            failed |= mask
+        if max_length is not None:
+            mask = lengths > max_length
+            errors.add(path, mask, "string_too_long", max_length=max_length)
+            failed |= mask
+    if pattern is not None:
+        # Values like language tags repeat heavily, so match each distinct value only once.
+        encoded = pc.dictionary_encode(array)
+        matched = pc.match_substring_regex(encoded.dictionary, pattern)
+        mask = ~pc.take(matched, encoded.indices).to_numpy(zero_copy_only=False)
+        errors.add(path, mask & ~failed, "string_pattern_mismatch", pattern=pattern)
+
+
+@functools.cache
+def _str_subclass_constraints(
+    py_type: type,
+) -> tuple[Optional[int], Optional[int], Optional[str]]:
+    # A `str` subclass may carry its own constraints in its core schema, e.g. `LanguageTag`,
+    # whose schema checks a `str` with a minimum length, then a union of a lookup table and a
+    # `str` with a pattern.
+    min_length = max_length = pattern = None
+    if py_type is not str:
+        for schema in _str_schemas(TypeAdapter(py_type).core_schema):
+            min_length = schema.get("min_length", min_length)
+            max_length = schema.get("max_length", max_length)
+            pattern = schema.get("pattern", pattern)
+    return min_length, max_length, pattern
+
+
+def _str_schemas(schema: Any) -> Iterable[dict]:
+    if not isinstance(schema, dict):
+        return
+    elif schema["type"] == "str":
+        yield schema
+    elif schema["type"] == "chain":
+        for step in schema["steps"]:
+            yield from _str_schemas(step)
+    elif schema["type"] == "union":
+        for choice in schema["choices"]:
+            yield from _str_schemas(choice)
+
+
+def _check_number(metadata: list[Any], array: pa.Array, path: _Path, errors: _Errors):
+    _require_arrow_type(
+        path,
+        array,
+        lambda t: pa.types.is_integer(t) or pa.types.is_floating(t),
+        "numeric",
+    )
+    for m in metadata:
+        for bound_type, attr, compare, code in (
+            (Ge, "ge", pc.greater_equal, "greater_than_equal"),
+            (Gt, "gt", pc.greater, "greater_than"),
+            (Le, "le", pc.less_equal, "less_than_equal"),
+            (Lt, "lt", pc.less, "less_than"),
+        ):
+            if isinstance(m, bound_type):
+                bound = getattr(m, attr)
+                mask = compare(array, bound).to_numpy(zero_copy_only=False)
+                errors.add(path, ~mask, code, **{attr: bound})
+
+
+def _check_geometry(metadata: list[Any], array: pa.Array, path: _Path, errors: _Errors):
+    _require_arrow_type(
+        path,
+        array,
+        lambda t: pa.types.is_binary(t) or pa.types.is_large_binary(t),
+        "binary (WKB)",
+    )
+    geoms = shapely.from_wkb(array.to_numpy(zero_copy_only=False), on_invalid="ignore")
+    type_ids = shapely.get_type_id(geoms)
+    errors.add(path, type_ids < 0, "geometry_invalid", error="invalid WKB")
+
+    for m in metadata:
+        if isinstance(m, GeometryTypeConstraint):
+            allowed, _ = m.validate_many(geoms)
+            errors.add(
+                path,
+                (type_ids >= 0) & ~allowed,
+                "geometry_type_not_allowed",
+                geometry_type=_GEOMETRY_TYPE_NAME_TABLE[type_ids],
+                allowed_types=list(m.allowed_types),
+            )
+
+
+# Geometry type names indexed by type ID.
+_GEOMETRY_TYPE_NAME_TABLE = np.array(
+    [_GEOMETRY_TYPE_NAMES[i] for i in range(len(_GEOMETRY_TYPE_NAMES))], dtype=object
+)
@@ -2,12 +2,18 @@ import datetime
 import sys
 from typing import get_args, get_origin, Annotated, Dict, List, Literal, Tuple, Union
 
+from overture_schema_pydantic.feature import Feature
 from overture_schema_pydantic.geometry import Geometry
 
 from pydantic import BaseModel
 
-import libcst as cst
-import black
+try:
+    import black
+    import libcst as cst
+except ImportError as e:
+    raise ImportError(
+        f"{__name__} requires the `codegen` extra: pip install 'overture-schema-pydantic[codegen]' ({e})"
+    ) from e
 
 
 def generate_code(model: type[BaseModel]) -> str:
@@ -40,11 +46,45 @@ def pydantic_model_to_spark_type(model: type[BaseModel]) -> cst.BaseExpression:
                 )
             )
         )
+    if issubclass(model, Feature):
+        struct_fields.append(_bbox_struct_field())
     return cst.Call(
         func=cst.Name("StructType"), args=[cst.Arg(cst.List(elements=struct_fields))]
     )
 
 
+def _bbox_struct_field() -> cst.Element:
+    # GeoParquet 1.1 bounding box covering column, derived from the geometry when writing, so
+    # it isn't a model field.
+    def struct_field(name: str, type_expr: cst.BaseExpression) -> cst.Element:
+        return cst.Element(
+            cst.Call(
+                func=cst.Name("StructField"),
+                args=[
+                    cst.Arg(cst.SimpleString(repr(name))),
+                    cst.Arg(type_expr),
+                    cst.Arg(cst.Name("True")),
+                ],
+            )
+        )
+
+    double = cst.Call(func=cst.Name("DoubleType"), args=[])
+    bbox_type = cst.Call(
+        func=cst.Name("StructType"),
+        args=[
+            cst.Arg(
+                cst.List(
+                    elements=[
+                        struct_field(name, double)
+                        for name in ("xmin", "ymin", "xmax", "ymax")
+                    ]
+                )
+            )
+        ],
+    )
+    return struct_field("bbox", bbox_type)
+
+
 def python_type_to_spark_type(py_type: type) -> cst.BaseExpression:
     origin = get_origin(py_type)
     args = get_args(py_type)
@@ -4,8 +4,13 @@ import re
 from pydantic import BaseModel
 from pydantic.fields import FieldInfo
 
-import black
-import libcst as cst
+try:
+    import black
+    import libcst as cst
+except ImportError as e:
+    raise ImportError(
+        f"{__name__} requires the `codegen` extra: pip install 'overture-schema-pydantic[codegen]' ({e})"
+    ) from e
 
 
 def generate_code(model: type[BaseModel]) -> str:
@@ -1,18 +1,24 @@
+from overture_schema_pydantic.instrumentation import instrumented
+
+import functools
 from abc import ABC, abstractmethod
 from collections.abc import Collection
-from typing import get_origin, Any
+from typing import get_origin, Any, Optional
 
 from pydantic import (
+    AliasChoices,
+    AliasPath,
     BaseModel,
     GetCoreSchemaHandler,
     GetJsonSchemaHandler,
-    ValidationError,
     ValidationInfo,
 )
-from pydantic_core import core_schema, InitErrorDetails
+from pydantic_core import core_schema, PydanticKnownError, SchemaValidator
 
 
 class CollectionConstraint(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def __get_pydantic_core_schema__(
         self, source: type[Any], handler: GetCoreSchemaHandler
@@ -33,6 +39,8 @@ class CollectionConstraint(ABC):
 
 
 class MinItems(CollectionConstraint):
+    __slots__ = ("__min_items",)
+
     def __init__(self, min_items: int):
         super().__init__()
         if not isinstance(min_items, int):
@@ -50,27 +58,29 @@ class MinItems(CollectionConstraint):
     def validate(self, value: Any, info: ValidationInfo):
         num_items = len(value)
         if num_items < self.min_items:
-            context = info.context or {}
-            loc = context.get("loc_prefix", ()) + ("value",)
-            raise ValidationError.from_exception_data(
-                title=self.__class__.__name__,
-                line_errors=[
-                    InitErrorDetails(
-                        type="value_error",
-                        loc=loc,
-                        input=value,
-                        ctx={
-                            "error": f"collection has too few items: expected len>={self.min_items} but got len={num_items})"
-                        },
-                    )
-                ],
+            # The same error as pydantic-core's native length check.
+            raise PydanticKnownError(
+                "too_short",
+                {
+                    "field_type": "Value",
+                    "min_length": self.min_items,
+                    "actual_length": num_items,
+                },
             )
+        return value
 
     def __get_pydantic_core_schema__(
         self, source: type[Any], handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
         schema = super().__get_pydantic_core_schema__(source, handler)
-        return core_schema.with_info_after_validator_function(self.validate, schema)
+        # Use pydantic-core's native length check where the schema has one, so validation never
+        # goes back into Python. Other collection schemas fall back to `validate`.
+        if schema["type"] in _MIN_LENGTH_SCHEMA_TYPES:
+            min_length = max(schema.get("min_length", 0), self.min_items)
+            return {**schema, "min_length": min_length}
+        return core_schema.with_info_after_validator_function(
+            instrumented(type(self).__name__, self.validate), schema
+        )
 
     def __get_pydantic_json_schema__(
         self, core_schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
@@ -87,6 +97,8 @@ class MinItems(CollectionConstraint):
 
 
 class ObjectConstraint(ABC):
+    __slots__ = ()
+
     @abstractmethod
     def __get_pydantic_core_schema__(
         self, source: type[Any], handler: GetCoreSchemaHandler
@@ -107,13 +119,40 @@ class ObjectConstraint(ABC):
 
 
 class NoAdditionalProperties(ObjectConstraint):
+    __slots__ = ()
+
     def __init__(self):
         super().__init__()
 
+    def validate(self, value: Any, info: ValidationInfo, names: frozenset[str]):
+        if isinstance(value, dict) and not value.keys() <= names:
+            # pydantic-core reports each extra key at its own location, under the location of
+            # `value` itself.
+            _extra_key_validator(names).validate_python(value)
+        return value
+
     def __get_pydantic_core_schema__(
         self, source: type[Any], handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
-        return super().__get_pydantic_core_schema__(source, handler)
+        schema = super().__get_pydantic_core_schema__(source, handler)
+        forbidding = _forbid_extra(schema)
+        if forbidding is not None:
+            return forbidding
+        names = _field_names(source)
+        # A plain dict has no declared properties, so there's nothing to forbid.
+        if names is None:
+            return schema
+        # Fall back to checking keys in Python. Models that are already built and typed dicts
+        # come back as a reference to their shared definition, which mustn't be changed. (Even a
+        # copy of a built model's schema wouldn't do: pydantic-core would reuse the model's own
+        # prebuilt validator for it.)
+        return core_schema.with_info_before_validator_function(
+            instrumented(
+                type(self).__name__,
+                lambda value, info: self.validate(value, info, names),
+            ),
+            schema,
+        )
 
     def __get_pydantic_json_schema__(
         self, core_schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
@@ -121,3 +160,70 @@ class NoAdditionalProperties(ObjectConstraint):
         json_schema = handler(core_schema)
         json_schema["additionalProperties"] = False
         return json_schema
+
+
+# Core schema types with a native `min_length` setting.
+_MIN_LENGTH_SCHEMA_TYPES = ("list", "tuple", "set", "frozenset", "dict")
+
+
+def _forbid_extra(schema: core_schema.CoreSchema) -> Optional[core_schema.CoreSchema]:
+    # Returns a copy of `schema` that natively forbids extra properties, or `None` if it has no
+    # native setting for that. The copy drops its `ref` so it doesn't clash with the original.
+    # Schemas carrying their own definitions (e.g. recursive models) would clash too, so they
+    # aren't copied.
+    match schema["type"]:
+        case "model-fields" | "typed-dict" | "dataclass-args":
+            return {**schema, "extra_behavior": "forbid"}
+        case "model" | "dataclass":
+            inner = _forbid_extra(schema["schema"])
+            if inner is None:
+                return None
+            return {k: v for k, v in schema.items() if k != "ref"} | {"schema": inner}
+        case _:
+            return None
+
+
+@functools.cache
+def _extra_key_validator(names: frozenset[str]) -> SchemaValidator:
+    # Forbids keys other than `names`, with the same errors as a model that forbids extras.
+    return SchemaValidator(
+        core_schema.typed_dict_schema(
+            {
+                name: core_schema.typed_dict_field(
+                    core_schema.any_schema(), required=False
+                )
+                for name in names
+            },
+            extra_behavior="forbid",
+        )
+    )
+
+
+@functools.cache
+def _field_names(source: Any) -> Optional[frozenset[str]]:
+    # The property names a model or typed dict accepts, or `None` for any other type. Only
+    # called once a model is being used in another schema, so its fields are all known.
+    if isinstance(source, type) and issubclass(source, BaseModel):
+        names = set()
+        for field_name, field_info in source.model_fields.items():
+            names.add(field_name)
+            for alias in (field_info.alias, field_info.validation_alias):
+                names.update(_alias_names(alias))
+        return frozenset(names)
+    elif hasattr(source, "__required_keys__"):
+        return source.__required_keys__ | source.__optional_keys__
+    else:
+        return None
+
+
+def _alias_names(alias: Any) -> list[str]:
+    # The top-level property names an alias reads, e.g. `properties` for a feature property that
+    # may be nested in a GeoJSON Feature.
+    if isinstance(alias, str):
+        return [alias]
+    elif isinstance(alias, AliasPath):
+        return alias.path[:1] if isinstance(alias.path[0], str) else []
+    elif isinstance(alias, AliasChoices):
+        return [name for choice in alias.choices for name in _alias_names(choice)]
+    else:
+        return []
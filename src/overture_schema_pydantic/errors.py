@@ -0,0 +1,304 @@
+from overture_schema_pydantic.geometry import GEOMETRY_ERROR_MESSAGES
+from overture_schema_pydantic.scoping import SCOPING_ERROR_MESSAGES
+
+import functools
+import json
+import types
+from typing import (
+    get_args,
+    get_origin,
+    Annotated,
+    Any,
+    Callable,
+    Iterable,
+    Optional,
+    Union,
+)
+
+import numpy as np
+import pyarrow as pa
+from pydantic import AliasChoices, AliasPath, BaseModel, ValidationError
+from pydantic_core import PydanticCustomError, PydanticKnownError
+
+
+COLLECTED_ERROR_SCHEMA = pa.schema(
+    [
+        pa.field("row", pa.int64(), nullable=False),
+        pa.field("property", pa.string(), nullable=False),
+        pa.field("code", pa.string(), nullable=False),
+        # The error's parameters (e.g. the constraint violated) as a JSON object.
+        pa.field("params", pa.string(), nullable=False),
+    ]
+)
+
+ERROR_SUMMARY_SCHEMA = pa.schema(
+    [
+        pa.field("code", pa.string(), nullable=False),
+        pa.field("path", pa.string(), nullable=False),
+        pa.field("count", pa.int64(), nullable=False),
+    ]
+)
+
+# Message templates for error codes that aren't pydantic's own. Messages for pydantic's error
+# types are rendered by pydantic.
+ERROR_MESSAGES = {
+    "column_missing": "required column is missing",
+    "null_value": "required value is null",
+    **GEOMETRY_ERROR_MESSAGES,
+    **SCOPING_ERROR_MESSAGES,
+}
+
+
+def format_error(code: str, params: dict[str, Any]) -> str:
+    template = ERROR_MESSAGES.get(code)
+    if template is not None:
+        return PydanticCustomError(code, template, params).message()
+    try:
+        return PydanticKnownError(code, params or None).message()
+    except (KeyError, TypeError):
+        return code
+
+
+class ErrorCollector:
+    """
+    Collect validation errors as structured records, rendered into an Arrow table on demand.
+
+    Each error is a row number, a JSON Pointer to the offending property, an error code (e.g.
+    `string_pattern_mismatch`) and the parameters that go with it (e.g. the pattern). JSON
+    Pointers, parameters and messages are only built for the records kept, and only when the
+    table is built. Once `max_errors` records are kept, further errors are only counted. The
+    counts by error code and path, in which list indices and map keys are replaced by `*`, are
+    always complete.
+    """
+
+    def __init__(self, max_errors: Optional[int] = None):
+        if max_errors is not None and max_errors < 0:
+            raise ValueError(
+                f"max_errors must be non-negative; but it is {repr(max_errors)}"
+            )
+        self.__max_errors = max_errors
+        self.__chunks: list[_Chunk] = []
+        self.__kept = 0
+        self.__counts: dict[tuple[str, str], int] = {}
+
+    @property
+    def count(self) -> int:
+        return sum(self.__counts.values())
+
+    @property
+    def kept(self) -> int:
+        return self.__kept
+
+    @property
+    def truncated(self) -> bool:
+        return self.__kept < self.count
+
+    def add_many(
+        self,
+        rows: np.ndarray,
+        path: str,
+        code: str,
+        params: Optional[dict[str, Any]] = None,
+        pointers: Optional[Callable[[np.ndarray], list[str]]] = None,
+    ):
+        # Adds one error per row. Each parameter is a value shared by all the rows or a numpy
+        # array with a value for each. `pointers` builds the JSON Pointers for the rows at the
+        # given positions; without it, `path` is the pointer for every row.
+        count = len(rows)
+        if not count:
+            return
+        key = (code, path)
+        self.__counts[key] = self.__counts.get(key, 0) + count
+        keep = count if self.__max_errors is None else self.__max_errors - self.__kept
+        if keep <= 0:
+            return
+        elif keep < count:
+            rows = rows[:keep]
+            params = {
+                k: v[:keep] if isinstance(v, np.ndarray) else v
+                for k, v in (params or {}).items()
+            }
+        self.__kept += len(rows)
+        self.__chunks.append(_Chunk(rows, path, code, params or {}, pointers))
+
+    def add_validation_error(
+        self,
+        row: int,
+        error: ValidationError | Iterable[dict[str, Any]],
+        model: Any = None,
+    ):
+        # Adds the errors of a pydantic `ValidationError`, or of the list returned by its
+        # `errors()` method. Given the model validated (or a `FeatureRegistry`), error locations
+        # are turned into pointers and paths like `collect_table_errors` reports; see `_loc_parts`.
+        if isinstance(error, ValidationError):
+            error = error.errors(include_url=False, include_input=False)
+        for e in error:
+            parts = _loc_parts(e["loc"], model)
+            pointer = _pointer(parts)
+            path = "".join("/*" if varies else "/" + _escape(p) for p, varies in parts)
+            self.add_many(
+                np.array([row], dtype=np.int64),
+                path,
+                e["type"],
+                e.get("ctx"),
+                lambda _, pointer=pointer: [pointer],
+            )
+
+    def to_table(self, messages: bool = False) -> pa.Table:
+        # One row per kept error in `COLLECTED_ERROR_SCHEMA`, ordered by row number, with a
+        # formatted `message` column if `messages` is true.
+        schema = COLLECTED_ERROR_SCHEMA
+        if messages:
+            schema = schema.append(pa.field("message", pa.string(), nullable=False))
+        if not self.__chunks:
+            return schema.empty_table()
+
+        rows, properties, codes, params = [], [], [], []
+        for chunk in self.__chunks:
+            count = len(chunk.rows)
+            rows.append(chunk.rows)
+            if chunk.pointers is None:
+                properties.extend([chunk.path] * count)
+            else:
+                properties.extend(chunk.pointers(np.arange(count)))
+            codes.extend([chunk.code] * count)
+            params.extend(chunk.params_by_row())
+        rows = np.concatenate(rows)
+        order = np.argsort(rows, kind="stable")
+
+        columns = [
+            pa.array(rows[order]),
+            pa.array(np.array(properties, dtype=object)[order]),
+            pa.array(np.array(codes, dtype=object)[order]),
+            pa.array([json.dumps(params[i], default=str) for i in order]),
+        ]
+        if messages:
+            columns.append(pa.array([format_error(codes[i], params[i]) for i in order]))
+        return pa.table(columns, schema=schema)
+
+    def summary(self) -> pa.Table:
+        # Error counts by code and path in `ERROR_SUMMARY_SCHEMA`, most frequent first.
+        items = sorted(self.__counts.items(), key=lambda item: (-item[1], item[0]))
+        return pa.table(
+            [
+                pa.array([code for (code, _), _ in items], pa.string()),
+                pa.array([path for (_, path), _ in items], pa.string()),
+                pa.array([count for _, count in items], pa.int64()),
+            ],
+            schema=ERROR_SUMMARY_SCHEMA,
+        )
+
+
+class _Chunk:
+    __slots__ = ("rows", "path", "code", "params", "pointers")
+
+    def __init__(
+        self,
+        rows: np.ndarray,
+        path: str,
+        code: str,
+        params: dict[str, Any],
+        pointers: Optional[Callable[[np.ndarray], list[str]]],
+    ):
+        self.rows = rows
+        self.path = path
+        self.code = code
+        self.params = params
+        self.pointers = pointers
+
+    def params_by_row(self) -> list[dict[str, Any]]:
+        count = len(self.rows)
+        columns = {
+            k: v.tolist() if isinstance(v, np.ndarray) else [v] * count
+            for k, v in self.params.items()
+        }
+        return [{k: v[i] for k, v in columns.items()} for i in range(count)]
+
+
+def _escape(token: str) -> str:
+    return token.replace("~", "~0").replace("/", "~1")
+
+
+def _pointer(parts: list[tuple[str, bool]]) -> str:
+    return "".join("/" + _escape(part) for part, _ in parts)
+
+
+def _loc_parts(loc: Iterable[Any], model: Any = None) -> list[tuple[str, bool]]:
+    # The parts of a pydantic error location that point into the record, each with whether it
+    # varies between records (a list index or map key). Parts pydantic adds that aren't in the
+    # record are dropped: the `[key]` after an invalid map key, the feature type tag of a
+    # `FeatureRegistry`, and the `properties` of a GeoJSON Feature. Without `model`, only list
+    # indices are known to vary.
+    loc = [part for part in loc if part != "[key]"]
+    if model is not None and not isinstance(model, type):
+        # A `FeatureRegistry` of more than one type tags the location with the feature type.
+        models = set(model.types.values())
+        if len(models) > 1:
+            model = model.types.get(loc[0]) if loc else None
+            loc = loc[1:]
+        else:
+            model = next(iter(models), None)
+    parts = []
+    annotation = model
+    i = 0
+    while i < len(loc):
+        annotation = _unwrap(annotation)
+        if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            field = _match_field(annotation, tuple(loc[i:]))
+            if field is not None:
+                name, length = field
+                parts.append((name, False))
+                annotation = annotation.model_fields[name].annotation
+                i += length
+                continue
+            annotation = None
+        part = loc[i]
+        origin = get_origin(annotation)
+        args = get_args(annotation)
+        if origin is dict:
+            parts.append((str(part), True))
+            annotation = args[1] if args else None
+        else:
+            parts.append((str(part), isinstance(part, int)))
+            annotation = args[0] if args and isinstance(part, int) else None
+        i += 1
+    return parts
+
+
+def _unwrap(annotation: Any) -> Any:
+    # The type inside `Annotated` and `Optional`. Other unions add the member validated to the
+    # location, so what follows can't be told apart.
+    while True:
+        origin = get_origin(annotation)
+        if origin is Annotated:
+            annotation = get_args(annotation)[0]
+        elif origin in (Union, types.UnionType):
+            members = [a for a in get_args(annotation) if a is not type(None)]
+            annotation = members[0] if len(members) == 1 else None
+        else:
+            return annotation
+
+
+def _match_field(model: type[BaseModel], loc: tuple) -> Optional[tuple[str, int]]:
+    # The field that `loc` starts with, and the number of parts its name or alias takes.
+    for field_loc, name in _field_locs(model):
+        if loc[: len(field_loc)] == field_loc:
+            return name, len(field_loc)
+    return None
+
+
+@functools.cache
+def _field_locs(model: type[BaseModel]) -> tuple[tuple[tuple, str], ...]:
+    # The locations pydantic may report each field at, longest first. A field read through an
+    # `AliasPath`, e.g. from the `properties` of a GeoJSON Feature, is reported at the path.
+    locs = []
+    for name, field_info in model.model_fields.items():
+        aliases = [name, field_info.alias, field_info.validation_alias]
+        if isinstance(field_info.validation_alias, AliasChoices):
+            aliases.extend(field_info.validation_alias.choices)
+        for alias in aliases:
+            if isinstance(alias, str):
+                locs.append(((alias,), name))
+            elif isinstance(alias, AliasPath):
+                locs.append((tuple(alias.path), name))
+    return tuple(sorted(locs, key=lambda item: -len(item[0])))
@@ -1,12 +1,41 @@
-from overture_schema_pydantic.geometry import Geometry
+from overture_schema_pydantic.geometry import (
+    Geometry,
+    parse_json_with_raw_geometry,
+    use_raw_geometry,
+    _BBOX_JSON_SCHEMA,
+)
 from overture_schema_pydantic.id import Id
 from overture_schema_pydantic.names import Names
 from overture_schema_pydantic.source import Source
 
+import copy
+import functools
+import types
 from abc import ABC
-from typing import Annotated, Any, List, Optional
+from datetime import datetime
+from typing import (
+    get_args,
+    get_origin,
+    Annotated,
+    Any,
+    Callable,
+    List,
+    Optional,
+    Sequence,
+    Union,
+)
 
-from pydantic import BaseModel, Field, GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic import (
+    AliasChoices,
+    AliasGenerator,
+    AliasPath,
+    BaseModel,
+    ConfigDict,
+    Field,
+    GetCoreSchemaHandler,
+    GetJsonSchemaHandler,
+    TypeAdapter,
+)
 from pydantic_core import core_schema
 
 
@@ -30,6 +59,8 @@ FeatureType = Annotated[
 
 
 class FeatureTypeReference:
+    __slots__ = ("__feature_type",)
+
     def __init__(self, feature_type: FeatureType):
         self.__feature_type = feature_type  # TODO: Validate this
 
@@ -48,7 +79,32 @@ class FeatureTypeReference:
         return schema
 
 
+# Layouts a feature can be dumped in. `"flat"` is the model's own layout, and `"geo_json"` is a
+# GeoJSON Feature, which nests every property except `id` and `geometry` under `properties`.
+FEATURE_LAYOUTS = ("flat", "geo_json")
+
+# Properties kept at the top level of a GeoJSON Feature.
+_GEO_JSON_TOP_LEVEL_PROPERTIES = frozenset(("id", "geometry"))
+
+
+def _validation_alias(field_name: str) -> Optional[AliasChoices]:
+    # Lets features be validated in either layout. The flat layout is looked up first, so that
+    # a missing property is reported where the model expects it, except for `type`: a GeoJSON
+    # Feature's own `"type": "Feature"` mustn't be mistaken for the feature type.
+    if field_name in _GEO_JSON_TOP_LEVEL_PROPERTIES:
+        return None
+    elif field_name == "type":
+        return AliasChoices(AliasPath("properties", field_name), field_name)
+    return AliasChoices(field_name, AliasPath("properties", field_name))
+
+
 class Feature(BaseModel, ABC):
+    # Properties are read in place from either layout by pydantic-core, so GeoJSON Features don't
+    # need to be flattened before validation.
+    model_config = ConfigDict(
+        alias_generator=AliasGenerator(validation_alias=_validation_alias)
+    )
+
     id: Id
     geometry: Geometry
     type: FeatureType
@@ -58,6 +114,106 @@ class Feature(BaseModel, ABC):
     sources: Annotated[List[Source], Field(min_length=1)]
     names: Optional[Names] = None
 
+    @classmethod
+    def model_validate_json(
+        cls,
+        json_data: str | bytes | bytearray,
+        *,
+        strict: Optional[bool] = None,
+        context: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> "Feature":
+        # Pydantic would parse the geometry coordinates into Python lists of floats, only for
+        # shapely to walk them again. Instead, leave the geometry as raw JSON text for GEOS to
+        # parse, and validate the rest of the parsed feature in Python mode. That only pays off
+        # for large enough features, and strict mode treats JSON and Python input differently,
+        # so other features keep the standard path.
+        if strict or not use_raw_geometry(json_data, context):
+            return super().model_validate_json(
+                json_data, strict=strict, context=context, **kwargs
+            )
+        try:
+            value = parse_json_with_raw_geometry(json_data)
+        except ValueError:
+            # Let pydantic report the invalid JSON.
+            return super().model_validate_json(json_data, context=context, **kwargs)
+        return cls.model_validate(value, strict=strict, context=context, **kwargs)
+
+    @classmethod
+    def model_construct_trusted(cls, obj: Any) -> "Feature":
+        # Builds a feature from already-validated input, in either layout, without validating
+        # it again. Like `model_construct`, except that nested models are constructed too, the
+        # geometry is wrapped lazily, and ISO 8601 timestamps are parsed. Other values are kept
+        # as they are.
+        if (
+            isinstance(obj, dict)
+            and obj.get("type") == "Feature"
+            and isinstance(obj.get("properties"), dict)
+        ):
+            obj = obj["properties"] | {
+                k: obj[k] for k in _GEO_JSON_TOP_LEVEL_PROPERTIES if k in obj
+            }
+        return _construct(cls, obj)
+
+    @classmethod
+    def dump_many(
+        cls,
+        features: Sequence["Feature"],
+        geometry_format: Optional[str] = None,
+        mode: str = "python",
+        layout: str = "flat",
+        **kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        # Like calling `model_dump` on each feature, but in one call, and with all geometries
+        # serialized together by `Geometry.serialize_many`. `layout` is one of `FEATURE_LAYOUTS`.
+        # Extra keyword arguments are passed to the non-geometry part of the dump; `include` and
+        # `exclude` apply to each feature, as they do for `model_dump`.
+        if layout not in FEATURE_LAYOUTS:
+            raise ValueError(
+                f"invalid layout {repr(layout)} (allowed: {FEATURE_LAYOUTS})"
+            )
+        features = list(features)
+        include = kwargs.pop("include", None)
+        exclude = kwargs.pop("exclude", None)
+        with_geometry = (include is None or "geometry" in include) and not (
+            exclude is not None and _excludes_field(exclude, "geometry")
+        )
+        dumped = _feature_list_adapter(cls).dump_python(
+            features,
+            mode=mode,
+            include=None if include is None else {"__all__": include},
+            exclude={"__all__": _exclude_dict(exclude) | {"geometry": True}},
+            **kwargs,
+        )
+        if not with_geometry:
+            geometries = [_MISSING] * len(features)
+        else:
+            geometries = Geometry.serialize_many(
+                [f.geometry for f in features], geometry_format, mode
+            )
+        if layout == "geo_json":
+            return [
+                _geo_json_feature(d, geometry)
+                for d, geometry in zip(dumped, geometries)
+            ]
+        if not with_geometry:
+            return dumped
+        # Put the geometry back where `model_dump` has it, after the fields declared before it.
+        before = _keys_before_geometry(cls, kwargs.get("by_alias") or False)
+        return [
+            {**{k: d.pop(k) for k in before if k in d}, "geometry": geometry, **d}
+            for d, geometry in zip(dumped, geometries)
+        ]
+
+    def to_geo_json(
+        self,
+        geometry_format: Optional[str] = None,
+        mode: str = "python",
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        # Dumps the feature as a GeoJSON Feature, which validates back to an equal feature.
+        return self.dump_many([self], geometry_format, mode, "geo_json", **kwargs)[0]
+
     @classmethod
     def __get_pydantic_json_schema__(
         cls, core_schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
@@ -71,7 +227,7 @@ class Feature(BaseModel, ABC):
         geo_json_properties = {}
         geo_json_required = []
         for name in list(json_schema_top_level_properties.keys()):
-            if name not in ["id", "geometry"]:
+            if name not in _GEO_JSON_TOP_LEVEL_PROPERTIES:
                 value = json_schema_top_level_properties[name]
                 geo_json_properties[name] = value
                 del json_schema_top_level_properties[name]
@@ -95,7 +251,134 @@ class Feature(BaseModel, ABC):
         }
         json_schema_top_level_required.append("type")
 
-        # TODO: Special handling for bbox.
+        # Add the optional GeoJSON `bbox` member at the top level.
+        json_schema_top_level_properties["bbox"] = copy.deepcopy(_BBOX_JSON_SCHEMA)
 
         # Done modifying to GeoJSON.
         return json_schema
+
+
+def _construct(model: type[BaseModel], value: Any) -> Any:
+    if not isinstance(value, dict):
+        return value
+    plan = _construct_plan(model)
+    if plan is None:
+        return model.model_construct(**value)
+    names, fields_plan = plan
+    get = value.get
+    fields = {}
+    for name, build, default in fields_plan:
+        v = get(name, default)
+        if v is not _MISSING:
+            fields[name] = v if build is None or v is None else build(v)
+    if not _HAS_MODEL_SLOTS:
+        return model.model_construct(names & value.keys(), **fields)
+    # What `model_construct` does, without its per-field alias handling, which costs more than
+    # validating the feature would.
+    m = object.__new__(model)
+    object.__setattr__(m, "__dict__", fields)
+    _set_fields_set(m, names & value.keys())
+    _set_extra(m, None)
+    _set_private(m, None)
+    return m
+
+
+_MISSING = object()
+
+
+def _slot_setter(name: str) -> Optional[Callable[[Any, Any], None]]:
+    # The setter of one of `BaseModel`'s private slots. These are pydantic internals, so if a
+    # version of pydantic doesn't have them, `_construct` falls back to `model_construct`.
+    return getattr(BaseModel.__dict__.get(name), "__set__", None)
+
+
+_set_fields_set = _slot_setter("__pydantic_fields_set__")
+
+_set_extra = _slot_setter("__pydantic_extra__")
+
+_set_private = _slot_setter("__pydantic_private__")
+
+_HAS_MODEL_SLOTS = None not in (_set_fields_set, _set_extra, _set_private)
+
+
+@functools.cache
+def _construct_plan(
+    model: type[BaseModel],
+) -> Optional[tuple[frozenset[str], tuple[tuple[str, Optional[Callable], Any], ...]]]:
+    # The field names, and each field with its conversion (see `_construct_value`) and default;
+    # or `None` if the model needs the full `model_construct`.
+    if (
+        model.__private_attributes__
+        or model.model_config.get("extra") == "allow"
+        or model.model_post_init is not BaseModel.model_post_init
+    ):
+        return None
+    fields_plan = []
+    for name, field_info in model.model_fields.items():
+        if field_info.default_factory is not None:
+            return None
+        default = _MISSING if field_info.is_required() else field_info.default
+        fields_plan.append((name, _construct_value(field_info.annotation), default))
+    return frozenset(model.model_fields), tuple(fields_plan)
+
+
+def _construct_value(annotation: Any) -> Optional[Callable[[Any], Any]]:
+    # A conversion from trusted input to the annotated type, or `None` if the input is kept.
+    origin = get_origin(annotation)
+    args = get_args(annotation)
+    if origin is Annotated:
+        return _construct_value(args[0])
+    elif origin in (Union, types.UnionType):
+        # Only optional types are converted. The input of a union of several types is kept as
+        # it is, rather than guessing which of them it was validated as.
+        non_none = [a for a in args if a is not type(None)]
+        return _construct_value(non_none[0]) if len(non_none) == 1 else None
+    elif origin in (list, List):
+        build = _construct_value(args[0])
+        return None if build is None else lambda v: [build(item) for item in v]
+    elif annotation is Geometry:
+        return lambda v: v if isinstance(v, Geometry) else Geometry.lazy(v)
+    elif annotation is datetime:
+        return lambda v: datetime.fromisoformat(v) if isinstance(v, str) else v
+    elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return functools.partial(_construct, annotation)
+    else:
+        return None
+
+
+def _geo_json_feature(properties: dict[str, Any], geometry: Any) -> dict[str, Any]:
+    feature = {"type": "Feature", "id": properties.pop("id", None)}
+    if geometry is not _MISSING:
+        feature["geometry"] = geometry
+    feature["properties"] = properties
+    return feature
+
+
+def _excludes_field(exclude: Any, name: str) -> bool:
+    # Whether a `model_dump` exclude spec leaves out the whole field, rather than part of it.
+    if isinstance(exclude, dict):
+        return exclude.get(name) is True or exclude.get(name) is ...
+    return name in exclude
+
+
+def _exclude_dict(exclude: Any) -> dict[Any, Any]:
+    if exclude is None:
+        return {}
+    elif isinstance(exclude, dict):
+        return dict(exclude)
+    return dict.fromkeys(exclude, True)
+
+
+@functools.cache
+def _keys_before_geometry(model: type[Feature], by_alias: bool) -> tuple[str, ...]:
+    keys = []
+    for name, field_info in model.model_fields.items():
+        if name == "geometry":
+            break
+        keys.append((field_info.serialization_alias or name) if by_alias else name)
+    return tuple(keys)
+
+
+@functools.cache
+def _feature_list_adapter(model: type[Feature]) -> TypeAdapter:
+    return TypeAdapter(list[model])
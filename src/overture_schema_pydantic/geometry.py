@@ -1,14 +1,21 @@
-from typing import Any, Optional
+from overture_schema_pydantic.instrumentation import instrumented
+
+import copy
+import re
+from typing import Any, Optional, Sequence
+
+import numpy as np
 
 from pydantic import (
     GetCoreSchemaHandler,
     GetJsonSchemaHandler,
-    ValidationError,
+    SerializationInfo,
     ValidationInfo,
 )
-from pydantic_core import core_schema, InitErrorDetails
+from pydantic_core import core_schema, from_json, PydanticCustomError
 
-from shapely.geometry import shape, mapping
+import shapely
+from shapely.geometry import mapping, shape
 from shapely.geometry.base import BaseGeometry
 
 # Note: It would be better to model this as a string enumeration class GeometryType(Enum, str)
@@ -23,33 +30,62 @@ _GEOMETRY_TYPES = (
     "MultiPolygon",
 )
 
+# Shapely geometry type IDs, as returned by `shapely.get_type_id`. (ID 2 is `LinearRing`, which
+# isn't a GeoJSON geometry type.)
+_GEOMETRY_TYPE_IDS = {
+    "Point": 0,
+    "LineString": 1,
+    "Polygon": 3,
+    "MultiPoint": 4,
+    "MultiLineString": 5,
+    "MultiPolygon": 6,
+    "GeometryCollection": 7,
+}
+
+_GEOMETRY_TYPE_NAMES = {v: k for k, v in _GEOMETRY_TYPE_IDS.items()} | {2: "LinearRing"}
+
+# Message templates of the validation errors raised for geometries, by error type. The context
+# carries the parameters, so pydantic only renders a message when one is asked for.
+GEOMETRY_ERROR_MESSAGES = {
+    "geometry_invalid": "invalid geometry value: {error}",
+    "geometry_type_not_allowed": "geometry type not allowed: {geometry_type} (allowed values: {allowed_types})",
+}
+
 
 class GeometryTypeConstraint:
+    __slots__ = ("__allowed_types", "__allowed_type_id_table")
+
     def __init__(self, *allowed_types: str):
         self.__allowed_types = self.__class__._validate_geometry_types(allowed_types)
+        # Lookup table indexed by type ID + 1, so that missing geometries (ID -1) map to index 0.
+        self.__allowed_type_id_table = np.zeros(9, dtype=bool)
+        for t in self.__allowed_types:
+            self.__allowed_type_id_table[_GEOMETRY_TYPE_IDS[t] + 1] = True
+        # Read-only, since validators share it across threads.
+        self.__allowed_type_id_table.flags.writeable = False
 
     @property
     def allowed_types(self) -> tuple[str, ...]:
         return self.__allowed_types
 
-    def validate(self, value: "Geometry", info: ValidationInfo):
-        geometry_type = value.geom.geom_type
+    def validate(self, value: "Geometry", info: ValidationInfo) -> "Geometry":
+        geometry_type = value.geom_type
         if geometry_type not in self.allowed_types:
-            context = info.context or {}
-            loc = context.get("loc_prefix", ()) + ("value",)
-            raise ValidationError.from_exception_data(
-                title=self.__class__.__name__,
-                line_errors=[
-                    InitErrorDetails(
-                        type="value_error",
-                        loc=loc,
-                        input=value,
-                        ctx={
-                            "error": f"geometry type not allowed: {repr(geometry_type)} (allowed values: {repr(self.allowed_types)})"
-                        },
-                    )
-                ],
+            raise _geometry_error(
+                "geometry_type_not_allowed",
+                geometry_type=geometry_type,
+                allowed_types=list(self.allowed_types),
             )
+        return value
+
+    def validate_many(self, geometries: Any) -> tuple[np.ndarray, np.ndarray]:
+        # Checks an array of shapely geometries (a numpy array, a GeoPandas `GeometryArray` or
+        # `GeoSeries`, or a sequence) in one vectorized pass. Returns a boolean mask that is `True`
+        # where the geometry type is allowed, and the indices where it isn't. Missing geometries
+        # are never allowed.
+        type_ids = shapely.get_type_id(np.asarray(geometries, dtype=object))
+        mask = self.__allowed_type_id_table[type_ids + 1]
+        return mask, np.flatnonzero(~mask)
 
     @classmethod
     def _validate_geometry_types(cls, a: list[str]) -> tuple[str]:
@@ -77,20 +113,20 @@ class GeometryTypeConstraint:
                 f"{GeometryTypeConstraint.__name__} can only be applied to {Geometry.__name__}; but it was applied to {source.__name__}"
             )
         schema = handler(source)
-        return core_schema.with_info_after_validator_function(self.validate, schema)
+        return core_schema.with_info_after_validator_function(
+            instrumented(GeometryTypeConstraint.__name__, self.validate), schema
+        )
 
     def __get_pydantic_json_schema__(
         self, source: type[Any], handler: GetJsonSchemaHandler
     ) -> dict[str, Any]:
+        # Copied, so that nothing done to the returned schema can change the shared constants.
         if len(self.allowed_types) == 1:
-            return _GEOMETRY_JSON_SCHEMA[self.allowed_types[0]]
+            return copy.deepcopy(_GEOMETRY_JSON_SCHEMA[self.allowed_types[0]])
         else:
-            allowed_schemas = tuple(
-                map(
-                    lambda x: _GEOMETRY_JSON_SCHEMA[x],
-                    self.allowed_types,
-                )
-            )
+            allowed_schemas = [
+                copy.deepcopy(_GEOMETRY_JSON_SCHEMA[x]) for x in self.allowed_types
+            ]
             return {
                 "oneOf": allowed_schemas,
             }
@@ -98,12 +134,53 @@ class GeometryTypeConstraint:
 
 _ALL_GEOMETRY_ALLOWED = GeometryTypeConstraint(*_GEOMETRY_TYPES)
 
+# Serialization formats, selected with the `"geometry_format"` serialization context key. In JSON
+# mode, `"geo_json_bytes"` is embedded as a GeoJSON object and `"wkb"` is written as hex.
+GEOMETRY_FORMATS = ("geo_json", "geo_json_bytes", "wkb", "wkt")
+
 
 class Geometry:
-    geom: BaseGeometry
+    # A geometry is either eager, holding a shapely geometry, or lazy, holding the raw input it
+    # was validated from (a GeoJSON dict, a GeoJSON string, or a WKB buffer) together with the
+    # geometry type read from that input. A lazy geometry only builds its shapely geometry when
+    # `geom` is first accessed. Slots keep the per-instance footprint small, since millions of
+    # features may be held in memory at once.
+
+    __slots__ = ("__geom", "__geom_type", "__raw", "__bounds")
 
     def __init__(self, geom: BaseGeometry):
-        self.geom = geom
+        self.__geom = geom
+        self.__geom_type = geom.geom_type
+        self.__raw = None
+        self.__bounds = None
+
+    @property
+    def geom(self) -> BaseGeometry:
+        # Threads racing to build a lazy geometry each build an equal one and the last one is
+        # kept, which is harmless, so there's no lock. The same goes for `bounds`.
+        if self.__geom is None:
+            self.__geom = _parse_geometry(self.__raw)
+        return self.__geom
+
+    @property
+    def geom_type(self) -> str:
+        return self.__geom_type
+
+    @property
+    def raw(self) -> Any:
+        return self.__raw
+
+    @property
+    def bounds(self) -> tuple[float, float, float, float]:
+        # `(xmin, ymin, xmax, ymax)`, computed on first access and then cached. All NaN for an
+        # empty geometry.
+        if self.__bounds is None:
+            self.__bounds = tuple(shapely.bounds(self.geom).tolist())
+        return self.__bounds
+
+    @property
+    def is_lazy(self) -> bool:
+        return self.__raw is not None
 
     def __eq__(self, other: Any) -> bool:
         return isinstance(other, Geometry) and self.geom == other.geom
@@ -112,10 +189,12 @@ class Geometry:
         return hash(self.geom)
 
     def __repr__(self) -> str:
-        return f"<{repr(self.geom)}>"
+        if self.__geom is None:
+            return f"<lazy {self.__geom_type}>"
+        return f"<{repr(self.__geom)}>"
 
     def __str__(self) -> str:
-        return self.wkt
+        return self.geom.wkt
 
     def to_geo_json(self) -> dict[str, Any]:
         return mapping(self.geom)
@@ -134,34 +213,111 @@ class Geometry:
                 f"allowed_types contains invalid value {repr(type_)} (allowed: {_GEOMETRY_TYPES})"
             )
 
-        return cls(shape(value))
+        return cls(_shape(value))
+
+    @classmethod
+    def from_wkb(cls, value: Any) -> "Geometry":
+        # Accepts WKB or EWKB as `bytes`, as any other buffer (`bytearray`, `memoryview`, a
+        # `pyarrow.Buffer`, ...), or as a hex string. GEOS only reads `bytes` or `str`, so other
+        # buffers are copied exactly once.
+        geom = shapely.from_wkb(_wkb_bytes_or_hex(value))
+
+        if geom.geom_type not in _GEOMETRY_TYPES:
+            raise ValueError(
+                f"geometry type not allowed: {repr(geom.geom_type)} (allowed: {_GEOMETRY_TYPES})"
+            )
+
+        return cls(geom)
+
+    @classmethod
+    def from_geo_json_text(cls, value: str | bytes) -> "Geometry":
+        # Parses with pydantic-core's native JSON parser, which together with `_shape` measures
+        # about twice as fast as GEOS' own GeoJSON reader (`shapely.from_geojson`).
+        if not _is_geo_json_text(value):
+            raise TypeError(
+                f"value must be a JSON object as `str` or `bytes`; but {repr(value)[:100]} isn't"
+            )
+
+        return cls.from_geo_json(from_json(value))
+
+    @classmethod
+    def lazy(cls, value: Any) -> "Geometry":
+        # Only the geometry type is read from `value`, which is kept as-is. Malformed coordinates
+        # aren't detected until `geom` is accessed.
+        geometry = cls.__new__(cls)
+        geometry.__geom = None
+        geometry.__geom_type = _read_geometry_type(value)
+        geometry.__raw = value
+        geometry.__bounds = None
+        return geometry
+
+    def to_geo_json_bytes(self) -> bytes:
+        return shapely.to_geojson(self.geom).encode()
+
+    def to_wkb(self) -> bytes:
+        return shapely.to_wkb(self.geom)
+
+    def to_wkt(self) -> str:
+        return shapely.to_wkt(self.geom, rounding_precision=-1)
+
+    @classmethod
+    def serialize_many(
+        cls,
+        geometries: Sequence["Geometry"],
+        geometry_format: Optional[str] = None,
+        mode: str = "python",
+    ) -> list[Any]:
+        # Serializes geometries in one of `GEOMETRY_FORMATS`, converting all the ones that need
+        # GEOS in a single vectorized shapely call. With no format, lazy geometries serialize
+        # their raw input untouched (in JSON mode, as GeoJSON) and eager ones as GeoJSON.
+        if geometry_format is not None and geometry_format not in GEOMETRY_FORMATS:
+            raise ValueError(
+                f"invalid geometry format {repr(geometry_format)} (allowed: {GEOMETRY_FORMATS})"
+            )
+        json_mode = mode == "json"
+        result = [None] * len(geometries)
+        pending = []
+        for i, geometry in enumerate(geometries):
+            if geometry.__raw is not None:
+                result[i] = _serialize_raw(geometry.__raw, geometry_format, json_mode)
+            if result[i] is None:
+                pending.append(i)
+        if pending:
+            geoms = np.empty(len(pending), dtype=object)
+            geoms[:] = [geometries[i].geom for i in pending]
+            values = _serialize_geoms(geoms, geometry_format or "geo_json", json_mode)
+            for i, value in zip(pending, values):
+                result[i] = value
+        return result
+
+    def _serialize(self, info: SerializationInfo) -> Any:
+        context = info.context or {}
+        return Geometry.serialize_many(
+            [self], context.get("geometry_format"), info.mode
+        )[0]
 
     @classmethod
     def __get_pydantic_core_schema__(
         cls, _source_type: Any, _handler: GetCoreSchemaHandler
     ) -> core_schema.CoreSchema:
         def validator(value: Any, info: ValidationInfo) -> Geometry:
+            context = info.context or {}
             try:
-                return cls.from_geo_json(value)
+                if context.get("lazy_geometry"):
+                    return cls.lazy(value)
+                elif isinstance(value, dict):
+                    return cls.from_geo_json(value)
+                elif _is_geo_json_text(value):
+                    return cls.from_geo_json_text(value)
+                else:
+                    return cls.from_wkb(value)
             except Exception as e:
-                context = info.context or {}
-                loc = context.get("loc_prefix", ()) + ("value",)
-                raise ValidationError.from_exception_data(
-                    title=cls.__name__,
-                    line_errors=[
-                        InitErrorDetails(
-                            type="value_error",
-                            loc=loc,
-                            input=value,
-                            ctx={"error": f"invalid geometry value: {str(e)}"},
-                        )
-                    ],
-                )
+                raise _geometry_error("geometry_invalid", error=str(e))
 
         return core_schema.with_info_plain_validator_function(
-            validator,
+            instrumented(Geometry.__name__, validator),
             serialization=core_schema.plain_serializer_function_ser_schema(
-                lambda v: v.to_geojson()
+                lambda v, info: v._serialize(info), info_arg=True
             ),
         )
 
@@ -172,6 +328,383 @@ class Geometry:
         return _ALL_GEOMETRY_ALLOWED.__get_pydantic_json_schema__(core_schema, handler)
 
 
+def _geometry_error(error_type: str, **context: Any) -> PydanticCustomError:
+    return PydanticCustomError(error_type, GEOMETRY_ERROR_MESSAGES[error_type], context)
+
+
+########################################################################
+# Building shapely geometries from GeoJSON
+########################################################################
+
+
+def _shape(value: dict[str, Any]) -> BaseGeometry:
+    # Like `shapely.geometry.shape`, but converts each coordinate array to numpy in one call and
+    # builds geometries with shapely's vectorized constructors, rather than walking the coordinates
+    # one position at a time in Python. Empty geometries, and anything else the fast path can't
+    # build (such as a polygon with an empty hole), are left to `shape` itself.
+    geometry_type = value.get("type")
+    if geometry_type == "GeometryCollection":
+        geometries = value["geometries"]
+        if not isinstance(geometries, (list, tuple)):
+            raise ValueError("invalid geometries: expected an array of geometries")
+        parts = []
+        for geometry in geometries:
+            if (
+                not isinstance(geometry, dict)
+                or geometry.get("type") not in _GEOMETRY_TYPES
+            ):
+                raise ValueError("invalid geometries: expected an array of geometries")
+            parts.append(_shape(geometry))
+        return shapely.geometrycollections(parts)
+
+    if geometry_type not in _GEOMETRY_TYPES:
+        raise ValueError(
+            f"invalid geometry type {repr(geometry_type)} (allowed: {_GEOMETRY_TYPES})"
+        )
+
+    coordinates = value["coordinates"]
+    if _is_empty(coordinates):
+        return shape(value)
+    try:
+        return _shape_coordinates(geometry_type, coordinates)
+    except (TypeError, ValueError):
+        return shape(value)
+
+
+def _shape_coordinates(geometry_type: str, coordinates: Any) -> BaseGeometry:
+    match geometry_type:
+        case "Point":
+            return shapely.points(_positions(coordinates, 1))
+        case "LineString":
+            return shapely.linestrings(_positions(coordinates, 2))
+        case "Polygon":
+            return _polygon(coordinates)
+        case "MultiPoint":
+            return shapely.multipoints(_positions(coordinates, 2))
+        case "MultiLineString":
+            return shapely.multilinestrings(
+                [shapely.linestrings(_positions(c, 2)) for c in _parts(coordinates)]
+            )
+        case "MultiPolygon":
+            return shapely.multipolygons([_polygon(c) for c in _parts(coordinates)])
+
+
+def _is_empty(coordinates: Any) -> bool:
+    # What `shape` builds an empty geometry for: no coordinates, or arrays of only empty arrays.
+    if coordinates is None:
+        return True
+    if isinstance(coordinates, (list, tuple)):
+        return all(map(_is_empty, coordinates))
+    return False
+
+
+def _positions(coordinates: Any, ndim: int) -> np.ndarray:
+    # A position (`ndim=1`) or an array of positions (`ndim=2`), each with 2 or 3 coordinates.
+    positions = np.asarray(coordinates, dtype=float)
+    if positions.ndim != ndim or positions.shape[-1] not in (2, 3):
+        raise ValueError(
+            f"invalid coordinates: expected {'a position' if ndim == 1 else 'an array of positions'}"
+        )
+    return positions
+
+
+def _parts(coordinates: Any) -> list:
+    # Tuples are accepted like `shape` does, since that's what `mapping` produces.
+    if not isinstance(coordinates, (list, tuple)) or not coordinates:
+        raise ValueError("invalid coordinates: expected a non-empty array")
+    return coordinates
+
+
+def _polygon(coordinates: Any) -> BaseGeometry:
+    shell, *holes = [shapely.linearrings(_positions(c, 2)) for c in _parts(coordinates)]
+    return shapely.polygons(shell, holes or None)
+
+
+########################################################################
+# Reading raw geometry values
+########################################################################
+
+# WKB geometry type codes. ISO WKB adds 1000, 2000 or 3000 for Z, M and ZM; EWKB sets high flag
+# bits instead.
+_WKB_GEOMETRY_TYPES = {
+    1: "Point",
+    2: "LineString",
+    3: "Polygon",
+    4: "MultiPoint",
+    5: "MultiLineString",
+    6: "MultiPolygon",
+    7: "GeometryCollection",
+}
+
+_EWKB_FLAGS = 0xE0000000
+
+# Cheap match for the common case of a GeoJSON string whose first member is `"type"`.
+_GEO_JSON_TYPE_REGEX = re.compile(r'\s*\{\s*"type"\s*:\s*"([A-Za-z]+)"')
+
+_GEO_JSON_TYPE_PREFIX_LENGTH = 64
+
+# JSON text always starts with `{`, which is neither a hex digit nor a WKB byte order marker.
+_JSON_OBJECT_START_REGEX = re.compile(r"\s*\{")
+
+_JSON_OBJECT_START_BYTES_REGEX = re.compile(rb"\s*\{")
+
+
+def _is_geo_json_text(value: Any) -> bool:
+    if isinstance(value, str):
+        return _JSON_OBJECT_START_REGEX.match(value) is not None
+    elif isinstance(value, bytes):
+        return _JSON_OBJECT_START_BYTES_REGEX.match(value) is not None
+    else:
+        return False
+
+
+def _wkb_bytes_or_hex(value: Any) -> bytes | str:
+    if isinstance(value, (bytes, str)):
+        return value
+    try:
+        return bytes(memoryview(value))
+    except TypeError:
+        raise _wkb_type_error(value) from None
+
+
+def _wkb_header(value: Any) -> bytes:
+    # The byte order marker and geometry type code at the start of WKB, without copying the rest
+    # of a buffer.
+    if isinstance(value, str):
+        return bytes.fromhex(value[:10])
+    try:
+        view = memoryview(value)
+    except TypeError:
+        raise _wkb_type_error(value) from None
+    if not view.c_contiguous:
+        return bytes(view)[:5]
+    return bytes(view.cast("B")[:5])
+
+
+def _wkb_type_error(value: Any) -> TypeError:
+    return TypeError(
+        f"value must be WKB bytes, a buffer, or a hex string; but {repr(value)} has type {type(value).__name__}"
+    )
+
+
+def _parse_geometry(value: Any) -> BaseGeometry:
+    if isinstance(value, dict):
+        return _shape(value)
+    elif _is_geo_json_text(value):
+        return _shape(from_json(value))
+    else:
+        return shapely.from_wkb(_wkb_bytes_or_hex(value))
+
+
+def _read_geometry_type(value: Any) -> str:
+    if isinstance(value, dict):
+        geometry_type = value.get("type")
+    elif _is_geo_json_text(value):
+        prefix = value[:_GEO_JSON_TYPE_PREFIX_LENGTH]
+        if isinstance(prefix, bytes):
+            prefix = prefix.decode(errors="replace")
+        match = _GEO_JSON_TYPE_REGEX.match(prefix)
+        if match:
+            geometry_type = match.group(1)
+        else:
+            geometry_type = from_json(value).get("type")
+    else:
+        header = _wkb_header(value)
+        if len(header) < 5 or header[0] not in (0, 1):
+            raise ValueError("invalid WKB header")
+        code = int.from_bytes(header[1:5], "little" if header[0] else "big")
+        geometry_type = _WKB_GEOMETRY_TYPES.get((code & ~_EWKB_FLAGS) % 1000)
+
+    if geometry_type not in _GEOMETRY_TYPES:
+        raise ValueError(
+            f"geometry type not allowed: {repr(geometry_type)} (allowed: {_GEOMETRY_TYPES})"
+        )
+
+    return geometry_type
+
+
+########################################################################
+# Serializing geometry
+########################################################################
+
+
+def _serialize_raw(raw: Any, geometry_format: Optional[str], json_mode: bool) -> Any:
+    # Serializes the raw input of a lazy geometry without GEOS if it's already in the requested
+    # format, or returns `None` if it isn't.
+    if isinstance(raw, dict):
+        raw_format = "geo_json"
+    elif _is_geo_json_text(raw):
+        raw_format = "geo_json_bytes"
+    else:
+        raw_format = "wkb"
+
+    if geometry_format is None:
+        if not json_mode:
+            return raw
+        geometry_format = "geo_json"
+
+    match (raw_format, geometry_format):
+        case ("geo_json", "geo_json"):
+            return raw
+        case ("geo_json_bytes", "geo_json"):
+            return from_json(raw)
+        case ("geo_json_bytes", "geo_json_bytes"):
+            if json_mode:
+                return from_json(raw)
+            return raw if isinstance(raw, bytes) else raw.encode()
+        case ("wkb", "wkb"):
+            if isinstance(raw, str):
+                return raw if json_mode else bytes.fromhex(raw)
+            raw = raw if isinstance(raw, bytes) else bytes(memoryview(raw))
+            return raw.hex() if json_mode else raw
+        case _:
+            return None
+
+
+def _serialize_geoms(
+    geoms: np.ndarray, geometry_format: str, json_mode: bool
+) -> list[Any]:
+    match geometry_format:
+        case "geo_json" if not json_mode:
+            # Measured faster than parsing `shapely.to_geojson` output for all but tiny geometries.
+            return [mapping(geom) for geom in geoms]
+        case "geo_json" | "geo_json_bytes" if json_mode:
+            # `mapping` returns coordinate tuples, but JSON mode needs plain lists.
+            return [from_json(text) for text in shapely.to_geojson(geoms)]
+        case "geo_json_bytes":
+            return [text.encode() for text in shapely.to_geojson(geoms)]
+        case "wkb" if json_mode:
+            # GEOS' own hex writer (`hex=True`) measured about 5x slower than `bytes.hex`.
+            return [wkb.hex() for wkb in shapely.to_wkb(geoms)]
+        case "wkb":
+            return list(shapely.to_wkb(geoms))
+        case "wkt":
+            return list(shapely.to_wkt(geoms, rounding_precision=-1))
+
+
+########################################################################
+# Splitting raw geometry out of feature JSON
+########################################################################
+
+_GEOMETRY_MEMBER_REGEXES = {
+    str: re.compile(r'"geometry"\s*:\s*(?=\{)'),
+    bytes: re.compile(rb'"geometry"\s*:\s*(?=\{)'),
+}
+
+_STRUCTURAL_CHARACTERS = {str: ("{", "}", '"', "\\"), bytes: (b"{", b"}", b'"', b"\\")}
+
+# Stands in for the geometry while the rest of the feature is parsed. It contains NUL characters,
+# which real data can only contain escaped, so a placeholder found at the top level is ours.
+_RAW_GEOMETRY_PLACEHOLDER = "\0raw geometry\0"
+
+_RAW_GEOMETRY_PLACEHOLDER_JSON = {
+    str: r'"\u0000raw geometry\u0000"',
+    bytes: rb'"\u0000raw geometry\u0000"',
+}
+
+# Below these sizes, splitting the geometry out of a feature's JSON text costs more than it saves,
+# and pydantic validates the whole feature from JSON faster. Lazy geometry pays off sooner, since
+# its coordinates are then never parsed at all. See `benchmarks/geometry_json.py`.
+_RAW_GEOMETRY_MIN_SIZE = 8192
+
+_LAZY_RAW_GEOMETRY_MIN_SIZE = 2048
+
+
+def use_raw_geometry(
+    json_data: str | bytes | bytearray, context: Optional[dict[str, Any]]
+) -> bool:
+    # Whether `parse_json_with_raw_geometry` is worth it for the JSON text of a feature.
+    if context is not None and context.get("lazy_geometry"):
+        return len(json_data) >= _LAZY_RAW_GEOMETRY_MIN_SIZE
+    return len(json_data) >= _RAW_GEOMETRY_MIN_SIZE
+
+
+def parse_json_with_raw_geometry(json_data: str | bytes | bytearray) -> Any:
+    # Parses the JSON text of a feature, except that the top-level `"geometry"` object is left as
+    # a slice of the raw text, which `Geometry` hands straight to GEOS. If the text can't be split
+    # that way, the whole document is parsed as usual.
+    if isinstance(json_data, bytearray):
+        json_data = bytes(json_data)
+    text_type = type(json_data)
+
+    match = _GEOMETRY_MEMBER_REGEXES[text_type].search(json_data)
+    if match is None:
+        return from_json(json_data)
+
+    start = match.end()
+    end = _find_object_end(json_data, start)
+    if end is None:
+        return from_json(json_data)
+
+    try:
+        value = from_json(
+            json_data[:start]
+            + _RAW_GEOMETRY_PLACEHOLDER_JSON[text_type]
+            + json_data[end:]
+        )
+    except ValueError:
+        return from_json(json_data)
+
+    # The first `"geometry"` member found may have been nested, e.g. inside `properties`.
+    if (
+        not isinstance(value, dict)
+        or value.get("geometry") != _RAW_GEOMETRY_PLACEHOLDER
+    ):
+        return from_json(json_data)
+
+    value["geometry"] = json_data[start:end]
+    return value
+
+
+def _find_object_end(json_data: str | bytes, start: int) -> Optional[int]:
+    # Returns the end of the JSON object starting at `start`. Geometry objects have very few
+    # braces and strings, and none inside coordinate arrays, so jumping between them with `find`
+    # skips the coordinates at C speed. The next position of each character is only searched
+    # for again once it has been passed, so each character is scanned for at most once.
+    open_brace, close_brace, quote, backslash = _STRUCTURAL_CHARACTERS[type(json_data)]
+    next_open = json_data.find(open_brace, start)
+    next_close = json_data.find(close_brace, start)
+    next_quote = json_data.find(quote, start)
+    depth = 0
+    while next_close != -1:
+        if (
+            next_quote != -1
+            and next_quote < next_close
+            and (next_open == -1 or next_quote < next_open)
+        ):
+            # Skip the string, including any braces in it.
+            end_quote = json_data.find(quote, next_quote + 1)
+            while end_quote != -1 and _is_escaped(json_data, end_quote, backslash):
+                end_quote = json_data.find(quote, end_quote + 1)
+            if end_quote == -1:
+                return None
+            position = end_quote + 1
+            if next_open != -1 and next_open < position:
+                next_open = json_data.find(open_brace, position)
+            if next_close < position:
+                next_close = json_data.find(close_brace, position)
+            next_quote = json_data.find(quote, position)
+        elif next_open != -1 and next_open < next_close:
+            depth += 1
+            next_open = json_data.find(open_brace, next_open + 1)
+        else:
+            depth -= 1
+            if depth == 0:
+                return next_close + 1
+            next_close = json_data.find(close_brace, next_close + 1)
+    return None
+
+
+def _is_escaped(json_data: str | bytes, position: int, backslash: str | bytes) -> bool:
+    num_backslashes = 0
+    while (
+        json_data[position - num_backslashes - 1 : position - num_backslashes]
+        == backslash
+    ):
+        num_backslashes += 1
+    return num_backslashes % 2 == 1
+
+
 ########################################################################
 # JSON Schema primitives for GeoJSON geometry
 ########################################################################
@@ -290,14 +823,14 @@ _MULTI_POLYGON_GEOMETRY_JSON_SCHEMA = geometry_json_schema(
 _GEOMETRY_COLLECTION_JSON_SCHEMA = geometry_json_schema(
     "GeometryCollection",
     geometries={
-        "oneOf": (
+        "oneOf": [
             _LINE_STRING_GEOMETRY_JSON_SCHEMA,
             _POINT_GEOMETRY_JSON_SCHEMA,
             _POLYGON_GEOMETRY_JSON_SCHEMA,
             _MULTI_LINE_STRING_GEOMETRY_JSON_SCHEMA,
             _MULTI_POINT_GEOMETRY_JSON_SCHEMA,
             _MULTI_POLYGON_GEOMETRY_JSON_SCHEMA,
-        )
+        ]
     },
 )
 
@@ -314,3 +847,15 @@ _GEOMETRY_JSON_SCHEMA = {
     "MultiPoint": _MULTI_POINT_GEOMETRY_JSON_SCHEMA,
     "MultiPolygon": _MULTI_POLYGON_GEOMETRY_JSON_SCHEMA,
 }
+
+# Names for the sub-schemas above, for sharing them through `$defs` (see `json_schema.py`).
+_NAMED_GEOMETRY_JSON_SCHEMAS = {
+    "GeoJSONBBox": _BBOX_JSON_SCHEMA,
+    "GeoJSONPosition": _POINT_COORDINATES_JSON_SCHEMA,
+    "GeoJSONLineStringCoordinates": _LINE_STRING_COORDINATES_JSON_SCHEMA,
+    "GeoJSONMultiLineStringCoordinates": _MULTI_LINE_STRING_COORDINATES_JSON_SCHEMA,
+    "GeoJSONMultiPointCoordinates": _MULTI_POINT_COORDINATES_JSON_SCHEMA,
+    "GeoJSONLinearRingCoordinates": _LINEAR_RING_COORDINATES_JSON_SCHEMA,
+    "GeoJSONPolygonCoordinates": _POLYGON_COORDINATES_JSON_SCHEMA,
+    "GeoJSONMultiPolygonCoordinates": _MULTI_POLYGON_COORDINATES_JSON_SCHEMA,
+} | {f"GeoJSON{name}": schema for name, schema in _GEOMETRY_JSON_SCHEMA.items()}
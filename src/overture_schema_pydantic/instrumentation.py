@@ -0,0 +1,113 @@
+import functools
+import threading
+import time
+from typing import Any, Callable, TypeVar
+
+from pydantic import ValidationInfo
+
+
+_Validator = TypeVar("_Validator", bound=Callable[[Any, ValidationInfo], Any])
+
+
+class Instrumentation:
+    """
+    Call counts, cumulative time and failure counts of the Python-side validators.
+
+    Validation is instrumented by passing an instance as the `"instrumentation"` validation
+    context key, e.g. `Division.model_validate(value, context={"instrumentation": metrics})`.
+    Measurements are kept per validator and per model and field that it validated, as reported
+    by pydantic (the class name of the model being validated and the name of its field, so every
+    list item or dict value of a field counts towards that field). Without the context key,
+    validators only pay for one dict lookup. An instance can be shared between threads.
+    """
+
+    def __init__(self):
+        self.__lock = threading.Lock()
+        # [calls, failures, seconds] by (validator, model, field).
+        self.__stats: dict[tuple[str, str, str], list] = {}
+
+    def call(
+        self,
+        validator: str,
+        func: Callable[[Any, ValidationInfo], Any],
+        value: Any,
+        info: ValidationInfo,
+    ) -> Any:
+        config = info.config or {}
+        key = (validator, config.get("title") or "", info.field_name or "")
+        failed = True
+        start = time.perf_counter()
+        try:
+            result = func(value, info)
+            failed = False
+            return result
+        finally:
+            seconds = time.perf_counter() - start
+            with self.__lock:
+                stats = self.__stats.get(key)
+                if stats is None:
+                    stats = self.__stats[key] = [0, 0, 0.0]
+                stats[0] += 1
+                stats[1] += failed
+                stats[2] += seconds
+
+    def reset(self):
+        with self.__lock:
+            self.__stats.clear()
+
+    def to_dict(self) -> dict[str, dict[str, dict[str, dict[str, Any]]]]:
+        # Measurements by validator, model and field, e.g.
+        # `{"Geometry": {"Division": {"geometry": {"calls": 2, "failures": 0, "seconds": 1e-05}}}}`.
+        result: dict = {}
+        for (validator, model, field), (calls, failures, seconds) in self.__snapshot():
+            result.setdefault(validator, {}).setdefault(model, {})[field] = {
+                "calls": calls,
+                "failures": failures,
+                "seconds": seconds,
+            }
+        return result
+
+    def to_prometheus(self, prefix: str = "overture_schema_validator") -> str:
+        # The measurements as counters in the Prometheus text exposition format.
+        snapshot = self.__snapshot()
+        lines = []
+        for i, (name, help) in enumerate(
+            (
+                ("calls_total", "Validator calls."),
+                ("failures_total", "Validator calls that raised an error."),
+                ("seconds_total", "Time spent in validator calls."),
+            )
+        ):
+            metric = f"{prefix}_{name}"
+            lines.append(f"# HELP {metric} {help}")
+            lines.append(f"# TYPE {metric} counter")
+            for key, stats in snapshot:
+                labels = ",".join(
+                    f'{label}="{_escape_label_value(value)}"'
+                    for label, value in zip(("validator", "model", "field"), key)
+                )
+                lines.append(f"{metric}{{{labels}}} {stats[i]}")
+        return "\n".join(lines) + "\n"
+
+    def __snapshot(self) -> list[tuple[tuple[str, str, str], tuple[int, int, float]]]:
+        with self.__lock:
+            return [(key, tuple(stats)) for key, stats in self.__stats.items()]
+
+
+def instrumented(validator: str, func: _Validator) -> _Validator:
+    # Wraps a `(value, info)` validator function so that it's measured under the name `validator`
+    # when validation is instrumented. Every Python-side validator in a core schema should be
+    # wrapped this way.
+    @functools.wraps(func)
+    def wrapper(value: Any, info: ValidationInfo) -> Any:
+        context = info.context
+        instrumentation = context.get("instrumentation") if context else None
+        if instrumentation is None:
+            return func(value, info)
+        return instrumentation.call(validator, func, value, info)
+
+    return wrapper
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,159 @@
+from overture_schema_pydantic.feature import Feature
+from overture_schema_pydantic.geometry import _NAMED_GEOMETRY_JSON_SCHEMAS
+from overture_schema_pydantic.registry import default_registry
+
+import hashlib
+import importlib.metadata
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from pydantic.json_schema import models_json_schema
+
+
+JSON_SCHEMA_DIALECT = "https://json-schema.org/draft/2020-12/schema"
+
+
+def schema_bundle(
+    models: Optional[Iterable[type[Feature]]] = None,
+    cache_dir: Optional[str | os.PathLike] = None,
+) -> dict[str, Any]:
+    """
+    Build one JSON Schema for several feature types, with every shared sub-schema in `$defs`.
+
+    The bundle matches any of the feature types. Each feature type is defined once under its
+    class name, and models and GeoJSON geometry sub-schemas that several of them use are defined
+    once and referenced with `$ref`. `models` defaults to every feature type in the default
+    registry. If `cache_dir` is given, the bundle is read from, or else written to, a file there
+    named after `schema_fingerprint(models)`.
+    """
+    return json.loads(schema_bundle_json(models, cache_dir))
+
+
+def schema_bundle_json(
+    models: Optional[Iterable[type[Feature]]] = None,
+    cache_dir: Optional[str | os.PathLike] = None,
+) -> str:
+    # Like `schema_bundle`, but returns the JSON text, which is what's cached.
+    if models is None:
+        models = default_registry().models
+    models = _sorted_models(models)
+    if cache_dir is None:
+        return _dump(_build_bundle(models))
+
+    path = Path(cache_dir) / f"schema-bundle-{schema_fingerprint(models)}.json"
+    try:
+        return path.read_text()
+    except FileNotFoundError:
+        pass
+    text = _dump(_build_bundle(models))
+    # Write to a temporary file first so concurrent readers never see a partial bundle.
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+    return text
+
+
+def schema_fingerprint(models: Iterable[type[Feature]]) -> str:
+    # Identifies everything the bundle is generated from without generating it: the models'
+    # names, the source of this package and of every module defining the models or a class they
+    # inherit from, and the versions of this package and pydantic.
+    models = _sorted_models(models)
+    digest = hashlib.sha256()
+    for name in ("overture-schema-pydantic", "pydantic"):
+        digest.update(f"{name}={_version(name)}\n".encode())
+    source_files = {p.resolve() for p in Path(__file__).parent.glob("**/*.py")}
+    for model in models:
+        digest.update(f"{model.__module__}:{model.__qualname__}\n".encode())
+        for cls in model.__mro__:
+            source_file = getattr(sys.modules.get(cls.__module__), "__file__", None)
+            if source_file is not None and source_file.endswith(".py"):
+                source_files.add(Path(source_file).resolve())
+    for source_file in sorted(source_files):
+        digest.update(source_file.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _sorted_models(models: Iterable[type[Feature]]) -> tuple[type[Feature], ...]:
+    return tuple(sorted(set(models), key=lambda m: (m.__module__, m.__qualname__)))
+
+
+def _version(distribution: str) -> str:
+    try:
+        return importlib.metadata.version(distribution)
+    except importlib.metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def _dump(bundle: dict[str, Any]) -> str:
+    return json.dumps(bundle, separators=(",", ":"))
+
+
+########################################################################
+# Building the bundle
+########################################################################
+
+
+def _build_bundle(models: tuple[type[Feature], ...]) -> dict[str, Any]:
+    if not models:
+        raise ValueError("models is empty (it must contain at least one feature type)")
+    refs, top_level = models_json_schema(
+        [(model, "validation") for model in models],
+        ref_template="#/$defs/{model}",
+    )
+    defs = top_level.get("$defs", {})
+
+    # Pydantic shares model definitions, but inlines the GeoJSON geometry sub-schemas wherever
+    # they're used. Hoist each of them into `$defs` as well.
+    named = {
+        _canonical(schema): name
+        for name, schema in _NAMED_GEOMETRY_JSON_SCHEMAS.items()
+    }
+    hoisted: dict[str, Any] = {}
+    defs = {name: _hoist(schema, named, hoisted, None) for name, schema in defs.items()}
+    defs.update(hoisted)
+
+    # `anyOf` rather than `oneOf`: a generic feature type matches everything a more specific one
+    # does, and a record matching several feature types is still valid.
+    return {
+        "$schema": JSON_SCHEMA_DIALECT,
+        "anyOf": [refs[(model, "validation")] for model in models],
+        "$defs": dict(sorted(defs.items())),
+    }
+
+
+def _hoist(
+    node: Any, named: dict[str, str], hoisted: dict[str, Any], skip: Optional[str]
+) -> Any:
+    # Replaces every sub-schema of `node` that is equal to a named schema with a `$ref` to it,
+    # adding its definition to `hoisted`. `skip` is the name of the definition being built, which
+    # mustn't be replaced by a reference to itself.
+    if isinstance(node, dict):
+        # Pydantic titles field schemas after the field, so titles are kept beside the `$ref`.
+        untitled = {k: v for k, v in node.items() if k != "title"}
+        name = named.get(_canonical(untitled))
+        if name is not None and name != skip:
+            if name not in hoisted:
+                hoisted[name] = None  # Reserved while the definition itself is hoisted.
+                hoisted[name] = _hoist(untitled, named, hoisted, name)
+            return {"$ref": f"#/$defs/{name}"} | (
+                {"title": node["title"]} if "title" in node else {}
+            )
+        return {k: _hoist(v, named, hoisted, None) for k, v in node.items()}
+    elif isinstance(node, (list, tuple)):
+        return [_hoist(v, named, hoisted, None) for v in node]
+    else:
+        return node
+
+
+def _canonical(node: Any) -> str:
+    return json.dumps(node, sort_keys=True, separators=(",", ":"))
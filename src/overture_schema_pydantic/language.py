@@ -1,4 +1,5 @@
 import re
+import sys
 
 from pydantic_core import core_schema
 
@@ -6,19 +7,76 @@ BCP_47_REGEX = re.compile(
     r"^(?:(?:[A-Za-z]{2,3}(?:-[A-Za-z]{3}){0,3}?)|(?:[A-Za-z]{4,8}))(?:-[A-Za-z]{4})?(?:-[A-Za-z]{2}|[0-9]{3})?(?:-(?:[A-Za-z0-9]{5,8}|[0-9][A-Za-z0-9]{3}))*(?:-[A-WY-Za-wy-z0-9](?:-[A-Za-z0-9]{2,8})+)*$"
 )
 
+# Real data uses a few hundred distinct language tags across billions of names: these are the
+# ISO 639-1 languages, plus the script, region and variant subtags that are frequent in names.
+# `InternedLanguageTag` validates a tag found here to the interned table entry, so equal tags share
+# one `str` object rather than each keeping a copy.
+COMMON_LANGUAGE_TAGS = tuple(
+    sys.intern(tag)
+    for tag in (
+        # ISO 639-1
+        *"aa ab ae af ak am an ar as av ay az ba be bg bh bi bm bn bo br bs ca ce ch co cr cs cu cv"
+        " cy da de dv dz ee el en eo es et eu fa ff fi fj fo fr fy ga gd gl gn gu gv ha he hi ho hr"
+        " ht hu hy hz ia id ie ig ii ik io is it iu ja jv ka kg ki kj kk kl km kn ko kr ks ku kv kw"
+        " ky la lb lg li ln lo lt lu lv mg mh mi mk ml mn mr ms mt my na nb nd ne ng nl nn no nr nv"
+        " ny oc oj om or os pa pi pl ps pt qu rm rn ro ru rw sa sc sd se sg si sk sl sm sn so sq sr"
+        " ss st su sv sw ta te tg th ti tk tl tn to tr ts tt tw ty ug uk ur uz ve vi vo wa wo xh yi"
+        " yo za zh zu".split(),
+        # Common ISO 639-3 languages without a two-letter code
+        *"ast bar ceb ckb cnr crh dsb fil frp fur gsw hak hsb kab kbd lad lij lmo mdf mhr mrj mzn"
+        " nan nds pam pap pms rue sah scn sco sma smn sms szl tzm udm vec wuu yue".split(),
+        # Script, region and variant subtags
+        *"ar-Latn az-Cyrl be-Latn be-tarask bs-Cyrl de-AT de-CH en-AU en-CA en-GB en-IN en-US"
+        " es-ES es-MX fr-CA fr-CH ja-Hira ja-Kana ja-Latn ka-Latn kk-Latn ko-Latn ku-Arab ky-Latn"
+        " mn-Mong pa-Arab pt-BR pt-PT ru-Latn sr-Cyrl sr-Latn tt-Latn ug-Latn uk-Latn uz-Cyrl"
+        " uz-Latn zh-CN zh-HK zh-Hans zh-Hant zh-Latn zh-Latn-pinyin zh-TW".split(),
+    )
+)
+
+_LANGUAGE_TAG_STR_SCHEMA = core_schema.str_schema(
+    min_length=2,
+    pattern=BCP_47_REGEX.pattern,
+)
+
 
 class LanguageTag(str):
     @classmethod
     def __get_pydantic_core_schema__(cls, _source, handler):
-        return core_schema.str_schema(
-            min_length=2,
-            pattern=BCP_47_REGEX.pattern,
-        )
+        return _LANGUAGE_TAG_STR_SCHEMA
 
     @classmethod
     def __get_pydantic_json_schema__(cls, core_schema, handler):
-        schema = handler(core_schema)
+        schema = handler(_LANGUAGE_TAG_STR_SCHEMA)
         schema.update(
             description="BCP-47 language tag", examples=["en", "en-US", "zh-Hant"]
         )
         return schema
+
+
+class InternedLanguageTag(LanguageTag):
+    """
+    A `LanguageTag` that validates the tags in `COMMON_LANGUAGE_TAGS` to the interned table
+    entries, for keeping many validated names in memory.
+
+    The table lookup saves memory, not time: pydantic-core's regex is faster than the lookup, so
+    validation is somewhat slower than with `LanguageTag` (see `benchmarks/language_tag.py`).
+    """
+
+    @classmethod
+    def __get_pydantic_core_schema__(cls, _source, handler):
+        # The type and length are checked first, so that only a string that fails both choices
+        # is reported as a single pattern mismatch, as if there were only the regex.
+        return core_schema.chain_schema(
+            [
+                core_schema.str_schema(min_length=2),
+                core_schema.union_schema(
+                    [
+                        core_schema.literal_schema(list(COMMON_LANGUAGE_TAGS)),
+                        core_schema.str_schema(pattern=BCP_47_REGEX.pattern),
+                    ],
+                    mode="left_to_right",
+                    custom_error_type="string_pattern_mismatch",
+                    custom_error_context={"pattern": BCP_47_REGEX.pattern},
+                ),
+            ]
+        )
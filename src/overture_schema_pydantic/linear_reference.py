@@ -0,0 +1,298 @@
+from overture_schema_pydantic.scoping import Heading
+
+from typing import Iterable, Optional
+
+import numpy as np
+from numpy.typing import ArrayLike
+from pydantic import BaseModel
+
+
+class LinearReferenceIndex:
+    """
+    An index of `@scoped` values by where they apply along a geometry, for finding the values
+    that apply at positions or over ranges of positions.
+
+    A value applies over its `between` range, at its `at` point, or, if it has neither, along the
+    whole geometry. Ranges are closed, so a value whose range ends where another's starts applies
+    at both ends. A value whose `when.heading` is set only applies in that heading.
+
+    The values are kept in a centered interval tree over the distinct range ends and points: each
+    value is stored once, at the highest node whose center it contains, sorted there by start and
+    by end. Building it takes O(n log n) time and O(n) memory for n values, however their ranges
+    nest or overlap. A query follows one path down the tree with a binary search at each node, so
+    it takes O(log² n) time plus the time to list what it finds. Queries are vectorized over
+    arrays of positions, and results list values in input order.
+    """
+
+    def __init__(self, values: Iterable[BaseModel]):
+        self.__values = list(values)
+        starts = np.empty(len(self.__values))
+        ends = np.empty(len(self.__values))
+        headings = []
+        for i, value in enumerate(self.__values):
+            starts[i], ends[i] = _extent(value)
+            headings.append(getattr(getattr(value, "when", None), "heading", None))
+        self.__starts = starts
+        self.__ends = ends
+        self.__headings = headings
+        self.__trees: dict[Optional[Heading], _IntervalTree] = {}
+
+    @property
+    def values(self) -> list[BaseModel]:
+        return list(self.__values)
+
+    def __len__(self) -> int:
+        return len(self.__values)
+
+    def at(
+        self, positions: ArrayLike, heading: Optional[Heading | str] = None
+    ) -> list[list[BaseModel]]:
+        # The values that apply at each position, in heading `heading` if it's given.
+        return self.__values_of(*self.at_indices(positions, heading))
+
+    def at_indices(
+        self, positions: ArrayLike, heading: Optional[Heading | str] = None
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # Like `at`, but as offsets and value indices: the values for the i-th position are
+        # those at `indices[offsets[i]:offsets[i + 1]]`.
+        positions = np.asarray(positions, dtype=float).ravel()
+        # Already grouped by position, in input order.
+        queries, indices = self.__tree_for(heading).stab(positions)
+        return _offsets(queries, len(positions)), indices
+
+    def between(
+        self,
+        starts: ArrayLike,
+        ends: ArrayLike,
+        heading: Optional[Heading | str] = None,
+    ) -> list[list[BaseModel]]:
+        # The values that apply anywhere in each closed range `[starts[i], ends[i]]`, in heading
+        # `heading` if it's given.
+        return self.__values_of(*self.between_indices(starts, ends, heading))
+
+    def between_indices(
+        self,
+        starts: ArrayLike,
+        ends: ArrayLike,
+        heading: Optional[Heading | str] = None,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # Like `between`, but as offsets and value indices, as returned by `at_indices`.
+        starts, ends = np.broadcast_arrays(
+            np.asarray(starts, dtype=float).ravel(),
+            np.asarray(ends, dtype=float).ravel(),
+        )
+        if np.any(starts > ends):
+            raise ValueError(
+                f"every range must start at or before its end; but {np.flatnonzero(starts > ends).tolist()} don't"
+            )
+        tree = self.__tree_for(heading)
+        # The values overlapping a range either contain its start or start inside it.
+        covering_queries, covering = tree.stab(starts)
+        starting_queries, starting = tree.starting(starts, ends)
+        return _group(
+            np.concatenate((covering_queries, starting_queries)),
+            np.concatenate((covering, starting)),
+            len(starts),
+        )
+
+    def __values_of(
+        self, offsets: np.ndarray, indices: np.ndarray
+    ) -> list[list[BaseModel]]:
+        values = self.__values
+        indices = indices.tolist()
+        return [
+            [values[i] for i in indices[start:stop]]
+            for start, stop in zip(offsets[:-1].tolist(), offsets[1:].tolist())
+        ]
+
+    def __tree_for(self, heading: Optional[Heading | str]) -> "_IntervalTree":
+        if heading is not None:
+            heading = Heading(heading)
+        tree = self.__trees.get(heading)
+        if tree is None:
+            if heading is None:
+                selected = np.arange(len(self.__values))
+            else:
+                # Values without a heading apply in both.
+                selected = np.array(
+                    [i for i, h in enumerate(self.__headings) if h in (None, heading)],
+                    dtype=np.int64,
+                )
+            tree = self.__trees[heading] = _IntervalTree(
+                self.__starts[selected], self.__ends[selected], selected
+            )
+        return tree
+
+
+class _IntervalTree:
+    # An implicit balanced binary search tree over the `m` distinct boundaries `b`: the node for
+    # indices `[lo, hi)` has center `b[(lo + hi) // 2]`, and is numbered by that index. A value
+    # with range `[b[i], b[j]]` is stored at the first node on its way down whose center index is
+    # in `[i, j]`.
+
+    __slots__ = (
+        "boundaries",
+        "node_offsets",
+        "by_start",
+        "start_keys",
+        "by_end",
+        "end_keys",
+        "sorted_starts",
+        "by_first_start",
+    )
+
+    def __init__(self, starts: np.ndarray, ends: np.ndarray, value_indices: np.ndarray):
+        self.boundaries = np.unique(np.concatenate((starts, ends)))
+        m = len(self.boundaries)
+        first = np.searchsorted(self.boundaries, starts)
+        last = np.searchsorted(self.boundaries, ends)
+        nodes = _nodes(first, last, m)
+        self.node_offsets = np.zeros(m + 1, dtype=np.int64)
+        np.cumsum(np.bincount(nodes, minlength=m), out=self.node_offsets[1:])
+        # The values of each node by ascending start and by descending end, with keys that sort
+        # the same way for binary search across all nodes at once.
+        start_keys = nodes * m + first
+        order = np.argsort(start_keys, kind="stable")
+        self.by_start, self.start_keys = value_indices[order], start_keys[order]
+        end_keys = nodes * m + (m - 1 - last)
+        order = np.argsort(end_keys, kind="stable")
+        self.by_end, self.end_keys = value_indices[order], end_keys[order]
+        # All values by start, for range queries.
+        order = np.argsort(starts, kind="stable")
+        self.sorted_starts, self.by_first_start = starts[order], value_indices[order]
+
+    def stab(self, positions: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        # Pairs of query number and index of a value containing the query's position. NaN
+        # positions sort after every boundary and are contained in no value.
+        below = np.searchsorted(self.boundaries, positions, side="left")
+        above = np.searchsorted(self.boundaries, positions, side="right")
+        # Positions at the same boundary, or between the same two, are contained in the same
+        # values, so the tree is only searched once for each.
+        _, first, inverse = np.unique(
+            below + above, return_index=True, return_inverse=True
+        )
+        offsets, indices = _group(
+            *self.__search(below[first], above[first]), len(first)
+        )
+        return _ranges(
+            np.arange(len(positions)), offsets[inverse], offsets[inverse + 1], indices
+        )
+
+    def __search(
+        self, below: np.ndarray, above: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # Like `stab`, but for positions given by where they sort among the boundaries, one tree
+        # level at a time.
+        m = len(self.boundaries)
+        lo = np.zeros(len(below), dtype=np.int64)
+        hi = np.full(len(below), m, dtype=np.int64)
+        active = np.arange(len(below)) if m else np.arange(0)
+        from_start: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        from_end: list[tuple[np.ndarray, np.ndarray, np.ndarray]] = []
+        while len(active):
+            node = (lo[active] + hi[active]) // 2
+            offset = self.node_offsets[node]
+            active_below, active_above = below[active], above[active]
+            at_center = (active_below <= node) & (node < active_above)
+            before = active_above <= node
+            after = ~at_center & ~before
+            # At the center, every value of the node contains the position. Before it, those
+            # that start at or before it do, and after it, those that end at or after it.
+            from_start.append(
+                (
+                    active[at_center],
+                    offset[at_center],
+                    self.node_offsets[node[at_center] + 1],
+                )
+            )
+            from_start.append(
+                (
+                    active[before],
+                    offset[before],
+                    np.searchsorted(
+                        self.start_keys, node[before] * m + active_above[before]
+                    ),
+                )
+            )
+            from_end.append(
+                (
+                    active[after],
+                    offset[after],
+                    np.searchsorted(
+                        self.end_keys, node[after] * m + (m - active_below[after])
+                    ),
+                )
+            )
+            hi[active[before]] = node[before]
+            lo[active[after]] = node[after] + 1
+            active = active[~at_center]
+            active = active[lo[active] < hi[active]]
+        queries, indices = [np.arange(0)], [np.arange(0)]
+        for parts, items in ((from_start, self.by_start), (from_end, self.by_end)):
+            for part in parts:
+                part_queries, part_indices = _ranges(*part, items)
+                queries.append(part_queries)
+                indices.append(part_indices)
+        return np.concatenate(queries), np.concatenate(indices)
+
+    def starting(
+        self, starts: np.ndarray, ends: np.ndarray
+    ) -> tuple[np.ndarray, np.ndarray]:
+        # Pairs of query number and index of a value that starts in `(starts[q], ends[q]]`.
+        return _ranges(
+            np.arange(len(starts)),
+            np.searchsorted(self.sorted_starts, starts, side="right"),
+            np.searchsorted(self.sorted_starts, ends, side="right"),
+            self.by_first_start,
+        )
+
+
+def _nodes(first: np.ndarray, last: np.ndarray, m: int) -> np.ndarray:
+    # The node of each value with boundary indices `[first, last]`, one tree level at a time.
+    nodes = np.empty(len(first), dtype=np.int64)
+    lo = np.zeros(len(first), dtype=np.int64)
+    hi = np.full(len(first), m, dtype=np.int64)
+    active = np.arange(len(first))
+    while len(active):
+        node = (lo[active] + hi[active]) // 2
+        here = (first[active] <= node) & (node <= last[active])
+        nodes[active[here]] = node[here]
+        left = last[active] < node
+        hi[active[left]] = node[left]
+        right = ~here & ~left
+        lo[active[right]] = node[right] + 1
+        active = active[~here]
+    return nodes
+
+
+def _extent(value: BaseModel) -> tuple[float, float]:
+    between = getattr(value, "between", None)
+    if between is not None:
+        return between[0], between[1]
+    at = getattr(value, "at", None)
+    if at is not None:
+        return at, at
+    return -np.inf, np.inf
+
+
+def _ranges(
+    queries: np.ndarray, starts: np.ndarray, stops: np.ndarray, items: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    # Pairs of `queries[i]` and each item in `items[starts[i]:stops[i]]`, without a loop.
+    counts = np.maximum(stops - starts, 0)
+    positions = np.arange(counts.sum()) - np.repeat(np.cumsum(counts) - counts, counts)
+    return np.repeat(queries, counts), items[np.repeat(starts, counts) + positions]
+
+
+def _group(
+    queries: np.ndarray, indices: np.ndarray, count: int
+) -> tuple[np.ndarray, np.ndarray]:
+    # Sorting one combined key is much faster than `np.lexsort` on the pair.
+    order = np.argsort(queries * (indices.max(initial=0) + 1) + indices)
+    return _offsets(queries, count), indices[order]
+
+
+def _offsets(queries: np.ndarray, count: int) -> np.ndarray:
+    offsets = np.zeros(count + 1, dtype=np.int64)
+    np.cumsum(np.bincount(queries, minlength=count), out=offsets[1:])
+    return offsets
@@ -0,0 +1,265 @@
+from overture_schema_pydantic.batch import validate_table
+from overture_schema_pydantic.errors import _loc_parts, _pointer
+from overture_schema_pydantic.feature import Feature
+from overture_schema_pydantic.stream import validate_stream, StreamStats
+
+import functools
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable, Literal, Optional
+
+import pyarrow.parquet as pq
+
+
+DEFAULT_CHUNK_ROWS = 100_000
+
+DEFAULT_CHUNK_BYTES = 64 * 1024 * 1024
+
+# Kinds of worker pool that files can be validated in.
+EXECUTORS = ("process", "thread")
+
+
+@dataclass(frozen=True)
+class Chunk:
+    # For Parquet, `start` and `stop` are a range of row group numbers. For NDJSON, they're a byte
+    # range, and the chunk owns every line that starts inside it.
+    path: str
+    kind: Literal["parquet", "ndjson"]
+    start: int
+    stop: int
+
+
+@dataclass(frozen=True)
+class ErrorRecord:
+    path: str
+    # Zero-based row (Parquet) or line (NDJSON) number within the file.
+    index: int
+    property: str
+    error: str
+
+
+@dataclass
+class ChunkSummary:
+    chunk: Chunk
+    records: int
+    invalid: int
+    errors: list[ErrorRecord]
+    truncated: bool = False
+    # Number of rows or lines the chunk covers, including blank lines that aren't records.
+    extent: int = 0
+
+
+@dataclass
+class ValidationSummary:
+    records: int = 0
+    invalid: int = 0
+    errors: list[ErrorRecord] = field(default_factory=list)
+    truncated: bool = False
+
+    @property
+    def valid(self) -> int:
+        return self.records - self.invalid
+
+
+def plan_chunks(
+    paths: Iterable[str],
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> list[Chunk]:
+    chunks = []
+    for path in paths:
+        path = os.fspath(path)
+        if _is_parquet(path):
+            chunks.extend(_plan_parquet_chunks(path, chunk_rows))
+        else:
+            chunks.extend(_plan_ndjson_chunks(path, chunk_bytes))
+    return chunks
+
+
+def validate_files(
+    model: type[Feature],
+    paths: Iterable[str],
+    max_workers: Optional[int] = None,
+    chunk_rows: int = DEFAULT_CHUNK_ROWS,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+    max_errors: int = 1000,
+    executor: Literal["process", "thread"] = "process",
+) -> ValidationSummary:
+    """
+    Validate Parquet and NDJSON/GeoJSONSeq files in parallel worker processes or threads.
+
+    Files are split into chunks (groups of Parquet row groups, or newline-aligned byte ranges)
+    which are validated independently. Chunk summaries are merged in input order, so the result
+    doesn't depend on scheduling. At most `max_errors` error records are kept per chunk and in
+    the merged summary; the counts are always complete.
+
+    With the `"thread"` executor, chunks are validated by threads sharing the model, so nothing
+    is pickled and the model's validators are built once. Arrow and Shapely release the GIL, so
+    Parquet validation scales with threads on any build; NDJSON validation runs Python-side
+    validators, which only scale on a free-threaded build of Python.
+    """
+    if executor not in EXECUTORS:
+        raise ValueError(
+            f"executor must be one of {EXECUTORS}; but it is {repr(executor)}"
+        )
+    chunks = plan_chunks(paths, chunk_rows, chunk_bytes)
+    if executor == "thread":
+        with ThreadPoolExecutor(max_workers=max_workers or os.cpu_count()) as pool:
+            return merge_summaries(
+                pool.map(
+                    functools.partial(_validate_chunk_with, model, max_errors), chunks
+                ),
+                max_errors,
+            )
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_init_worker,
+        initargs=(model, max_errors),
+    ) as pool:
+        return merge_summaries(pool.map(_validate_chunk, chunks), max_errors)
+
+
+def merge_summaries(
+    summaries: Iterable[ChunkSummary], max_errors: int = 1000
+) -> ValidationSummary:
+    # Chunk summaries count records from the start of the chunk; rebase them onto the start of
+    # the file, which is only known once all the earlier chunks of the same file are counted.
+    merged = ValidationSummary()
+    offsets: dict[str, int] = {}
+    for summary in summaries:
+        path = summary.chunk.path
+        offset = offsets.get(path, 0)
+        offsets[path] = offset + summary.extent
+        merged.records += summary.records
+        merged.invalid += summary.invalid
+        merged.truncated |= summary.truncated
+        for error in summary.errors:
+            if len(merged.errors) >= max_errors:
+                merged.truncated = True
+                break
+            merged.errors.append(
+                ErrorRecord(path, offset + error.index, error.property, error.error)
+            )
+    return merged
+
+
+def _is_parquet(path: str) -> bool:
+    return path.endswith((".parquet", ".geoparquet"))
+
+
+def _plan_parquet_chunks(path: str, chunk_rows: int) -> list[Chunk]:
+    metadata = pq.ParquetFile(path).metadata
+    chunks = []
+    start, rows = 0, 0
+    for i in range(metadata.num_row_groups):
+        rows += metadata.row_group(i).num_rows
+        if rows >= chunk_rows:
+            chunks.append(Chunk(path, "parquet", start, i + 1))
+            start, rows = i + 1, 0
+    if start < metadata.num_row_groups:
+        chunks.append(Chunk(path, "parquet", start, metadata.num_row_groups))
+    return chunks
+
+
+def _plan_ndjson_chunks(path: str, chunk_bytes: int) -> list[Chunk]:
+    size = os.path.getsize(path)
+    return [
+        Chunk(path, "ndjson", start, min(start + chunk_bytes, size))
+        for start in range(0, size, chunk_bytes)
+    ]
+
+
+########################################################################
+# Workers
+########################################################################
+
+_worker_model: Optional[type[Feature]] = None
+
+_worker_max_errors: int = 0
+
+
+def _init_worker(model: type[Feature], max_errors: int):
+    # Runs once per worker process, so the model's schema is built once rather than per chunk.
+    global _worker_model, _worker_max_errors
+    _worker_model = model
+    _worker_max_errors = max_errors
+
+
+def _validate_chunk(chunk: Chunk) -> ChunkSummary:
+    return _validate_chunk_with(_worker_model, _worker_max_errors, chunk)
+
+
+def _validate_chunk_with(
+    model: type[Feature], max_errors: int, chunk: Chunk
+) -> ChunkSummary:
+    if chunk.kind == "parquet":
+        return _validate_parquet_chunk(model, chunk, max_errors)
+    else:
+        return _validate_ndjson_chunk(model, chunk, max_errors)
+
+
+def _validate_parquet_chunk(
+    model: type[Feature], chunk: Chunk, max_errors: int
+) -> ChunkSummary:
+    table = pq.ParquetFile(chunk.path).read_row_groups(range(chunk.start, chunk.stop))
+    errors = validate_table(model, table)
+    rows = errors.column("row").to_pylist()
+    records = [
+        ErrorRecord(chunk.path, row, property, error)
+        for row, property, error in zip(
+            rows[:max_errors],
+            errors.column("property").to_pylist()[:max_errors],
+            errors.column("error").to_pylist()[:max_errors],
+        )
+    ]
+    return ChunkSummary(
+        chunk,
+        table.num_rows,
+        len(set(rows)),
+        records,
+        truncated=len(rows) > max_errors,
+        extent=table.num_rows,
+    )
+
+
+def _validate_ndjson_chunk(
+    model: type[Feature], chunk: Chunk, max_errors: int
+) -> ChunkSummary:
+    summary = ChunkSummary(chunk, 0, 0, [])
+    stats = StreamStats()
+    for result in validate_stream(model, _read_chunk_lines(chunk, summary), stats):
+        if result.valid:
+            continue
+        for error in result.errors:
+            if len(summary.errors) >= max_errors:
+                summary.truncated = True
+                break
+            summary.errors.append(
+                ErrorRecord(
+                    chunk.path,
+                    result.line - 1,
+                    _pointer(_loc_parts(error["loc"], model)),
+                    error["msg"],
+                )
+            )
+    summary.records = stats.count
+    summary.invalid = stats.invalid
+    return summary
+
+
+def _read_chunk_lines(chunk: Chunk, summary: ChunkSummary) -> Iterable[bytes]:
+    # Yields the lines starting in [start, stop), counting them in `summary.extent`. A chunk
+    # that starts mid-line skips ahead to the next line, which the previous chunk owns.
+    with open(chunk.path, "rb") as f:
+        position = chunk.start
+        if position > 0:
+            f.seek(position - 1)
+            position += len(f.readline()) - 1
+        while position < chunk.stop:
+            line = f.readline()
+            if not line:
+                break
+            position += len(line)
+            summary.extent += 1
+            yield line
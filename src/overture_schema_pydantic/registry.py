@@ -0,0 +1,236 @@
+from overture_schema_pydantic.feature import Feature
+from overture_schema_pydantic.geometry import (
+    parse_json_with_raw_geometry,
+    use_raw_geometry,
+)
+
+import functools
+import importlib
+import importlib.metadata
+import threading
+from typing import (
+    get_args,
+    get_origin,
+    Annotated,
+    Any,
+    Iterable,
+    Literal,
+    Optional,
+    Union,
+)
+
+from pydantic import Discriminator, Tag, TypeAdapter
+
+
+# Entry point group through which other distributions register feature types. Each entry point
+# names a `Feature` subclass as `module:Class`.
+ENTRY_POINT_GROUP = "overture_schema_pydantic.feature_types"
+
+# Feature types defined in this package. They're listed here as well as registered as entry
+# points, so they're found even when the package is used without being installed.
+_PACKAGE_FEATURE_TYPES = ("overture_schema_pydantic.divisions:Division",)
+
+
+class FeatureRegistry:
+    """
+    A set of feature types, validated together through one discriminated union.
+
+    Each record is routed to its feature type by the value of its `type` property, which every
+    registered model must declare as a `Literal`, in either the flat or the GeoJSON Feature
+    layout. The value is read by a Python callback for each record, and then mapped to its model
+    by a hash lookup in pydantic-core, so routing costs the same however many types are
+    registered. `model_validate` and `model_validate_json` mirror the `Feature` class methods, so
+    a registry can be used wherever a feature model is expected for validation (e.g.
+    `validate_stream`).
+    """
+
+    def __init__(self, models: Iterable[type[Feature]] = ()):
+        self.__types: dict[str, type[Feature]] = {}
+        self.__adapter: Optional[TypeAdapter] = None
+        self.__lock = threading.Lock()
+        for model in models:
+            self.register(model)
+
+    @classmethod
+    def discover(cls, entry_point_group: str = ENTRY_POINT_GROUP) -> "FeatureRegistry":
+        # The package's own feature types, plus those registered by installed distributions.
+        models = [_load(spec) for spec in _PACKAGE_FEATURE_TYPES]
+        models.extend(
+            ep.load() for ep in importlib.metadata.entry_points(group=entry_point_group)
+        )
+        return cls(models)
+
+    def register(self, model: type[Feature]) -> type[Feature]:
+        # Returns `model`, so that this can be used as a class decorator.
+        if not isinstance(model, type) or not issubclass(model, Feature):
+            raise TypeError(
+                f"model must be a subclass of {Feature.__name__}; but {repr(model)} isn't"
+            )
+        tags = _feature_type_tags(model)
+        with self.__lock:
+            # Checked under the lock, so that two threads can't register the same tag at once.
+            for tag in tags:
+                registered = self.__types.get(tag)
+                if registered is not None and registered is not model:
+                    raise ValueError(
+                        f"feature type {repr(tag)} is already registered to {registered.__qualname__}, so it can't be registered to {model.__qualname__}"
+                    )
+            for tag in tags:
+                self.__types[tag] = model
+            self.__adapter = None
+        return model
+
+    @property
+    def types(self) -> dict[str, type[Feature]]:
+        # Feature types by `type` value.
+        return dict(self.__types)
+
+    @property
+    def models(self) -> list[type[Feature]]:
+        return list(dict.fromkeys(self.__types.values()))
+
+    def __getitem__(self, feature_type: str) -> type[Feature]:
+        return self.__types[feature_type]
+
+    def __contains__(self, feature_type: str) -> bool:
+        return feature_type in self.__types
+
+    def __len__(self) -> int:
+        return len(self.__types)
+
+    @property
+    def adapter(self) -> TypeAdapter:
+        # Built on first use. The lock keeps threads that validate with a new registry from all
+        # building it at once.
+        adapter = self.__adapter
+        if adapter is None:
+            with self.__lock:
+                if self.__adapter is None:
+                    self.__adapter = self.__build_adapter()
+                adapter = self.__adapter
+        return adapter
+
+    def __build_adapter(self) -> TypeAdapter:
+        models = self.models
+        if not models:
+            raise ValueError("no feature types are registered")
+        elif len(models) == 1:
+            return TypeAdapter(models[0])
+        # Pydantic can't discriminate on a property that has alias choices, which feature
+        # properties do so that both layouts validate, so the tag is found by `_discriminate`, a
+        # Python callback run for each record. Only the dispatch on the tag is native.
+        # Each model is tagged with its first `type` value, which every other value maps to.
+        tags = {model: _feature_type_tags(model)[0] for model in models}
+        primary_tags = {tag: tags[model] for tag, model in self.__types.items()}
+
+        def feature_type(value: Any) -> Optional[str]:
+            return _discriminate(primary_tags, value)
+
+        return TypeAdapter(
+            Annotated[
+                Union[tuple(Annotated[model, Tag(tags[model])] for model in models)],
+                Discriminator(feature_type),
+            ]
+        )
+
+    def model_validate(
+        self,
+        obj: Any,
+        *,
+        strict: Optional[bool] = None,
+        context: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Feature:
+        return self.adapter.validate_python(
+            obj, strict=strict, context=context, **kwargs
+        )
+
+    def model_validate_json(
+        self,
+        json_data: str | bytes | bytearray,
+        *,
+        strict: Optional[bool] = None,
+        context: Optional[dict[str, Any]] = None,
+        **kwargs: Any,
+    ) -> Feature:
+        # Leaves the geometry of large features as raw JSON text, as
+        # `Feature.model_validate_json` does.
+        if strict or not use_raw_geometry(json_data, context):
+            return self.adapter.validate_json(
+                json_data, strict=strict, context=context, **kwargs
+            )
+        try:
+            value = parse_json_with_raw_geometry(json_data)
+        except ValueError:
+            return self.adapter.validate_json(json_data, context=context, **kwargs)
+        return self.model_validate(value, strict=strict, context=context, **kwargs)
+
+    def model_construct_trusted(self, obj: Any) -> Feature:
+        # See `Feature.model_construct_trusted`. A record of a type that isn't registered is
+        # validated instead, so that the error is reported as it would be by `model_validate`.
+        feature_type = _feature_type(obj)
+        model = (
+            self.__types.get(feature_type) if isinstance(feature_type, str) else None
+        )
+        if model is None:
+            return self.model_validate(obj)
+        return model.model_construct_trusted(obj)
+
+    def __reduce__(self):
+        # The adapter can't be pickled, so pickle the models and rebuild it when needed, e.g. in
+        # worker processes.
+        return (self.__class__, (self.models,))
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({', '.join(m.__qualname__ for m in self.models)})"
+
+
+@functools.cache
+def default_registry() -> FeatureRegistry:
+    return FeatureRegistry.discover()
+
+
+def load_feature_type(name: str) -> type[Feature]:
+    # A registered feature type name, or any `Feature` subclass as `module:Class`.
+    registry = default_registry()
+    if name in registry:
+        return registry[name]
+    elif ":" in name:
+        return _load(name)
+    raise ValueError(
+        f"unknown feature type {repr(name)} (known types: {', '.join(sorted(registry.types))}; or use `module:Class`)"
+    )
+
+
+def _load(spec: str) -> Any:
+    module_name, _, attribute_name = spec.partition(":")
+    return getattr(importlib.import_module(module_name), attribute_name)
+
+
+def _discriminate(primary_tags: dict[str, str], value: Any) -> Optional[str]:
+    tag = _feature_type(value)
+    if not isinstance(tag, str):
+        return None
+    # An unknown tag is returned as-is, for pydantic to report.
+    return primary_tags.get(tag, tag)
+
+
+def _feature_type(value: Any) -> Any:
+    # The `type` of a feature in either layout, or of a model instance.
+    if isinstance(value, dict):
+        properties = value.get("properties")
+        if isinstance(properties, dict) and "type" in properties:
+            return properties["type"]
+        return value.get("type")
+    return getattr(value, "type", None)
+
+
+def _feature_type_tags(model: type[Feature]) -> tuple[str, ...]:
+    annotation = model.model_fields["type"].annotation
+    while get_origin(annotation) is Annotated:
+        annotation = get_args(annotation)[0]
+    if get_origin(annotation) is not Literal:
+        raise TypeError(
+            f"{model.__qualname__}.type must be a `Literal` to register the feature type; but it is {repr(annotation)}"
+        )
+    return get_args(annotation)
@@ -0,0 +1,104 @@
+import math
+import threading
+from dataclasses import dataclass, field
+from statistics import NormalDist
+from typing import Iterator, Optional
+
+import numpy as np
+
+
+@dataclass
+class Sample:
+    """
+    Which records to fully validate when the rest are trusted, and what validating them found.
+
+    Roughly one record in every `1 / rate` is chosen. A stratified sample picks one record at a
+    random position in every consecutive block of that many records, so every part of the input
+    is covered, and every partition gets at least one sampled record; otherwise each record is
+    chosen independently with probability `rate`. The counts are updated by the functions that
+    take a sample, from which the error rate of all the records is estimated.
+    """
+
+    rate: float = 0.001
+    stratified: bool = True
+    seed: Optional[int] = None
+    confidence: float = 0.95
+    records: int = 0
+    sampled: int = 0
+    invalid: int = 0
+    _rng: np.random.Generator = field(init=False, repr=False, compare=False)
+    _lock: threading.Lock = field(
+        init=False, repr=False, compare=False, default_factory=threading.Lock
+    )
+
+    def __post_init__(self):
+        if not 0 < self.rate <= 1:
+            raise ValueError(f"rate must be in (0, 1]; but it is {repr(self.rate)}")
+        if not 0 < self.confidence < 1:
+            raise ValueError(
+                f"confidence must be in (0, 1); but it is {repr(self.confidence)}"
+            )
+        self._rng = np.random.default_rng(self.seed)
+
+    @property
+    def block_size(self) -> int:
+        return max(1, round(1 / self.rate))
+
+    def select(self, count: int) -> np.ndarray:
+        # Sorted indices of the records to validate among a partition of `count` records.
+        if self.stratified:
+            block_size = self.block_size
+            starts = np.arange(0, count, block_size)
+            sizes = np.minimum(block_size, count - starts)
+            return starts + self._rng.integers(0, sizes)
+        return np.flatnonzero(self._rng.random(count) < self.rate)
+
+    def flags(self) -> Iterator[bool]:
+        # Whether to validate each record of an unbounded stream, a block at a time.
+        block_size = self.block_size
+        while True:
+            mask = np.zeros(block_size, dtype=bool)
+            mask[self.select(block_size)] = True
+            yield from mask.tolist()
+
+    def update(self, records: int = 0, sampled: int = 0, invalid: int = 0):
+        # Locked, so that a sample can be shared by threads validating different inputs. (The
+        # random generator has its own lock.)
+        with self._lock:
+            self.records += records
+            self.sampled += sampled
+            self.invalid += invalid
+
+    def __getstate__(self) -> dict:
+        # Locks can't be pickled, so the copy gets a new one.
+        state = dict(self.__dict__)
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: dict):
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+    @property
+    def error_rate(self) -> float:
+        return self.invalid / self.sampled if self.sampled else 0.0
+
+    @property
+    def error_rate_upper_bound(self) -> float:
+        # One-sided Wilson score bound at `confidence`, which stays meaningful when no sampled
+        # record is invalid.
+        n = self.sampled
+        if not n:
+            return 1.0
+        z = NormalDist().inv_cdf(self.confidence)
+        p = self.error_rate
+        centre = p + z * z / (2 * n)
+        margin = z * math.sqrt(p * (1 - p) / n + z * z / (4 * n * n))
+        return min(1.0, (centre + margin) / (1 + z * z / n))
+
+    @property
+    def estimated_invalid(self) -> float:
+        return self.error_rate * self.records
+
+    def __str__(self) -> str:
+        return f"sampled {self.sampled} of {self.records} records ({self.invalid} invalid): estimated error rate {self.error_rate:.3%} (at most {self.error_rate_upper_bound:.3%} with {self.confidence:.0%} confidence)"
@@ -1,3 +1,6 @@
+from overture_schema_pydantic.instrumentation import instrumented
+
+import functools
 from enum import Enum
 from typing import (
     Annotated,
@@ -14,8 +17,17 @@ from pydantic import (
     BaseModel,
     ConfigDict,
     Field,
+    ValidationInfo,
     create_model,
+    model_validator,
 )
+from pydantic_core import PydanticCustomError
+
+
+# Message templates of the validation errors raised for scoped values, by error type.
+SCOPING_ERROR_MESSAGES = {
+    "scope_missing": "at least one of {fields} must be set",
+}
 
 
 class Scope(Enum):
@@ -126,6 +138,18 @@ class Heading(str, Enum):
     BACKWARD = "backward"
 
 
+# Scopes that are fields of the `when` model, rather than of the scoped model itself, with the
+# name and type of their field, in field order.
+# TODO: Put other when-wrapped scopes here.
+_WHEN_FIELDS: dict[Scope, tuple[str, Type]] = {
+    Scope.HEADING: ("heading", Heading),
+}
+
+
+# Memoized, so that all models with the same scopes share the fields, and all models with the same
+# `when` scopes share one `When` model with its compiled validators. The result is shared, so it
+# must not be mutated.
+@functools.cache
 def _make_scoped_fields(
     allowed: frozenset[Scope], required: frozenset[Scope]
 ) -> dict[str, tuple[Type, Any]]:
@@ -141,27 +165,47 @@ def _make_scoped_fields(
             Scope.GEOMETRIC_RANGE, required, "between", GeometricRange, scoped_fields
         )
 
-    when_fields: dict[str, tuple[Type, Any]] = {}
+    when_scopes = frozenset(_WHEN_FIELDS)
+    when = _make_when_field(allowed & when_scopes, required & when_scopes)
+    if when is not None:
+        scoped_fields["when"] = when
 
-    if Scope.HEADING in allowed:
-        _put_scoped_field(Scope.HEADING, required, "heading", Heading, when_fields)
+    return scoped_fields
 
-    # TODO: Put other when-wrapped scopes here.
 
-    if when_fields:
-        has_required = any(_is_required_type(pair[0]) for pair in when_fields.values())
-        if has_required:
-            scoped_fields["when"] = (_make_when(when_fields), ...)
-        elif len(when_fields) == 1:
-            ((field_name, field_type),) = when_fields.items()
-            field_type = (_unpack_optional_inner_type(field_type[0]), ...)
-            scoped_fields["when"] = _make_when({field_name: field_type})
-        else:
-            when = _make_when(when_fields)
-            _require_at_least_one_field_set(when)
-            scoped_fields["when"] = (Optional[when], None)
+@functools.cache
+def _make_when_field(
+    allowed: frozenset[Scope], required: frozenset[Scope]
+) -> Optional[tuple[Type, Any]]:
+    when_fields: dict[str, tuple[Type, Any]] = {}
 
-    return scoped_fields
+    for scope, (field_name, field_type) in _WHEN_FIELDS.items():
+        if scope in allowed:
+            _put_scoped_field(scope, required, field_name, field_type, when_fields)
+
+    if not when_fields:
+        return None
+
+    has_required = any(_is_required_type(pair[0]) for pair in when_fields.values())
+    if has_required:
+        return (_make_when(when_fields), ...)
+    elif len(when_fields) == 1:
+        # A `when` that is given must set its one field, which is simply required.
+        ((field_name, field_type),) = when_fields.items()
+        field_type = (_unpack_optional_inner_type(field_type[0]), ...)
+        when = _make_when({field_name: field_type})
+        return (Optional[when], None)
+    else:
+        # A `when` that is given must set at least one of its fields. They default to `None`
+        # but can't be set to `null`, so that is exactly JSON Schema's `minProperties: 1`.
+        when = _make_when(
+            {
+                field_name: (_unpack_optional_inner_type(field_type), None)
+                for field_name, (field_type, _) in when_fields.items()
+            },
+            require_at_least_one=True,
+        )
+        return (Optional[when], None)
 
 
 def _put_scoped_field(
@@ -192,34 +236,40 @@ def _unpack_optional_inner_type(t: Type) -> Type:
     return non_none_types[0]
 
 
-def _make_when(when_fields: dict[str, tuple[Any, Any]]):
-    return create_model("When", **when_fields, __config__=ConfigDict(extra="forbid"))
-
-
-def _require_at_least_one_field_set(
-    model_type: Type[BaseModel], required_field_names: list[str]
+def _make_when(
+    when_fields: dict[str, tuple[Any, Any]], require_at_least_one: bool = False
 ):
-    # Wrap the base Pydantic model validation with an added validation to ensure at least one of the
-    # required fields is set.
-
-    orig_validate = model_type.validate
-
-    @classmethod
-    def validate(cls, data, *args, **kwargs):
-        model = orig_validate.__func__(cls, data, *args, **kwargs)
-        actual_field_names = model.model_dump().keys()
-        if not any(f in actual_field_names for f in required_field_names):
-            field_names = ", ".join(
-                f"`{field_name}`" for field_name in required_field_names.keys()
+    if not require_at_least_one:
+        return create_model(
+            "When", **when_fields, __config__=ConfigDict(extra="forbid")
+        )
+    return create_model(
+        "When",
+        **when_fields,
+        __config__=ConfigDict(extra="forbid", json_schema_extra={"minProperties": 1}),
+        __validators__={
+            "require_at_least_one_field_set": model_validator(mode="after")(
+                instrumented(
+                    "scoped", _require_at_least_one_field_set(tuple(when_fields))
+                )
+            )
+        },
+    )
+
+
+def _require_at_least_one_field_set(field_names: tuple[str, ...]):
+    # Checks the set of fields that were given, which pydantic-core already tracks, so no
+    # validated value is ever dumped.
+    names = frozenset(field_names)
+    fields = ", ".join(f"`{field_name}`" for field_name in field_names)
+
+    def validate(model: BaseModel, info: ValidationInfo) -> BaseModel:
+        if names.isdisjoint(model.model_fields_set):
+            raise PydanticCustomError(
+                "scope_missing",
+                SCOPING_ERROR_MESSAGES["scope_missing"],
+                {"fields": fields},
             )
-            raise ValueError(f"at least one of {field_names} must be set")
         return model
 
-    model_type.validate = validate
-
-    # Set the Pydantic-generated JSON Schema to require at least one property to be set. It is safe
-    # to do this, because we created `model_type`, `json_schema_extra` is a user field, and we`know
-    # we didn't previously set it.
-
-    assert model_type.model_config["json_schema_extra]"] is None
-    model_type.model_config["json_schema_extra]"] = {"minProperties": 1}
+    return validate
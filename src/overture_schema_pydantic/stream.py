@@ -0,0 +1,173 @@
+from overture_schema_pydantic.feature import Feature
+from overture_schema_pydantic.geometry import (
+    parse_json_with_raw_geometry,
+    use_raw_geometry,
+)
+from overture_schema_pydantic.sampling import Sample
+
+import sys
+import time
+from contextlib import nullcontext
+from dataclasses import dataclass, field
+from typing import (
+    Any,
+    BinaryIO,
+    ContextManager,
+    Iterable,
+    Iterator,
+    Optional,
+    TYPE_CHECKING,
+)
+
+from pydantic import ValidationError
+from pydantic_core import from_json
+
+if TYPE_CHECKING:
+    # Only for annotations: the error collector imports PyArrow, which stream validation
+    # otherwise doesn't need.
+    from overture_schema_pydantic.errors import ErrorCollector
+
+
+# RFC 8142 GeoJSON text sequences prefix every record with an ASCII record separator.
+_RECORD_SEPARATOR = b"\x1e"
+
+
+@dataclass(frozen=True)
+class StreamResult:
+    line: int
+    feature: Optional[Feature] = None
+    errors: Optional[list[dict[str, Any]]] = None
+
+    @property
+    def valid(self) -> bool:
+        return self.errors is None
+
+
+@dataclass
+class StreamStats:
+    valid: int = 0
+    invalid: int = 0
+    started: float = field(default_factory=time.perf_counter)
+    finished: Optional[float] = None
+
+    @property
+    def count(self) -> int:
+        return self.valid + self.invalid
+
+    @property
+    def elapsed(self) -> float:
+        finished = self.finished if self.finished is not None else time.perf_counter()
+        return finished - self.started
+
+    @property
+    def features_per_second(self) -> float:
+        elapsed = self.elapsed
+        return self.count / elapsed if elapsed > 0 else 0.0
+
+    def __str__(self) -> str:
+        return f"validated {self.count} features ({self.valid} valid, {self.invalid} invalid) in {self.elapsed:.3f}s: {self.features_per_second:.1f} features/s"
+
+
+def open_lines(path: str) -> ContextManager[BinaryIO]:
+    # Standard input is left open when the returned context exits.
+    if path == "-":
+        return nullcontext(sys.stdin.buffer)
+    return open(path, "rb")
+
+
+def validate_stream(
+    model: type[Feature],
+    lines: Iterable[bytes | str],
+    stats: Optional[StreamStats] = None,
+    context: Optional[dict[str, Any]] = None,
+    sample: Optional[Sample] = None,
+    errors: Optional["ErrorCollector"] = None,
+) -> Iterator[StreamResult]:
+    """
+    Validate newline-delimited GeoJSON features (GeoJSONSeq or NDJSON) one line at a time.
+
+    Only one line is held in memory at a time, so `lines` can be an open file of any size.
+    Blank lines are skipped. If `stats` is given, it is updated as results are yielded.
+    `context` is passed through to model validation, e.g. `{"lazy_geometry": True}`.
+
+    If `sample` is given, the input is trusted: only the sampled lines are validated, and the
+    rest are built with `model_construct_trusted` and reported as valid. `sample` is updated
+    with the counts from which the error rate of the whole input is estimated.
+
+    If `errors` is given, the errors of invalid lines are also added to it, numbering rows from
+    zero like `collect_table_errors` does. Blank lines aren't rows.
+    """
+    flags = sample.flags() if sample is not None else None
+    row = -1
+    for line_number, line in enumerate(lines, start=1):
+        if isinstance(line, str):
+            line = line.encode()
+        line = line.strip().lstrip(_RECORD_SEPARATOR)
+        if not line:
+            continue
+        row += 1
+        if flags is None:
+            result = _validate_line(model, line_number, line, context)
+        elif next(flags):
+            result = _validate_line(model, line_number, line, context)
+            sample.update(records=1, sampled=1, invalid=not result.valid)
+        else:
+            result = _validate_line(model, line_number, line, context, trusted=True)
+            sample.update(records=1)
+        if errors is not None and not result.valid:
+            errors.add_validation_error(row, result.errors, model)
+        if stats is not None:
+            if result.valid:
+                stats.valid += 1
+            else:
+                stats.invalid += 1
+        yield result
+    if stats is not None:
+        stats.finished = time.perf_counter()
+
+
+def _validate_line(
+    model: type[Feature],
+    line_number: int,
+    line: bytes,
+    context: Optional[dict[str, Any]],
+    trusted: bool = False,
+) -> StreamResult:
+    try:
+        if use_raw_geometry(line, context):
+            value = parse_json_with_raw_geometry(line)
+        else:
+            value = from_json(line)
+    except ValueError as e:
+        return StreamResult(
+            line_number,
+            errors=[
+                {
+                    "type": "json_invalid",
+                    "loc": (),
+                    "msg": f"invalid JSON: {e}",
+                    "ctx": {"error": str(e)},
+                }
+            ],
+        )
+    try:
+        if trusted:
+            feature = _construct_trusted(model, value, context)
+        else:
+            # GeoJSON Features are validated as they are; see `Feature.model_config`.
+            feature = model.model_validate(value, context=context)
+    except ValidationError as e:
+        return StreamResult(
+            line_number, errors=e.errors(include_url=False, include_input=False)
+        )
+    return StreamResult(line_number, feature=feature)
+
+
+def _construct_trusted(
+    model: type[Feature], value: Any, context: Optional[dict[str, Any]]
+) -> Feature:
+    # Input that can't even be constructed is validated after all, to report what's wrong.
+    try:
+        return model.model_construct_trusted(value)
+    except (TypeError, ValueError):
+        return model.model_validate(value, context=context)
@@ -0,0 +1,16 @@
+def division(i: int, geometry_type: str = "Point", geo_json: bool = False) -> dict:
+    # A division feature with id `f"id{i}"`, which is valid only if `geometry_type` is "Point".
+    geometry = (
+        {"type": "Point", "coordinates": [i, i]}
+        if geometry_type == "Point"
+        else {"type": "LineString", "coordinates": [[0, 0], [i, i]]}
+    )
+    properties = {"type": "division", "sources": [{"property": "", "dataset": "foo"}]}
+    if geo_json:
+        return {
+            "type": "Feature",
+            "id": f"id{i}",
+            "geometry": geometry,
+            "properties": properties,
+        }
+    return {"id": f"id{i}", "geometry": geometry, **properties}
@@ -0,0 +1,110 @@
+from overture_schema_pydantic.aio import AsyncValidator
+from overture_schema_pydantic.divisions import Division
+
+from factories import division
+
+import asyncio
+import json
+import threading
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pytest
+from pydantic import ValidationError
+
+
+def test_validate():
+    async def main():
+        validator = AsyncValidator(Division)
+        feature = await validator.validate(division(1))
+        with pytest.raises(ValidationError):
+            await validator.validate(division(2, "LineString"))
+        return feature
+
+    assert asyncio.run(main()).id == "id1"
+
+
+def test_validate_json():
+    async def main():
+        return await AsyncValidator(Division).validate_json(json.dumps(division(1)))
+
+    assert asyncio.run(main()).id == "id1"
+
+
+@pytest.mark.parametrize("json_input", [False, True])
+def test_validate_batch(json_input):
+    values = [division(i, "LineString" if i % 7 == 0 else "Point") for i in range(50)]
+
+    async def main():
+        validator = AsyncValidator(Division, chunk_size=8)
+        if json_input:
+            return await validator.validate_json_batch([json.dumps(v) for v in values])
+        return await validator.validate_batch(values)
+
+    results = asyncio.run(main())
+
+    assert [r.index for r in results] == list(range(50))
+    assert [r.valid for r in results] == [i % 7 != 0 for i in range(50)]
+    assert [r.feature.id for r in results if r.valid] == [
+        f"id{i}" for i in range(50) if i % 7 != 0
+    ]
+    assert results[0].errors[0]["type"] == "geometry_type_not_allowed"
+
+
+def test_max_in_flight():
+    running = 0
+    peak = 0
+    lock = threading.Lock()
+
+    class Counting(Division):
+        pass
+
+    original = Counting.model_validate.__func__
+
+    def model_validate(cls, value, **kwargs):
+        nonlocal running, peak
+        with lock:
+            running += 1
+            peak = max(peak, running)
+        try:
+            threading.Event().wait(0.001)
+            return original(cls, value, **kwargs)
+        finally:
+            with lock:
+                running -= 1
+
+    Counting.model_validate = classmethod(model_validate)
+
+    async def main():
+        with ThreadPoolExecutor(8) as executor:
+            validator = AsyncValidator(
+                Counting, executor, max_in_flight=2, chunk_size=1
+            )
+            batches = [[division(i)] * 5 for i in range(4)]
+            return await asyncio.gather(*map(validator.validate_batch, batches))
+
+    results = asyncio.run(main())
+
+    assert peak == 2
+    assert [[r.feature.id for r in batch] for batch in results] == [
+        [f"id{i}"] * 5 for i in range(4)
+    ]
+
+
+def test_process_executor():
+    async def main():
+        with ProcessPoolExecutor(1) as executor:
+            validator = AsyncValidator(Division, executor)
+            return await validator.validate_batch(
+                [division(1), division(2, "LineString")]
+            )
+
+    results = asyncio.run(main())
+
+    assert results[0].feature.id == "id1"
+    assert not results[1].valid
+
+
+@pytest.mark.parametrize("kwargs", [{"max_in_flight": 0}, {"chunk_size": 0}])
+def test_invalid(kwargs):
+    with pytest.raises(ValueError):
+        AsyncValidator(Division, **kwargs)
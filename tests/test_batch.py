@@ -0,0 +1,196 @@
+from overture_schema_pydantic.batch import (
+    add_bbox_covering,
+    validate_table,
+    BBOX_TYPE,
+    ERROR_TABLE_SCHEMA,
+)
+from overture_schema_pydantic.divisions import Division
+from overture_schema_pydantic.feature import Feature
+from overture_schema_pydantic.sampling import Sample
+
+import json
+
+import pyarrow as pa
+import pytest
+import shapely
+
+
+class DummyFeature(Feature):
+    pass
+
+
+POINT_WKB = shapely.to_wkb(shapely.Point(0, 0))
+
+POLYGON_WKB = shapely.to_wkb(shapely.box(0, 0, 1, 1))
+
+SOURCE_TYPE = pa.struct([("property", pa.string()), ("dataset", pa.string())])
+
+NAMES_TYPE = pa.struct(
+    [("primary", pa.string()), ("common", pa.map_(pa.string(), pa.string()))]
+)
+
+
+def make_table(**overrides) -> pa.Table:
+    columns = {
+        "id": pa.array(["foo", "bar"]),
+        "geometry": pa.array([POINT_WKB, POINT_WKB]),
+        "type": pa.array(["division", "division"]),
+        "sources": pa.array(
+            [[{"property": "", "dataset": "foo"}]] * 2, pa.list_(SOURCE_TYPE)
+        ),
+        "names": pa.array(
+            [{"primary": "foo", "common": [("en", "foo")]}, None], NAMES_TYPE
+        ),
+    }
+    columns.update(overrides)
+    return pa.table({k: v for k, v in columns.items() if v is not None})
+
+
+def errors_of(model, table) -> list[tuple[int, str]]:
+    result = validate_table(model, table)
+    assert result.schema == ERROR_TABLE_SCHEMA
+    return [(e["row"], e["property"]) for e in result.to_pylist()]
+
+
+def test_valid():
+    assert errors_of(Division, make_table()) == []
+    assert errors_of(DummyFeature, make_table()) == []
+
+
+def test_valid_record_batch():
+    (batch,) = make_table().to_batches()
+    assert errors_of(Division, batch) == []
+
+
+def test_optional_column_missing():
+    assert errors_of(Division, make_table(names=None)) == []
+
+
+def test_required_column_missing():
+    assert errors_of(Division, make_table(sources=None)) == [
+        (0, "/sources"),
+        (1, "/sources"),
+    ]
+
+
+@pytest.mark.parametrize(
+    "name,overrides,expected",
+    [
+        ("id_null", {"id": pa.array([None, "bar"], pa.string())}, [(0, "/id")]),
+        ("id_empty", {"id": pa.array(["", "bar"])}, [(0, "/id")]),
+        ("id_whitespace", {"id": pa.array(["foo", " bar "])}, [(1, "/id")]),
+        ("type_wrong", {"type": pa.array(["division", "foo"])}, [(1, "/type")]),
+        (
+            "geometry_type_not_allowed",
+            {"geometry": pa.array([POINT_WKB, POLYGON_WKB])},
+            [(1, "/geometry")],
+        ),
+        (
+            "geometry_invalid_wkb",
+            {"geometry": pa.array([b"foo", POINT_WKB])},
+            [(0, "/geometry")],
+        ),
+        (
+            "sources_empty",
+            {"sources": pa.array([[], None], pa.list_(SOURCE_TYPE))},
+            [(0, "/sources"), (1, "/sources")],
+        ),
+        (
+            "sources_item_dataset_null",
+            {
+                "sources": pa.array(
+                    [
+                        [{"property": "", "dataset": "foo"}],
+                        [
+                            {"property": "", "dataset": "foo"},
+                            {"property": "", "dataset": None},
+                        ],
+                    ],
+                    pa.list_(SOURCE_TYPE),
+                )
+            },
+            [(1, "/sources/1/dataset")],
+        ),
+        (
+            "names_primary_null",
+            {"names": pa.array([None, {"primary": None}], NAMES_TYPE)},
+            [(1, "/names/primary")],
+        ),
+        (
+            "names_common_empty",
+            {"names": pa.array([{"primary": "foo", "common": []}, None], NAMES_TYPE)},
+            [(0, "/names/common")],
+        ),
+        (
+            "names_common_invalid_language_tag",
+            {
+                "names": pa.array(
+                    [None, {"primary": "foo", "common": [("en", "a"), ("!a/b", "b")]}],
+                    NAMES_TYPE,
+                )
+            },
+            [(1, "/names/common/!a~1b")],
+        ),
+    ],
+)
+def test_invalid(name, overrides, expected):
+    assert errors_of(Division, make_table(**overrides)) == expected
+
+
+def test_row_numbers_span_batches():
+    table = pa.concat_tables([make_table(), make_table(id=pa.array(["foo", ""]))])
+    assert table.num_rows == 4
+    assert errors_of(Division, table) == [(3, "/id")]
+
+
+def test_sample():
+    table = pa.concat_tables(
+        [make_table(id=pa.array(["foo", ""])) for _ in range(50)]
+    ).combine_chunks()
+    sample = Sample(rate=0.1, seed=0)
+
+    errors = validate_table(Division, table, sample)
+
+    assert sample.records == 100
+    assert sample.sampled == 10
+    assert sample.invalid == errors.num_rows
+    # Row numbers refer to the whole table, and only odd rows are invalid.
+    assert all(row % 2 for row in errors.column("row").to_pylist())
+
+
+def test_unsupported_column_type():
+    with pytest.raises(TypeError):
+        validate_table(Division, make_table(geometry=pa.array([1, 2])))
+
+
+def test_add_bbox_covering():
+    table = make_table(
+        geometry=pa.array([POLYGON_WKB, None, POINT_WKB], pa.binary()),
+        id=pa.array(["foo", "bar", "baz"]),
+        type=None,
+        sources=None,
+        names=None,
+    )
+
+    result = add_bbox_covering(table)
+
+    assert result.column("bbox").type == BBOX_TYPE
+    assert result.column("bbox").to_pylist() == [
+        {"xmin": 0.0, "ymin": 0.0, "xmax": 1.0, "ymax": 1.0},
+        None,
+        {"xmin": 0.0, "ymin": 0.0, "xmax": 0.0, "ymax": 0.0},
+    ]
+    geo = json.loads(result.schema.metadata[b"geo"])
+    assert geo["version"] == "1.1.0"
+    assert geo["columns"]["geometry"]["covering"] == {
+        "bbox": {
+            "xmin": ["bbox", "xmin"],
+            "ymin": ["bbox", "ymin"],
+            "xmax": ["bbox", "xmax"],
+            "ymax": ["bbox", "ymax"],
+        }
+    }
+    # Adding it again replaces the column.
+    assert add_bbox_covering(result).equals(result, check_metadata=True)
+    # The table still validates, since the bounding box isn't a model field.
+    assert errors_of(Division, add_bbox_covering(make_table())) == []
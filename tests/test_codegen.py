@@ -0,0 +1,46 @@
+from overture_schema_pydantic.batch import BBOX_TYPE
+from overture_schema_pydantic.divisions import Division
+from overture_schema_pydantic.source import Source
+
+import ast
+from typing import Any
+
+import pyarrow as pa
+import pytest
+
+schema_spark = pytest.importorskip("overture_schema_pydantic.codegen.schema_spark")
+
+
+def spark_type(code: str) -> Any:
+    # The generated Spark type expression as nested tuples, e.g. `("DoubleType",)`.
+    def convert(node: ast.expr) -> Any:
+        if isinstance(node, ast.Call):
+            return (node.func.id, *(convert(arg) for arg in node.args))
+        elif isinstance(node, ast.List):
+            return [convert(element) for element in node.elts]
+        return ast.literal_eval(node)
+
+    (statement,) = ast.parse(code).body
+    return convert(statement.value)
+
+
+def test_feature_bbox():
+    _, fields = spark_type(schema_spark.generate_code(Division))
+
+    assert fields[-1] == (
+        "StructField",
+        "bbox",
+        (
+            "StructType",
+            [("StructField", name, ("DoubleType",), True) for name in BBOX_TYPE.names],
+        ),
+        True,
+    )
+    # The same as the bbox covering column written by `batch.add_bbox_covering`.
+    assert all(field.type == pa.float64() and field.nullable for field in BBOX_TYPE)
+
+
+def test_non_feature_has_no_bbox():
+    _, fields = spark_type(schema_spark.generate_code(Source))
+
+    assert [field[1] for field in fields] == list(Source.model_fields)
@@ -0,0 +1,123 @@
+from overture_schema_pydantic.constraint import MinItems, NoAdditionalProperties
+
+from typing import Annotated, Dict, List, Optional
+
+import pytest
+from pydantic import (
+    AliasChoices,
+    AliasPath,
+    BaseModel,
+    Field,
+    TypeAdapter,
+    ValidationError,
+)
+from typing_extensions import TypedDict
+
+
+def errors_of(adapter: TypeAdapter, value) -> list[tuple[str, tuple]]:
+    with pytest.raises(ValidationError) as e:
+        adapter.validate_python(value)
+    return [(error["type"], error["loc"]) for error in e.value.errors()]
+
+
+@pytest.mark.parametrize(
+    "annotation,valid,invalid",
+    [
+        (List[int], [1, 2], [1]),
+        (tuple[int, ...], (1, 2), (1,)),
+        (set[int], {1, 2}, {1}),
+        (frozenset[int], frozenset({1, 2}), frozenset({1})),
+        (Dict[str, int], {"a": 1, "b": 2}, {"a": 1}),
+    ],
+)
+def test_min_items_native(annotation, valid, invalid):
+    adapter = TypeAdapter(Annotated[annotation, MinItems(2)])
+
+    assert adapter.core_schema["min_length"] == 2
+    assert adapter.validate_python(valid) == valid
+    assert errors_of(adapter, invalid) == [("too_short", ())]
+
+
+def test_min_items_python_fallback():
+    adapter = TypeAdapter(Annotated[str, MinItems(2)])
+
+    assert adapter.core_schema["type"] == "function-after"
+    assert adapter.validate_python("ab") == "ab"
+    # Reported like the native check.
+    assert errors_of(adapter, "a") == [("too_short", ())]
+
+
+def test_min_items_keeps_stricter_min_length():
+    adapter = TypeAdapter(Annotated[List[int], MinItems(1), MinItems(3)])
+    assert adapter.core_schema["min_length"] == 3
+
+
+def test_min_items_json_schema():
+    assert TypeAdapter(Annotated[List[int], MinItems(2)]).json_schema()["minItems"] == 2
+
+
+class Inner(BaseModel):
+    a: int
+    b: Optional[int] = None
+
+
+class Recursive(BaseModel):
+    a: int = 0
+    child: Optional[Annotated["Recursive", NoAdditionalProperties()]] = None
+
+
+class InnerTypedDict(TypedDict):
+    a: int
+
+
+@pytest.mark.parametrize(
+    "annotation", [Inner, InnerTypedDict, Recursive], ids=lambda a: a.__name__
+)
+def test_no_additional_properties(annotation):
+    adapter = TypeAdapter(Annotated[annotation, NoAdditionalProperties()])
+
+    adapter.validate_python({"a": 1})
+    assert errors_of(adapter, {"a": 1, "c": 2}) == [("extra_forbidden", ("c",))]
+
+
+def test_no_additional_properties_nested():
+    assert errors_of(TypeAdapter(Recursive), {"child": {"child": {"c": 1}}}) == [
+        ("extra_forbidden", ("child", "child", "c"))
+    ]
+
+
+@pytest.mark.parametrize(
+    "annotation", [Inner, InnerTypedDict], ids=lambda a: a.__name__
+)
+def test_no_additional_properties_fallback_loc(annotation):
+    adapter = TypeAdapter(List[Annotated[annotation, NoAdditionalProperties()]])
+
+    assert errors_of(adapter, [{"a": 1}, {"a": 1, "c": 2, "d": 3}]) == [
+        ("extra_forbidden", (1, "c")),
+        ("extra_forbidden", (1, "d")),
+    ]
+
+
+def test_no_additional_properties_alias():
+    class Aliased(BaseModel):
+        a: int = Field(alias="A")
+
+    adapter = TypeAdapter(Annotated[Aliased, NoAdditionalProperties()])
+    adapter.validate_python({"A": 1})
+    assert errors_of(adapter, {"A": 1, "b": 2}) == [("extra_forbidden", ("b",))]
+
+
+def test_no_additional_properties_alias_path():
+    class Aliased(BaseModel):
+        a: int = Field(validation_alias=AliasChoices(AliasPath("nested", "a"), "a"))
+
+    adapter = TypeAdapter(Annotated[Aliased, NoAdditionalProperties()])
+    adapter.validate_python({"nested": {"a": 1}})
+    adapter.validate_python({"a": 1})
+    assert errors_of(adapter, {"a": 1, "b": 2}) == [("extra_forbidden", ("b",))]
+
+
+def test_no_additional_properties_dict():
+    adapter = TypeAdapter(Annotated[Dict[str, int], NoAdditionalProperties()])
+    assert adapter.validate_python({"a": 1}) == {"a": 1}
+    assert adapter.json_schema()["additionalProperties"] is False
@@ -0,0 +1,258 @@
+from overture_schema_pydantic.batch import collect_table_errors
+from overture_schema_pydantic.divisions import Division
+from overture_schema_pydantic.errors import (
+    format_error,
+    ErrorCollector,
+    COLLECTED_ERROR_SCHEMA,
+    ERROR_SUMMARY_SCHEMA,
+)
+from overture_schema_pydantic.feature import Feature
+from overture_schema_pydantic.registry import FeatureRegistry
+from overture_schema_pydantic.stream import validate_stream
+
+import json
+from typing import Literal
+
+import numpy as np
+import pyarrow as pa
+import pytest
+import shapely
+from pydantic import ValidationError
+
+
+LINE_STRING_WKB = shapely.to_wkb(shapely.LineString([(0, 0), (1, 1)]))
+
+POINT_WKB = shapely.to_wkb(shapely.Point(0, 0))
+
+
+class Other(Feature):
+    type: Literal["other"]
+
+
+def make_table(num_rows: int, **overrides) -> pa.Table:
+    columns = {
+        "id": pa.array(["foo"] * num_rows),
+        "geometry": pa.array([POINT_WKB] * num_rows),
+        "type": pa.array(["division"] * num_rows),
+        "sources": pa.array(
+            [[{"property": "", "dataset": "foo"}]] * num_rows,
+            pa.list_(pa.struct([("property", pa.string()), ("dataset", pa.string())])),
+        ),
+    }
+    columns.update(overrides)
+    return pa.table(columns)
+
+
+def test_collect_table_errors():
+    table = make_table(
+        3,
+        id=pa.array(["foo", "", "bar"]),
+        geometry=pa.array([POINT_WKB, LINE_STRING_WKB, b"foo"]),
+    )
+    errors = ErrorCollector()
+
+    collect_table_errors(Division, table, errors)
+
+    result = errors.to_table(messages=True)
+    assert result.schema.remove(4) == COLLECTED_ERROR_SCHEMA
+    records = result.to_pylist()
+    assert [(r["row"], r["property"], r["code"]) for r in records] == [
+        (1, "/id", "string_too_short"),
+        (1, "/geometry", "geometry_type_not_allowed"),
+        (2, "/geometry", "geometry_invalid"),
+    ]
+    assert json.loads(records[0]["params"]) == {"min_length": 1}
+    assert json.loads(records[1]["params"]) == {
+        "geometry_type": "LineString",
+        "allowed_types": ["Point"],
+    }
+    assert records[0]["message"] == "String should have at least 1 character"
+    assert records[1]["message"] == (
+        "geometry type not allowed: LineString (allowed values: ['Point'])"
+    )
+
+
+def test_max_errors():
+    table = make_table(10, id=pa.array([""] * 10))
+    errors = ErrorCollector(max_errors=4)
+
+    collect_table_errors(Division, table, errors)
+    collect_table_errors(Division, table, errors)
+
+    assert errors.count == 20
+    assert errors.kept == 4
+    assert errors.truncated
+    assert errors.to_table()["row"].to_pylist() == [0, 1, 2, 3]
+    assert errors.summary().to_pylist() == [
+        {"code": "string_too_short", "path": "/id", "count": 20}
+    ]
+
+
+def test_summary_paths():
+    names = pa.array(
+        [{"primary": "foo", "common": [("en", "foo"), ("!", "foo"), ("?", "foo")]}] * 3,
+        pa.struct(
+            [("primary", pa.string()), ("common", pa.map_(pa.string(), pa.string()))]
+        ),
+    )
+    errors = ErrorCollector()
+
+    collect_table_errors(Division, make_table(3, names=names), errors)
+
+    assert errors.to_table()["property"].to_pylist()[:2] == [
+        "/names/common/!",
+        "/names/common/?",
+    ]
+    summary = errors.summary()
+    assert summary.schema == ERROR_SUMMARY_SCHEMA
+    assert summary.to_pylist() == [
+        {"code": "string_too_short", "path": "/names/common/*", "count": 6}
+    ]
+
+
+def test_add_validation_error():
+    with pytest.raises(ValidationError) as e:
+        Division.model_validate({"id": "", "geometry": "foo", "type": "division"})
+    errors = ErrorCollector()
+
+    errors.add_validation_error(7, e.value)
+
+    records = errors.to_table(messages=True).to_pylist()
+    assert [(r["row"], r["property"], r["code"]) for r in records] == [
+        (7, "/id", "string_too_short"),
+        (7, "/geometry", "geometry_invalid"),
+        (7, "/sources", "missing"),
+    ]
+    assert records[2]["message"] == "Field required"
+
+
+def test_validate_stream_errors():
+    valid = {
+        "id": "foo",
+        "geometry": {"type": "Point", "coordinates": [0, 0]},
+        "type": "division",
+        "sources": [{"property": "", "dataset": "foo"}],
+    }
+    # Blank lines aren't rows.
+    lines = [json.dumps(valid), "", json.dumps({**valid, "sources": []}), "\n", "{"]
+    errors = ErrorCollector()
+
+    list(validate_stream(Division, lines, errors=errors))
+
+    assert [(r["row"], r["code"]) for r in errors.to_table().to_pylist()] == [
+        (1, "too_short"),
+        (2, "json_invalid"),
+    ]
+
+
+def test_add_validation_error_model():
+    value = {
+        "type": "Feature",
+        "id": "foo",
+        "geometry": {"type": "Point", "coordinates": [0, 0]},
+        "properties": {
+            "type": "division",
+            "sources": [{"property": "", "dataset": "foo"}, {"property": ""}],
+            "names": {"primary": "foo", "common": {"!x": "foo", "en": 5}},
+        },
+    }
+    with pytest.raises(ValidationError) as e:
+        Division.model_validate(value)
+    with_model = ErrorCollector()
+    without_model = ErrorCollector()
+
+    with_model.add_validation_error(0, e.value, Division)
+    without_model.add_validation_error(0, e.value)
+
+    assert with_model.to_table()["property"].to_pylist() == [
+        "/sources/1/dataset",
+        "/names/common/!x",
+        "/names/common/en",
+    ]
+    assert {r["path"] for r in with_model.summary().to_pylist()} == {
+        "/names/common/*",
+        "/sources/*/dataset",
+    }
+    # Without the model, map keys and the GeoJSON layout can't be told from properties.
+    assert without_model.to_table()["property"].to_pylist() == [
+        "/properties/sources/1/dataset",
+        "/properties/names/common/!x",
+        "/properties/names/common/en",
+    ]
+
+
+@pytest.mark.parametrize("layout", ["flat", "geo_json"])
+@pytest.mark.parametrize("registry", [False, True])
+def test_validate_stream_errors_match_table(layout, registry):
+    common = [("en", "foo"), ("!x", "foo"), ("a/b", "foo"), ("!y", "foo")]
+    names_type = pa.struct(
+        [("primary", pa.string()), ("common", pa.map_(pa.string(), pa.string()))]
+    )
+    table = make_table(
+        2,
+        id=pa.array(["foo", ""]),
+        names=pa.array([None, {"primary": "foo", "common": common}], names_type),
+    )
+    records = table.to_pylist()
+    for record in records:
+        record["geometry"] = {"type": "Point", "coordinates": [0, 0]}
+        if record["names"] is not None:
+            record["names"]["common"] = dict(record["names"]["common"])
+        if layout == "geo_json":
+            record.update(
+                type="Feature",
+                properties={"type": record["type"], "sources": record.pop("sources")},
+            )
+            record["properties"]["names"] = record.pop("names")
+    model = FeatureRegistry([Division, Other]) if registry else Division
+    table_errors = ErrorCollector()
+    stream_errors = ErrorCollector()
+
+    collect_table_errors(Division, table, table_errors)
+    list(validate_stream(model, map(json.dumps, records), errors=stream_errors))
+
+    def errors_of(errors):
+        return sorted(
+            (r["row"], r["property"], r["code"]) for r in errors.to_table().to_pylist()
+        )
+
+    assert errors_of(stream_errors) == errors_of(table_errors)
+    assert errors_of(stream_errors) == [
+        (1, "/id", "string_too_short"),
+        (1, "/names/common/!x", "string_pattern_mismatch"),
+        (1, "/names/common/!y", "string_pattern_mismatch"),
+        (1, "/names/common/a~1b", "string_pattern_mismatch"),
+    ]
+    # Map keys are counted together.
+    assert stream_errors.summary().to_pylist() == table_errors.summary().to_pylist()
+    assert {r["path"] for r in stream_errors.summary().to_pylist()} == {
+        "/id",
+        "/names/common/*",
+    }
+
+
+@pytest.mark.parametrize(
+    "code,params,message",
+    [
+        ("column_missing", {}, "required column is missing"),
+        ("literal_error", {"expected": "'a'"}, "Input should be 'a'"),
+        ("foo", {}, "foo"),
+        # Parameters pydantic needs are missing.
+        ("too_short", {}, "too_short"),
+    ],
+)
+def test_format_error(code, params, message):
+    assert format_error(code, params) == message
+
+
+def test_invalid_max_errors():
+    with pytest.raises(ValueError):
+        ErrorCollector(max_errors=-1)
+
+
+def test_empty():
+    errors = ErrorCollector()
+    errors.add_many(np.array([], dtype=np.int64), "/foo", "foo")
+    assert errors.to_table().num_rows == 0
+    assert errors.to_table(messages=True).schema.names[-1] == "message"
+    assert errors.summary().num_rows == 0
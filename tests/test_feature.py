@@ -1,11 +1,16 @@
+from overture_schema_pydantic import feature, geometry
 from overture_schema_pydantic.feature import Feature
+from overture_schema_pydantic.names import Names
 
 import copy
+import json
 from datetime import datetime, timezone, timedelta
-from typing import Any
+from typing import Any, Optional
 
 import pytest
-from pydantic import ValidationError
+import shapely
+from shapely.geometry import mapping
+from pydantic import Field, ValidationError
 
 
 class DummyFeature(Feature):
@@ -81,46 +86,306 @@ def set_key(d: dict, k: Any, v: Any) -> None:
     return None
 
 
-@pytest.mark.parametrize(
-    "name,permute",
-    [
-        ("id_missing", lambda d: delete_key(d, "id")),
-        ("id_empty", lambda d: set_key(d, "id", "")),
-        ("id_blank", lambda d: set_key(d, "id", " ")),
-        ("id_whitespace", lambda d: set_key(d, "id", " foo ")),
-        ("type_missing", lambda d: delete_key(d, "type")),
-        ("type_empty", lambda d: set_key(d, "type", "")),
-        ("type_blank", lambda d: set_key(d, "type", " ")),
-        ("type_whitespace", lambda d: set_key(d, "type", " foo ")),
-        ("geometry_missing", lambda d: delete_key(d, "geometry")),
-        ("geometry_string", lambda d: set_key(d, "geometry", "foo")),
-        ("geometry_type_missing", lambda d: delete_key(d["geometry"], "type")),
-        ("geometry_type_invalid", lambda d: set_key(d["geometry"], "type", "Triangle")),
-        (
-            "geometry_coordinates_missing",
-            lambda d: delete_key(d["geometry"], "coordinates"),
-        ),
-        ("sources_missing", lambda d: delete_key(d, "sources")),
-        ("sources_empty", lambda d: set_key(d, "sources", ())),
-        ("sources_item_type_invalid", lambda d: set_key(d, "sources", ("foo", "bar"))),
-        (
-            "sources_item_property_missing",
-            lambda d: set_key(d, "sources", ({"dataset": "foo"},)),
-        ),
-        (
-            "sources_item_dataset_missing",
-            lambda d: set_key(d, "sources", ({"property": "foo"},)),
-        ),
-        ("names_primary_missing", lambda d: delete_key(d["names"], "primary")),
-        ("names_common_empty", lambda d: set_key(d["names"], "common", {})),
-        (
-            "names_common_invalid_language_tag",
-            lambda d: set_key(d["names"], "common", {"!foo": "bar"}),
-        ),
-    ],
-)
+INVALID_PERMUTATIONS = [
+    ("id_missing", lambda d: delete_key(d, "id")),
+    ("id_empty", lambda d: set_key(d, "id", "")),
+    ("id_blank", lambda d: set_key(d, "id", " ")),
+    ("id_whitespace", lambda d: set_key(d, "id", " foo ")),
+    ("type_missing", lambda d: delete_key(d, "type")),
+    ("type_empty", lambda d: set_key(d, "type", "")),
+    ("type_blank", lambda d: set_key(d, "type", " ")),
+    ("type_whitespace", lambda d: set_key(d, "type", " foo ")),
+    ("geometry_missing", lambda d: delete_key(d, "geometry")),
+    ("geometry_string", lambda d: set_key(d, "geometry", "foo")),
+    ("geometry_type_missing", lambda d: delete_key(d["geometry"], "type")),
+    ("geometry_type_invalid", lambda d: set_key(d["geometry"], "type", "Triangle")),
+    (
+        "geometry_coordinates_missing",
+        lambda d: delete_key(d["geometry"], "coordinates"),
+    ),
+    ("sources_missing", lambda d: delete_key(d, "sources")),
+    ("sources_empty", lambda d: set_key(d, "sources", ())),
+    ("sources_item_type_invalid", lambda d: set_key(d, "sources", ("foo", "bar"))),
+    (
+        "sources_item_property_missing",
+        lambda d: set_key(d, "sources", ({"dataset": "foo"},)),
+    ),
+    (
+        "sources_item_dataset_missing",
+        lambda d: set_key(d, "sources", ({"property": "foo"},)),
+    ),
+    ("names_primary_missing", lambda d: delete_key(d["names"], "primary")),
+    ("names_common_empty", lambda d: set_key(d["names"], "common", {})),
+    (
+        "names_common_invalid_language_tag",
+        lambda d: set_key(d["names"], "common", {"!foo": "bar"}),
+    ),
+]
+
+
+@pytest.mark.parametrize("name,permute", INVALID_PERMUTATIONS)
 def test_invalid(name, permute):
     d = copy.deepcopy(VALID_STARTING_POINT)
     permute(d)
     with pytest.raises(ValidationError):
         DummyFeature(**d)
+
+
+@pytest.fixture(params=["standard", "raw_geometry"])
+def json_path(request, monkeypatch):
+    # Features this small are validated by pydantic from JSON, unless the raw geometry path is
+    # forced for every size.
+    if request.param == "raw_geometry":
+        monkeypatch.setattr(geometry, "_RAW_GEOMETRY_MIN_SIZE", 0)
+        monkeypatch.setattr(geometry, "_LAZY_RAW_GEOMETRY_MIN_SIZE", 0)
+    return request.param
+
+
+def test_valid_json(json_path):
+    m = DummyFeature.model_validate_json(json.dumps(VALID_STARTING_POINT))
+
+    assert m == DummyFeature(**VALID_STARTING_POINT)
+    assert m.geometry.geom_type == "Point"
+
+
+def test_valid_json_bytes_lazy(json_path):
+    m = DummyFeature.model_validate_json(
+        json.dumps(VALID_STARTING_POINT).encode(), context={"lazy_geometry": True}
+    )
+
+    assert m.geometry.is_lazy
+    raw = m.geometry.raw
+    if json_path == "raw_geometry":
+        raw = json.loads(raw)
+    assert raw == VALID_STARTING_POINT["geometry"]
+
+
+def test_json_raw_geometry_by_size():
+    small = copy.deepcopy(VALID_STARTING_POINT)
+    large = small | {"geometry": mapping(shapely.Point(0, 0).buffer(1, quad_segs=256))}
+    context = {"lazy_geometry": True}
+
+    small_raw = DummyFeature.model_validate_json(json.dumps(small), context=context)
+    large_raw = DummyFeature.model_validate_json(json.dumps(large), context=context)
+
+    # Only the large geometry is left as JSON text.
+    assert isinstance(small_raw.geometry.raw, dict)
+    assert isinstance(large_raw.geometry.raw, str)
+    assert large_raw == DummyFeature.model_validate(large)
+
+
+@pytest.mark.parametrize("name,permute", INVALID_PERMUTATIONS)
+def test_invalid_json(json_path, name, permute):
+    d = copy.deepcopy(VALID_STARTING_POINT)
+    permute(d)
+    with pytest.raises(ValidationError):
+        DummyFeature.model_validate_json(json.dumps(d))
+
+
+def test_invalid_json_syntax(json_path):
+    with pytest.raises(ValidationError):
+        DummyFeature.model_validate_json('{"id": "foo", "geometry": {"type": "Point"')
+
+
+@pytest.mark.parametrize("mode", ["python", "json"])
+@pytest.mark.parametrize("geometry_format", [None, "geo_json", "wkb", "wkt"])
+def test_dump_many(geometry_format, mode):
+    features = [
+        DummyFeature(**VALID_STARTING_POINT),
+        DummyFeature.model_validate(
+            VALID_STARTING_POINT
+            | {"id": "bar", "geometry": shapely.to_wkb(shapely.box(0, 0, 1, 1))},
+            context={"lazy_geometry": True},
+        ),
+    ]
+    context = {"geometry_format": geometry_format}
+
+    dumped = DummyFeature.dump_many(features, geometry_format, mode, exclude_none=True)
+
+    expected = [
+        f.model_dump(mode=mode, context=context, exclude_none=True) for f in features
+    ]
+    assert dumped == expected
+    assert [list(d) for d in dumped] == [list(d) for d in expected]
+
+
+class AliasedFeature(Feature):
+    id: str = Field(serialization_alias="feature_id")
+    names: Optional[Names] = Field(None, serialization_alias="labels")
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"include": {"id", "type"}},
+        {"include": {"geometry", "names"}},
+        {"include": {"id": True, "sources": {0: {"dataset"}}}},
+        {"exclude": {"names"}},
+        {"exclude": {"geometry", "sources"}},
+        {"exclude": {"sources": {"__all__": {"update_time"}}, "names": ...}},
+        {"by_alias": True},
+        {"by_alias": True, "exclude": {"type"}},
+    ],
+    ids=repr,
+)
+@pytest.mark.parametrize("mode", ["python", "json"])
+def test_dump_many_options(kwargs, mode):
+    features = [
+        AliasedFeature.model_validate(VALID_STARTING_POINT),
+        AliasedFeature.model_validate(VALID_STARTING_POINT | {"id": "bar"}),
+    ]
+
+    dumped = AliasedFeature.dump_many(features, mode=mode, **kwargs)
+
+    expected = [f.model_dump(mode=mode, **kwargs) for f in features]
+    assert dumped == expected
+    assert [list(d) for d in dumped] == [list(d) for d in expected]
+
+
+def test_json_schema_bbox():
+    json_schema = DummyFeature.model_json_schema()
+    assert json_schema["properties"]["bbox"]["minItems"] == 4
+    assert "bbox" not in json_schema["required"]
+
+
+def test_json_schema_bbox_not_shared():
+    class Feature3D(Feature):
+        @classmethod
+        def __get_pydantic_json_schema__(cls, core_schema, handler):
+            json_schema = super().__get_pydantic_json_schema__(core_schema, handler)
+            json_schema["properties"]["bbox"]["minItems"] = 6
+            return json_schema
+
+    assert Feature3D.model_json_schema()["properties"]["bbox"]["minItems"] == 6
+    # Changing one feature's schema doesn't change the others.
+    assert DummyFeature.model_json_schema()["properties"]["bbox"]["minItems"] == 4
+
+
+def geo_json_feature(flat: dict) -> dict:
+    return {
+        "type": "Feature",
+        "id": flat["id"],
+        "geometry": flat["geometry"],
+        "properties": {k: v for k, v in flat.items() if k not in ("id", "geometry")},
+    }
+
+
+def test_valid_geo_json(json_path):
+    expected = DummyFeature.model_validate(VALID_STARTING_POINT)
+    value = geo_json_feature(VALID_STARTING_POINT)
+
+    assert DummyFeature.model_validate(value) == expected
+    assert DummyFeature.model_validate_json(json.dumps(value)) == expected
+    assert DummyFeature.model_validate_json(json.dumps(value), strict=True) == expected
+
+
+def test_invalid_geo_json():
+    value = geo_json_feature(VALID_STARTING_POINT)
+    value["properties"]["sources"] = []
+
+    with pytest.raises(ValidationError) as e:
+        DummyFeature.model_validate(value)
+    assert [error["loc"] for error in e.value.errors()] == [("properties", "sources")]
+
+
+def test_invalid_geo_json_missing_type():
+    # The GeoJSON `"type": "Feature"` member isn't a valid feature type.
+    value = geo_json_feature(VALID_STARTING_POINT)
+    del value["properties"]["type"]
+
+    with pytest.raises(ValidationError) as e:
+        DummyFeature.model_validate(value)
+    assert [error["loc"] for error in e.value.errors()] == [("type",)]
+
+
+@pytest.mark.parametrize("mode", ["python", "json"])
+def test_to_geo_json(mode):
+    feature = DummyFeature.model_validate(VALID_STARTING_POINT)
+    geo_json = feature.to_geo_json(mode=mode, exclude_none=True)
+
+    assert list(geo_json) == ["type", "id", "geometry", "properties"]
+    assert geo_json["type"] == "Feature"
+    assert geo_json["properties"]["type"] == "bar"
+    assert "id" not in geo_json["properties"]
+    assert DummyFeature.model_validate(geo_json) == feature
+    assert DummyFeature.dump_many([feature], mode=mode, layout="geo_json") == [
+        feature.to_geo_json(mode=mode)
+    ]
+    with pytest.raises(ValueError):
+        DummyFeature.dump_many([feature], layout="foo")
+
+
+@pytest.mark.parametrize("mode", ["python", "json"])
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"exclude": {"names"}}, {"include": {"id", "geometry", "type", "sources"}}],
+    ids=repr,
+)
+def test_to_geo_json_round_trip(mode, kwargs):
+    feature = DummyFeature.model_validate(VALID_STARTING_POINT)
+    geo_json = feature.to_geo_json(mode=mode, **kwargs)
+
+    assert list(geo_json) == ["type", "id", "geometry", "properties"]
+    assert list(geo_json["properties"]) == ["type", "sources"]
+    assert DummyFeature.model_validate(geo_json) == feature.model_copy(
+        update={"names": None}
+    )
+
+
+def test_to_geo_json_without_geometry():
+    feature = DummyFeature.model_validate(VALID_STARTING_POINT)
+
+    assert feature.to_geo_json(include={"id", "type"}) == {
+        "type": "Feature",
+        "id": "foo",
+        "properties": {"type": "bar"},
+    }
+
+
+def test_json_schema_unchanged_by_aliases():
+    properties = DummyFeature.model_json_schema()["properties"]
+    assert set(properties) == {"id", "geometry", "properties", "type", "bbox"}
+    assert properties["properties"]["required"] == ["type", "sources"]
+
+
+@pytest.mark.parametrize("layout", ["flat", "geo_json"])
+def test_model_construct_trusted(layout):
+    value = copy.deepcopy(VALID_STARTING_POINT)
+    if layout == "geo_json":
+        value = geo_json_feature(value)
+    expected = DummyFeature.model_validate(value)
+
+    m = DummyFeature.model_construct_trusted(value)
+
+    assert m == expected
+    assert m.geometry.is_lazy
+    assert m.sources[1].update_time == expected.sources[1].update_time
+    assert m.model_fields_set == expected.model_fields_set
+    assert m.sources[0].model_fields_set == {"property", "dataset"}
+    assert m.model_dump(mode="json") == expected.model_dump(mode="json")
+
+
+def test_model_construct_trusted_model_slots():
+    # The fast path sets pydantic's private slots directly. If this fails, pydantic has changed
+    # how models store them, and construction has fallen back to the slower `model_construct`.
+    assert feature._HAS_MODEL_SLOTS
+
+
+@pytest.mark.parametrize("layout", ["flat", "geo_json"])
+def test_model_construct_trusted_without_model_slots(monkeypatch, layout):
+    value = copy.deepcopy(VALID_STARTING_POINT)
+    if layout == "geo_json":
+        value = geo_json_feature(value)
+    expected = DummyFeature.model_construct_trusted(value)
+    monkeypatch.setattr(feature, "_HAS_MODEL_SLOTS", False)
+
+    m = DummyFeature.model_construct_trusted(value)
+
+    assert m == expected
+    assert m.model_fields_set == expected.model_fields_set
+    assert m.sources[0].model_fields_set == {"property", "dataset"}
+
+
+def test_model_construct_trusted_does_not_validate():
+    m = DummyFeature.model_construct_trusted(VALID_STARTING_POINT | {"sources": []})
+    assert m.sources == []
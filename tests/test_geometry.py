@@ -1,11 +1,23 @@
-from overture_schema_pydantic.geometry import Geometry, GeometryTypeConstraint
+from overture_schema_pydantic.geometry import (
+    GEOMETRY_FORMATS,
+    Geometry,
+    GeometryTypeConstraint,
+    parse_json_with_raw_geometry,
+)
 
+import json
+import pickle
+import tracemalloc
 from dataclasses import dataclass
 from itertools import chain, combinations
 from typing import Annotated
 
+import numpy as np
+import pyarrow as pa
 import pytest
+import shapely
 from pydantic import BaseModel, ValidationError
+from shapely.geometry import mapping, shape
 
 
 def test_geometry_type_constraint_empty():
@@ -70,7 +82,421 @@ def test_geometry_type_constraint_valid(geometry_type_case_subset, subtests):
             for example in geometry_type_case.examples:
                 with subtests.test(example=example):
                     model_instance = ConstrainedModel(geometry=example)
+                    assert (
+                        model_instance.geometry.geom_type
+                        == geometry_type_case.geometry_type
+                    )
             for counterexample in geometry_type_case.counterexamples:
                 with subtests.test(counterexample=counterexample):
                     with pytest.raises(ValidationError):
                         model_instance = ConstrainedModel(geometry=counterexample)
+
+
+class GeometryModel(BaseModel):
+    geometry: Geometry
+
+
+WKB_POINT = shapely.to_wkb(shapely.Point(1, 2))
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        WKB_POINT,
+        bytearray(WKB_POINT),
+        memoryview(WKB_POINT),
+        pa.array([WKB_POINT])[0].as_buffer(),
+        WKB_POINT.hex(),
+        shapely.to_wkb(
+            shapely.set_srid(shapely.Point(1, 2), 4326), include_srid=True, hex=True
+        ),
+    ],
+)
+def test_geometry_from_wkb(value):
+    m = GeometryModel(geometry=value)
+    assert m.geometry.geom == shapely.Point(1, 2)
+
+
+@pytest.mark.parametrize("value", [b"", b"\x01\x02", "zz", 123])
+def test_geometry_from_wkb_invalid(value):
+    with pytest.raises(ValidationError):
+        GeometryModel(geometry=value)
+
+
+def test_geometry_type_constraint_wkb():
+    class ConstrainedModel(BaseModel):
+        geometry: Annotated[Geometry, GeometryTypeConstraint("Point")]
+
+    ConstrainedModel(geometry=WKB_POINT)
+    with pytest.raises(ValidationError) as e:
+        ConstrainedModel(geometry=shapely.to_wkb(shapely.box(0, 0, 1, 1)))
+    (error,) = e.value.errors()
+    assert error["type"] == "geometry_type_not_allowed"
+    assert error["loc"] == ("geometry",)
+    assert error["ctx"] == {"geometry_type": "Polygon", "allowed_types": ["Point"]}
+
+
+def test_geometry_invalid_error():
+    with pytest.raises(ValidationError) as e:
+        GeometryModel(geometry=b"\x07\x01")
+    (error,) = e.value.errors()
+    assert error["type"] == "geometry_invalid"
+    assert error["msg"].startswith("invalid geometry value: ")
+
+
+LAZY = {"lazy_geometry": True}
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"type": "Point", "coordinates": [1, 2]},
+        '{"type": "Point", "coordinates": [1, 2]}',
+        '{"coordinates": [1, 2], "type": "Point"}',
+        WKB_POINT,
+        memoryview(WKB_POINT),
+        WKB_POINT.hex(),
+        shapely.to_wkb(shapely.Point(1, 2), byte_order=0),
+        shapely.to_wkb(
+            shapely.set_srid(shapely.Point(1, 2), 4326), include_srid=True, hex=True
+        ),
+    ],
+)
+def test_lazy_geometry(value):
+    m = GeometryModel.model_validate({"geometry": value}, context=LAZY)
+
+    assert m.geometry.is_lazy
+    assert m.geometry.geom_type == "Point"
+    assert m.geometry.raw == value
+    assert m.model_dump()["geometry"] == value
+    assert m.geometry.geom == shapely.Point(1, 2)
+
+
+@pytest.mark.parametrize(
+    "wrap", [bytearray, memoryview, pa.py_buffer, lambda b: np.frombuffer(b, np.uint8)]
+)
+def test_lazy_geometry_buffer_not_copied(wrap):
+    # A large polygon, of which only the 5-byte header is read.
+    wkb = shapely.to_wkb(shapely.Polygon(np.random.default_rng(0).random((100_000, 2))))
+    value = wrap(wkb)
+    tracemalloc.start()
+    try:
+        m = GeometryModel.model_validate({"geometry": value}, context=LAZY)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert m.geometry.geom_type == "Polygon"
+    assert peak < len(wkb) / 10
+
+
+def test_lazy_geometry_type_constraint():
+    class ConstrainedModel(BaseModel):
+        geometry: Annotated[Geometry, GeometryTypeConstraint("Point")]
+
+    # The constraint is checked from the type tag, so the bad coordinates go unnoticed...
+    m = ConstrainedModel.model_validate(
+        {"geometry": {"type": "Point", "coordinates": "foo"}}, context=LAZY
+    )
+    assert m.geometry.geom_type == "Point"
+    # ...until the geometry is built.
+    with pytest.raises(Exception):
+        m.geometry.geom
+
+    with pytest.raises(ValidationError):
+        ConstrainedModel.model_validate(
+            {"geometry": shapely.to_wkb(shapely.box(0, 0, 1, 1))}, context=LAZY
+        )
+
+
+@pytest.mark.parametrize(
+    "value", [{}, {"type": "Triangle"}, b"\x07\x01", "zz", "{}", 123]
+)
+def test_lazy_geometry_invalid(value):
+    with pytest.raises(ValidationError):
+        GeometryModel.model_validate({"geometry": value}, context=LAZY)
+
+
+def test_lazy_geometry_dump_json():
+    m = GeometryModel.model_validate({"geometry": WKB_POINT}, context=LAZY)
+    assert json.loads(m.model_dump_json()) == {
+        "geometry": {"type": "Point", "coordinates": [1.0, 2.0]}
+    }
+
+
+def test_geometry_type_constraint_validate_many():
+    geometries = np.array(
+        [
+            shapely.Point(0, 0),
+            shapely.box(0, 0, 1, 1),
+            None,
+            shapely.MultiPoint([(0, 0), (1, 1)]),
+            shapely.LinearRing([(0, 0), (1, 0), (1, 1)]),
+            shapely.Point(1, 1),
+        ]
+    )
+
+    mask, offending = GeometryTypeConstraint("Point", "MultiPoint").validate_many(
+        geometries
+    )
+
+    assert mask.tolist() == [True, False, False, True, False, True]
+    assert offending.tolist() == [1, 2, 4]
+
+
+def test_geometry_type_constraint_validate_many_array_like():
+    class GeometryArray:
+        # Like GeoPandas' `GeometryArray`, which converts to an object array of shapely
+        # geometries.
+        def __init__(self, geometries):
+            self.geometries = geometries
+
+        def __len__(self):
+            return len(self.geometries)
+
+        def __array__(self, dtype=None, copy=None):
+            return np.array(self.geometries, dtype=object)
+
+    geometries = GeometryArray([shapely.Point(0, 0), shapely.box(0, 0, 1, 1), None])
+
+    mask, offending = GeometryTypeConstraint("Point").validate_many(geometries)
+
+    assert mask.tolist() == [True, False, False]
+    assert offending.tolist() == [1, 2]
+
+
+def test_geometry_type_constraint_validate_many_geopandas():
+    geopandas = pytest.importorskip("geopandas")
+    series = geopandas.GeoSeries([shapely.Point(0, 0), shapely.box(0, 0, 1, 1)])
+
+    mask, offending = GeometryTypeConstraint("Point").validate_many(series.values)
+
+    assert mask.tolist() == [True, False]
+    assert offending.tolist() == [1]
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        '{"type": "Point", "coordinates": [1, 2]}',
+        b' {"coordinates": [1, 2], "type": "Point"}',
+    ],
+)
+def test_geometry_from_geo_json_text(value):
+    m = GeometryModel(geometry=value)
+    assert not m.geometry.is_lazy
+    assert m.geometry.geom == shapely.Point(1, 2)
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        '{"type": "Point", "coordinates": "foo"}',
+        '{"type": "Triangle", "coordinates": [1, 2]}',
+        '{"type": "Feature", "geometry": {"type": "Point", "coordinates": [1, 2]}}',
+        "{",
+    ],
+)
+def test_geometry_from_geo_json_text_invalid(value):
+    with pytest.raises(ValidationError):
+        GeometryModel(geometry=value)
+
+
+GEOMETRY_TEXT = '{"type": "GeometryCollection", "geometries": [{"type": "Point", "coordinates": [1, 2]}]}'
+
+
+@pytest.mark.parametrize("text_type", [str, bytes])
+def test_parse_json_with_raw_geometry(text_type):
+    text = (
+        r'{"id": "a{b}\"", "geometry": '
+        + GEOMETRY_TEXT
+        + r', "properties": {"x": [1, {}]}}'
+    )
+    if text_type is bytes:
+        text = text.encode()
+
+    value = parse_json_with_raw_geometry(text)
+
+    assert value == {
+        "id": 'a{b}"',
+        "geometry": GEOMETRY_TEXT if text_type is str else GEOMETRY_TEXT.encode(),
+        "properties": {"x": [1, {}]},
+    }
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        '{"id": "foo"}',
+        '{"geometry": null}',
+        '{"properties": {"geometry": {"a": 1}}, "geometry": {"type": "Point"}}',
+        '[{"geometry": {"type": "Point"}}]',
+    ],
+)
+def test_parse_json_with_raw_geometry_fallback(text):
+    assert parse_json_with_raw_geometry(text) == json.loads(text)
+
+
+@pytest.mark.parametrize(
+    "geom",
+    [
+        shapely.Point(1, 2),
+        shapely.Point(1, 2, 3),
+        shapely.LineString([(0, 0), (1, 1), (2, 0)]),
+        shapely.box(0, 0, 10, 10).difference(shapely.box(2, 2, 3, 3)),
+        shapely.MultiPoint([(0, 0), (1, 1)]),
+        shapely.MultiLineString(
+            [
+                [(0, 0), (1, 1)],
+                [
+                    (2, 2),
+                    (
+                        3,
+                        3,
+                    ),
+                ],
+            ]
+        ),
+        shapely.MultiPolygon([shapely.box(0, 0, 1, 1), shapely.box(2, 2, 3, 3)]),
+        shapely.GeometryCollection(
+            [shapely.Point(0, 0), shapely.LineString([(0, 0), (1, 1)])]
+        ),
+    ],
+)
+def test_geometry_from_geo_json_matches_shape(geom):
+    geo_json = json.loads(shapely.to_geojson(geom))
+    assert Geometry.from_geo_json(geo_json).geom.equals_exact(shape(geo_json), 0)
+    assert Geometry.from_geo_json_text(json.dumps(geo_json)).geom.equals_exact(geom, 0)
+    # `mapping` nests tuples rather than lists.
+    assert Geometry.from_geo_json(mapping(geom)).geom.equals_exact(geom, 0)
+
+
+@pytest.mark.parametrize(
+    "geometry_type",
+    ["Point", "LineString", "Polygon", "MultiPoint", "MultiLineString", "MultiPolygon"],
+)
+@pytest.mark.parametrize("coordinates", [[], [[]], None])
+def test_geometry_from_geo_json_empty(geometry_type, coordinates):
+    # Accepted like `shape` and the WKB path do.
+    value = {"type": geometry_type, "coordinates": coordinates}
+    geometry = GeometryModel(geometry=value).geometry
+    assert geometry.geom_type == geometry_type
+    assert geometry.geom.is_empty
+    assert geometry.geom.equals_exact(shape(value), 0)
+    assert GeometryModel(geometry=json.dumps(value)).geometry.geom.is_empty
+    wkb = shapely.to_wkb(shapely.from_wkt(f"{geometry_type.upper()} EMPTY"))
+    assert GeometryModel(geometry=wkb).geometry.geom_type == geometry_type
+
+
+def test_geometry_from_geo_json_empty_parts():
+    value = {
+        "type": "Polygon",
+        "coordinates": [[[0, 0], [1, 1], [1, 0], [0, 0]], []],
+    }
+    geometry = GeometryModel(geometry=value).geometry
+    assert geometry.geom.equals_exact(shape(value), 0)
+    empty = {"type": "GeometryCollection", "geometries": []}
+    assert GeometryModel(geometry=empty).geometry.geom.is_empty
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"type": "LineString", "coordinates": [[0, 0], [1, 1, 1, 1]]},
+        {"type": "Polygon", "coordinates": [[[0, 0], [1, 1]]]},
+        {"type": "MultiLineString", "coordinates": [[[0, 0], [1, 1]], []]},
+        {"type": "MultiLineString", "coordinates": "foo"},
+        {"type": "GeometryCollection", "geometries": [{"type": "Feature"}]},
+    ],
+)
+def test_geometry_from_geo_json_invalid(value):
+    with pytest.raises(ValidationError):
+        GeometryModel(geometry=value)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+@pytest.mark.parametrize(
+    "value",
+    [
+        {"type": "Point", "coordinates": [1, 2]},
+        '{"type": "Point", "coordinates": [1, 2]}',
+        WKB_POINT,
+        WKB_POINT.hex(),
+    ],
+)
+def test_geometry_format(value, lazy):
+    m = GeometryModel.model_validate(
+        {"geometry": value}, context={"lazy_geometry": lazy}
+    )
+    point = shapely.Point(1, 2)
+
+    def dump(geometry_format, mode="python"):
+        return m.model_dump(mode=mode, context={"geometry_format": geometry_format})[
+            "geometry"
+        ]
+
+    assert shape(dump("geo_json")) == point
+    assert shapely.from_geojson(dump("geo_json_bytes")) == point
+    assert shapely.from_wkb(dump("wkb")) == point
+    assert dump("wkt") == "POINT (1 2)"
+    assert shape(dump("geo_json", "json")) == point
+    assert shape(dump("geo_json_bytes", "json")) == point
+    assert shapely.from_wkb(bytes.fromhex(dump("wkb", "json"))) == point
+    assert dump("wkt", "json") == "POINT (1 2)"
+    assert isinstance(dump("geo_json_bytes"), bytes)
+    assert isinstance(dump("wkb"), bytes)
+    assert json.loads(m.model_dump_json(context={"geometry_format": "wkb"})) == {
+        "geometry": dump("wkb", "json")
+    }
+
+
+def test_geometry_format_wkt_full_precision():
+    m = GeometryModel(geometry={"type": "Point", "coordinates": [0.1, 1 / 3]})
+    dumped = m.model_dump(context={"geometry_format": "wkt"})["geometry"]
+    assert shapely.from_wkt(dumped) == m.geometry.geom
+
+
+def test_geometry_format_invalid():
+    m = GeometryModel(geometry=WKB_POINT)
+    with pytest.raises(Exception, match="invalid geometry format"):
+        m.model_dump(context={"geometry_format": "foo"})
+
+
+@pytest.mark.parametrize("mode", ["python", "json"])
+@pytest.mark.parametrize("geometry_format", [None, *GEOMETRY_FORMATS])
+def test_geometry_serialize_many(geometry_format, mode):
+    geometries = [
+        GeometryModel.model_validate({"geometry": value}, context=context).geometry
+        for value in (
+            WKB_POINT,
+            {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+        )
+        for context in (None, LAZY)
+    ]
+    context = {"geometry_format": geometry_format}
+    assert Geometry.serialize_many(geometries, geometry_format, mode) == [
+        GeometryModel.model_construct(geometry=g).model_dump(
+            mode=mode, context=context
+        )["geometry"]
+        for g in geometries
+    ]
+
+
+@pytest.mark.parametrize("context", [None, LAZY])
+def test_geometry_slots(context):
+    m = GeometryModel.model_validate({"geometry": WKB_POINT}, context=context)
+
+    assert not hasattr(m.geometry, "__dict__")
+    copied = pickle.loads(pickle.dumps(m.geometry))
+    assert copied.is_lazy == m.geometry.is_lazy
+    assert copied == m.geometry
+
+
+@pytest.mark.parametrize("context", [None, LAZY])
+def test_geometry_bounds(context):
+    m = GeometryModel.model_validate(
+        {"geometry": shapely.to_wkb(shapely.box(0, 1, 2, 3))}, context=context
+    )
+
+    assert m.geometry.bounds == (0.0, 1.0, 2.0, 3.0)
+    assert m.geometry.bounds is m.geometry.bounds
@@ -0,0 +1,38 @@
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+
+SRC = Path(__file__).parent.parent / "src"
+
+# Packages that validation must not load: optional extras, tooling, and (for modules that don't
+# validate Arrow tables) PyArrow.
+OPTIONAL = ("pandas", "geopandas", "libcst", "black")
+
+
+def imported_packages(module: str) -> set[str]:
+    # The top-level packages loaded by importing `module` in a fresh interpreter.
+    code = f"import json, sys; import {module}; print(json.dumps(sorted(sys.modules)))"
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    result = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, check=True
+    )
+    return {name.split(".")[0] for name in json.loads(result.stdout)}
+
+
+@pytest.mark.parametrize(
+    "module, forbidden",
+    [
+        ("overture_schema_pydantic.divisions", OPTIONAL + ("pyarrow", "argparse")),
+        ("overture_schema_pydantic.registry", OPTIONAL + ("pyarrow", "argparse")),
+        ("overture_schema_pydantic.stream", OPTIONAL + ("pyarrow", "argparse")),
+        ("overture_schema_pydantic.batch", OPTIONAL),
+    ],
+)
+def test_validation_imports(module, forbidden):
+    packages = imported_packages(module)
+    assert not packages & set(forbidden)
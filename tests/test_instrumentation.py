@@ -0,0 +1,107 @@
+from overture_schema_pydantic.constraint import MinItems
+from overture_schema_pydantic.divisions import Division
+from overture_schema_pydantic.instrumentation import Instrumentation
+
+import threading
+from typing import Annotated
+
+from pydantic import BaseModel, ValidationError
+
+import pytest
+
+
+VALID = {
+    "id": "foo",
+    "type": "division",
+    "geometry": {"type": "Point", "coordinates": [0, 0]},
+    "sources": [{"property": "", "dataset": "foo"}],
+}
+
+INVALID = {**VALID, "geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]}}
+
+
+class Tagged(BaseModel):
+    tag: Annotated[str, MinItems(2)]
+
+
+def test_counts_by_validator_model_and_field():
+    instrumentation = Instrumentation()
+    context = {"instrumentation": instrumentation}
+
+    Division.model_validate(VALID, context=context)
+    with pytest.raises(ValidationError):
+        Division.model_validate(INVALID, context=context)
+    with pytest.raises(ValidationError):
+        Tagged.model_validate({"tag": "a"}, context=context)
+
+    result = instrumentation.to_dict()
+    assert set(result) == {"Geometry", "GeometryTypeConstraint", "MinItems"}
+    geometry = result["Geometry"]["Division"]["geometry"]
+    assert (geometry["calls"], geometry["failures"]) == (2, 0)
+    assert geometry["seconds"] > 0
+    constraint = result["GeometryTypeConstraint"]["Division"]["geometry"]
+    assert (constraint["calls"], constraint["failures"]) == (2, 1)
+    min_items = result["MinItems"]["Tagged"]["tag"]
+    assert (min_items["calls"], min_items["failures"]) == (1, 1)
+
+
+def test_disabled():
+    instrumentation = Instrumentation()
+    Division.model_validate(VALID)
+    Division.model_validate(VALID, context={"lazy_geometry": True})
+    assert instrumentation.to_dict() == {}
+
+
+def test_reset():
+    instrumentation = Instrumentation()
+    Division.model_validate(VALID, context={"instrumentation": instrumentation})
+    instrumentation.reset()
+    assert instrumentation.to_dict() == {}
+
+
+def test_threads():
+    instrumentation = Instrumentation()
+    context = {"instrumentation": instrumentation}
+
+    def validate():
+        for _ in range(100):
+            Division.model_validate(VALID, context=context)
+
+    threads = [threading.Thread(target=validate) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert instrumentation.to_dict()["Geometry"]["Division"]["geometry"]["calls"] == 400
+
+
+def test_to_prometheus():
+    instrumentation = Instrumentation()
+    with pytest.raises(ValidationError):
+        Division.model_validate(INVALID, context={"instrumentation": instrumentation})
+
+    lines = instrumentation.to_prometheus(prefix="test").splitlines()
+    assert "# TYPE test_calls_total counter" in lines
+    assert (
+        'test_failures_total{validator="GeometryTypeConstraint",model="Division",field="geometry"} 1'
+        in lines
+    )
+    assert (
+        'test_failures_total{validator="Geometry",model="Division",field="geometry"} 0'
+        in lines
+    )
+    assert any(
+        line.startswith('test_seconds_total{validator="Geometry"') for line in lines
+    )
+
+
+def test_to_prometheus_empty():
+    assert Instrumentation().to_prometheus(prefix="test").splitlines() == [
+        "# HELP test_calls_total Validator calls.",
+        "# TYPE test_calls_total counter",
+        "# HELP test_failures_total Validator calls that raised an error.",
+        "# TYPE test_failures_total counter",
+        "# HELP test_seconds_total Time spent in validator calls.",
+        "# TYPE test_seconds_total counter",
+    ]
@@ -0,0 +1,125 @@
+from overture_schema_pydantic import main
+from overture_schema_pydantic.divisions import Division
+from overture_schema_pydantic.feature import Feature
+from overture_schema_pydantic.geometry import _NAMED_GEOMETRY_JSON_SCHEMAS
+from overture_schema_pydantic.json_schema import (
+    schema_bundle,
+    schema_fingerprint,
+    JSON_SCHEMA_DIALECT,
+)
+
+import json
+import os
+from typing import Any, Iterator
+
+import pytest
+
+
+class AnyGeometryFeature(Feature):
+    pass
+
+
+MODELS = [Division, AnyGeometryFeature]
+
+
+def walk(node: Any) -> Iterator[Any]:
+    yield node
+    if isinstance(node, dict):
+        for value in node.values():
+            yield from walk(value)
+    elif isinstance(node, list):
+        for value in node:
+            yield from walk(value)
+
+
+def test_named_geometry_json_schemas_are_distinct():
+    canonical = {
+        json.dumps(s, sort_keys=True) for s in _NAMED_GEOMETRY_JSON_SCHEMAS.values()
+    }
+    assert len(canonical) == len(_NAMED_GEOMETRY_JSON_SCHEMAS)
+
+
+def test_schema_bundle():
+    bundle = schema_bundle(MODELS)
+
+    assert bundle["$schema"] == JSON_SCHEMA_DIALECT
+    assert bundle["anyOf"] == [
+        {"$ref": "#/$defs/Division"},
+        {"$ref": "#/$defs/AnyGeometryFeature"},
+    ]
+    refs = {n["$ref"] for n in walk(bundle) if isinstance(n, dict) and "$ref" in n}
+    assert refs == {f"#/$defs/{name}" for name in bundle["$defs"]}
+    assert {"Names", "Source", "GeoJSONPoint", "GeoJSONPosition"} <= set(
+        bundle["$defs"]
+    )
+
+
+def test_schema_bundle_validates_records():
+    jsonschema = pytest.importorskip("jsonschema")
+    validator = jsonschema.Draft202012Validator(schema_bundle(MODELS))
+    division = Division.model_validate(
+        {
+            "id": "foo",
+            "type": "division",
+            "geometry": {"type": "Point", "coordinates": [0, 0]},
+            "sources": [{"property": "", "dataset": "foo"}],
+        }
+    )
+    # Tuples aren't JSON arrays to `jsonschema`, so the record goes through JSON text.
+    record = json.loads(json.dumps(division.to_geo_json()))
+
+    # Valid for both feature types in the bundle.
+    assert validator.is_valid(record)
+    assert not validator.is_valid({**record, "geometry": {"type": "Point"}})
+    assert not validator.is_valid({**record, "properties": {}})
+
+
+def test_schema_bundle_geometry_defined_once():
+    bundle = schema_bundle(MODELS)
+
+    # Only the definition itself can be equal to the original, when it has no sub-schemas that
+    # are themselves replaced by references.
+    schemas = [json.dumps(n, sort_keys=True) for n in walk(bundle["$defs"])]
+    for name, schema in _NAMED_GEOMETRY_JSON_SCHEMAS.items():
+        assert schemas.count(json.dumps(schema, sort_keys=True)) <= 1, name
+    # Smaller than the separate schemas, which repeat the geometry.
+    assert len(json.dumps(bundle)) < sum(
+        len(json.dumps(m.model_json_schema())) for m in MODELS
+    )
+
+
+def test_schema_bundle_empty():
+    with pytest.raises(ValueError):
+        schema_bundle([])
+
+
+def test_schema_fingerprint():
+    assert schema_fingerprint(MODELS) == schema_fingerprint(reversed(MODELS))
+    assert schema_fingerprint(MODELS) != schema_fingerprint([Division])
+
+
+def test_schema_bundle_cache(tmp_path):
+    bundle = schema_bundle(MODELS, cache_dir=tmp_path)
+    path = tmp_path / f"schema-bundle-{schema_fingerprint(MODELS)}.json"
+    assert json.loads(path.read_text()) == bundle
+
+    # The cached file is used rather than rebuilding the bundle.
+    path.write_text('{"cached": true}')
+    assert schema_bundle(MODELS, cache_dir=tmp_path) == {"cached": True}
+    assert schema_bundle([Division], cache_dir=tmp_path) != {"cached": True}
+    assert len(list(tmp_path.iterdir())) == 2
+
+
+def test_schema_bundle_cache_write_failure(tmp_path, monkeypatch):
+    def fail(*args):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", fail)
+    with pytest.raises(OSError):
+        schema_bundle(MODELS, cache_dir=tmp_path)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_main_schema(tmp_path, capsys):
+    assert main(["schema", "--type", "division", "--cache-dir", str(tmp_path)]) == 0
+    assert json.loads(capsys.readouterr().out) == schema_bundle([Division])
@@ -0,0 +1,67 @@
+from overture_schema_pydantic.language import (
+    BCP_47_REGEX,
+    COMMON_LANGUAGE_TAGS,
+    InternedLanguageTag,
+    LanguageTag,
+)
+
+import pytest
+from pydantic import TypeAdapter, ValidationError
+
+
+ADAPTER = TypeAdapter(LanguageTag)
+
+INTERNED_ADAPTER = TypeAdapter(InternedLanguageTag)
+
+
+def test_common_language_tags_are_valid():
+    assert len(set(COMMON_LANGUAGE_TAGS)) == len(COMMON_LANGUAGE_TAGS)
+    assert [t for t in COMMON_LANGUAGE_TAGS if not BCP_47_REGEX.match(t)] == []
+
+
+@pytest.mark.parametrize("tag", ["en", "zh-Hant", "sr-Latn"])
+def test_common_language_tag_interned(tag):
+    value = "".join(list(tag))  # An equal but distinct `str`.
+    assert value is not tag
+    assert (
+        INTERNED_ADAPTER.validate_python(value)
+        is COMMON_LANGUAGE_TAGS[COMMON_LANGUAGE_TAGS.index(tag)]
+    )
+    assert INTERNED_ADAPTER.validate_json(f'"{tag}"') == tag
+    assert ADAPTER.validate_python(value) == tag
+
+
+@pytest.mark.parametrize("adapter", [ADAPTER, INTERNED_ADAPTER])
+@pytest.mark.parametrize("tag", ["en-GB-oxendict", "yue-Hant", "EN"])
+def test_uncommon_language_tag(adapter, tag):
+    assert tag not in COMMON_LANGUAGE_TAGS
+    assert adapter.validate_python(tag) == tag
+
+
+@pytest.mark.parametrize(
+    "value, error_type",
+    [
+        ("", "string_too_short"),
+        ("e", "string_too_short"),
+        ("!!", "string_pattern_mismatch"),
+        ("en_US", "string_pattern_mismatch"),
+        (5, "string_type"),
+        (None, "string_type"),
+    ],
+)
+@pytest.mark.parametrize("adapter", [ADAPTER, INTERNED_ADAPTER])
+def test_invalid_language_tag(adapter, value, error_type):
+    with pytest.raises(ValidationError) as e:
+        adapter.validate_python(value)
+    assert [error["type"] for error in e.value.errors()] == [error_type]
+
+
+@pytest.mark.parametrize("adapter", [ADAPTER, INTERNED_ADAPTER])
+def test_language_tag_json_schema(adapter):
+    assert adapter.json_schema() == {
+        "type": "string",
+        "minLength": 2,
+        "pattern": BCP_47_REGEX.pattern,
+        "description": "BCP-47 language tag",
+        "examples": ["en", "en-US", "zh-Hant"],
+    }
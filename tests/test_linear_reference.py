@@ -0,0 +1,176 @@
+from overture_schema_pydantic.linear_reference import LinearReferenceIndex
+from overture_schema_pydantic.scoping import Heading, Scope, scoped
+
+import random
+import tracemalloc
+from typing import Optional
+
+import numpy as np
+import pytest
+from pydantic import BaseModel
+
+
+@scoped([Scope.GEOMETRIC_POINT, Scope.GEOMETRIC_RANGE, Scope.HEADING])
+class Rule(BaseModel):
+    value: int
+
+
+RULES = [
+    Rule(value=0),
+    Rule(value=1, between=[0, 0.5]),
+    Rule(value=2, between=[0.5, 1], when={"heading": "forward"}),
+    Rule(value=3, at=0.25),
+    Rule(value=4, between=[0.2, 0.3], when={"heading": "backward"}),
+]
+
+
+def values_of(result: list[list[Rule]]) -> list[list[int]]:
+    return [[rule.value for rule in rules] for rules in result]
+
+
+def test_at():
+    index = LinearReferenceIndex(RULES)
+    assert values_of(index.at([0, 0.1, 0.25, 0.5, 0.75, 1])) == [
+        [0, 1],
+        [0, 1],
+        [0, 1, 3, 4],
+        [0, 1, 2],
+        [0, 2],
+        [0, 2],
+    ]
+
+
+def test_at_heading():
+    index = LinearReferenceIndex(RULES)
+    assert values_of(index.at([0.25, 0.75], Heading.FORWARD)) == [[0, 1, 3], [0, 2]]
+    assert values_of(index.at([0.25, 0.75], "backward")) == [[0, 1, 3, 4], [0]]
+    with pytest.raises(ValueError):
+        index.at([0.5], "sideways")
+
+
+def test_at_outside():
+    index = LinearReferenceIndex(RULES)
+    assert values_of(index.at([-1, 2, np.nan])) == [[0], [0], []]
+
+
+def test_at_indices():
+    offsets, indices = LinearReferenceIndex(RULES).at_indices([0.1, 0.75])
+    assert offsets.tolist() == [0, 2, 4]
+    assert indices.tolist() == [0, 1, 0, 2]
+
+
+def test_between():
+    index = LinearReferenceIndex(RULES)
+    assert values_of(index.between([0, 0.26, 0.3, 0.6], [0.1, 0.27, 0.4, 0.7])) == [
+        [0, 1],
+        [0, 1, 4],
+        [0, 1, 4],
+        [0, 2],
+    ]
+    assert values_of(index.between([0.3], [0.4], Heading.FORWARD)) == [[0, 1]]
+    assert values_of(index.between(0, [0.2, 1])) == [[0, 1, 4], [0, 1, 2, 3, 4]]
+
+
+def test_between_invalid():
+    with pytest.raises(ValueError):
+        LinearReferenceIndex(RULES).between([0.5], [0.4])
+
+
+def test_empty():
+    index = LinearReferenceIndex([])
+    assert len(index) == 0
+    assert index.at([0.5]) == [[]]
+    assert index.between([0], [1]) == [[]]
+    assert index.at([]) == []
+
+
+def brute_force(
+    rules: list[Rule], start: float, end: float, heading: Optional[Heading]
+) -> list[int]:
+    result = []
+    for i, rule in enumerate(rules):
+        if rule.between is not None:
+            lo, hi = rule.between
+        elif rule.at is not None:
+            lo = hi = rule.at
+        else:
+            lo, hi = -np.inf, np.inf
+        rule_heading = rule.when.heading if rule.when is not None else None
+        if heading is not None and rule_heading not in (None, heading):
+            continue
+        if lo <= end and hi >= start:
+            result.append(i)
+    return result
+
+
+@pytest.mark.parametrize("heading", [None, Heading.FORWARD, Heading.BACKWARD])
+def test_matches_brute_force(heading):
+    rng = random.Random(0)
+    # Positions on a coarse grid, so ranges often share ends.
+    point = lambda: rng.randint(0, 20) / 20
+    rules = []
+    for i in range(200):
+        kind = rng.random()
+        when = {"heading": rng.choice(list(Heading))} if rng.random() < 0.3 else None
+        if kind < 0.1:
+            rules.append(Rule(value=i, when=when))
+        elif kind < 0.4:
+            rules.append(Rule(value=i, at=point(), when=when))
+        else:
+            rules.append(Rule(value=i, between=sorted([point(), point()]), when=when))
+    starts = np.array([point() for _ in range(300)] + [0.01, 0.99])
+    ends = np.minimum(
+        starts + np.array([rng.choice([0, 0.05, 0.3]) for _ in starts]), 1
+    )
+
+    assert_matches_brute_force(rules, starts, ends, heading)
+
+
+@pytest.mark.parametrize("heading", [None, Heading.FORWARD])
+def test_nested_matches_brute_force(heading):
+    # Ranges nested inside each other, with points and shared ends among them.
+    rules = [
+        Rule(
+            value=i,
+            between=[i / 400, 1 - i / 400],
+            when={"heading": "backward"} if i % 5 == 0 else None,
+        )
+        for i in range(150)
+    ]
+    rules += [Rule(value=150 + i, at=i / 40) for i in range(40)]
+    rules += [Rule(value=190 + i, between=[0.25, 0.25 + i / 100]) for i in range(20)]
+    starts = np.concatenate((np.linspace(0, 1, 201), [i / 400 for i in range(150)]))
+    ends = np.minimum(starts + 0.01, 1)
+
+    assert_matches_brute_force(rules, starts, ends, heading)
+
+
+def test_nested_linear_memory():
+    count = 20_000
+    rules = [
+        Rule(value=i, between=[i / (3 * count), 1 - i / (3 * count)])
+        for i in range(count)
+    ]
+    index = LinearReferenceIndex(rules)
+    tracemalloc.start()
+    try:
+        offsets, _ = index.at_indices([0.5, 0.0])
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert offsets.tolist() == [0, count, count + 1]
+    # Indexing each value once per range end it contains would take gigabytes.
+    assert peak < 50 * count * 8
+
+
+def assert_matches_brute_force(
+    rules: list[Rule], starts: np.ndarray, ends: np.ndarray, heading: Optional[Heading]
+):
+    index = LinearReferenceIndex(rules)
+    at = index.at(starts, heading)
+    between = index.between(starts, ends, heading)
+
+    for i, (start, end) in enumerate(zip(starts, ends)):
+        assert [r.value for r in at[i]] == brute_force(rules, start, start, heading)
+        assert [r.value for r in between[i]] == brute_force(rules, start, end, heading)
@@ -0,0 +1,119 @@
+from overture_schema_pydantic.divisions import Division
+from overture_schema_pydantic.parallel import plan_chunks, validate_files, EXECUTORS
+
+from factories import division
+
+import json
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+import shapely
+
+
+def write_ndjson(path, invalid: set[int], n: int = 100):
+    with open(path, "w") as f:
+        for i in range(n):
+            geometry_type = "LineString" if i in invalid else "Point"
+            f.write(json.dumps(division(i, geometry_type, geo_json=True)))
+            f.write("\n")
+
+
+def write_parquet(path, invalid: set[int], n: int = 100, row_group_size: int = 10):
+    geometries = [
+        shapely.to_wkb(
+            shapely.LineString([(0, 0), (i, i)])
+            if i in invalid
+            else shapely.Point(i, i)
+        )
+        for i in range(n)
+    ]
+    table = pa.table(
+        {
+            "id": [f"id{i}" for i in range(n)],
+            "geometry": geometries,
+            "type": ["division"] * n,
+            "sources": [[{"property": "", "dataset": "foo"}]] * n,
+        }
+    )
+    pq.write_table(table, path, row_group_size=row_group_size)
+
+
+def test_plan_chunks(tmp_path):
+    ndjson_path = tmp_path / "a.geojsonl"
+    parquet_path = tmp_path / "b.parquet"
+    write_ndjson(ndjson_path, set())
+    write_parquet(parquet_path, set())
+
+    chunks = plan_chunks([ndjson_path, parquet_path], chunk_rows=25, chunk_bytes=1000)
+
+    ndjson_chunks = [c for c in chunks if c.kind == "ndjson"]
+    parquet_chunks = [c for c in chunks if c.kind == "parquet"]
+    assert len(ndjson_chunks) > 1
+    assert ndjson_chunks[-1].stop == ndjson_path.stat().st_size
+    assert [(c.start, c.stop) for c in parquet_chunks] == [
+        (0, 3),
+        (3, 6),
+        (6, 9),
+        (9, 10),
+    ]
+
+
+@pytest.mark.parametrize("executor", EXECUTORS)
+def test_validate_files(tmp_path, executor):
+    ndjson_path = tmp_path / "a.geojsonl"
+    parquet_path = tmp_path / "b.parquet"
+    write_ndjson(ndjson_path, {3, 50, 99})
+    write_parquet(parquet_path, {0, 42})
+
+    summary = validate_files(
+        Division,
+        [str(ndjson_path), str(parquet_path)],
+        max_workers=2,
+        chunk_rows=25,
+        chunk_bytes=1000,
+        executor=executor,
+    )
+
+    assert summary.records == 200
+    assert summary.invalid == 5
+    assert summary.valid == 195
+    assert [(e.path, e.index, e.property) for e in summary.errors] == [
+        (str(ndjson_path), 3, "/geometry"),
+        (str(ndjson_path), 50, "/geometry"),
+        (str(ndjson_path), 99, "/geometry"),
+        (str(parquet_path), 0, "/geometry"),
+        (str(parquet_path), 42, "/geometry"),
+    ]
+    assert not summary.truncated
+
+
+def test_validate_files_escapes_pointers(tmp_path):
+    ndjson_path = tmp_path / "a.geojsonl"
+    value = division(0, geo_json=True)
+    value["properties"]["names"] = {"primary": "x", "common": {"en/x~y": "foo"}}
+    ndjson_path.write_text(json.dumps(value) + "\n")
+
+    summary = validate_files(Division, [str(ndjson_path)], max_workers=1)
+
+    # A pointer into the feature's properties, escaped like `validate_table` reports it.
+    assert [e.property for e in summary.errors] == ["/names/common/en~1x~0y"]
+
+
+@pytest.mark.parametrize("executor", EXECUTORS)
+def test_validate_files_max_errors(tmp_path, executor):
+    ndjson_path = tmp_path / "a.geojsonl"
+    write_ndjson(ndjson_path, set(range(10)), n=10)
+
+    summary = validate_files(
+        Division, [str(ndjson_path)], max_workers=1, max_errors=3, executor=executor
+    )
+
+    assert summary.invalid == 10
+    assert len(summary.errors) == 3
+    assert summary.truncated
+
+
+def test_validate_files_invalid_executor(tmp_path):
+    with pytest.raises(ValueError):
+        validate_files(Division, [], executor="fiber")
@@ -0,0 +1,181 @@
+from overture_schema_pydantic.divisions import Division
+from overture_schema_pydantic.feature import Feature
+from overture_schema_pydantic.geometry import Geometry, GeometryTypeConstraint
+from overture_schema_pydantic.registry import (
+    default_registry,
+    load_feature_type,
+    FeatureRegistry,
+)
+from overture_schema_pydantic.stream import validate_stream
+
+import json
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+from typing import Annotated, Literal
+
+import pytest
+from pydantic import ValidationError
+
+
+class Segment(Feature):
+    geometry: Annotated[Geometry, GeometryTypeConstraint("LineString")]
+    type: Literal["segment", "connector"]
+
+
+def feature(type_: str, geometry: dict) -> dict:
+    return {
+        "id": "foo",
+        "type": type_,
+        "geometry": geometry,
+        "sources": [{"property": "", "dataset": "foo"}],
+    }
+
+
+DIVISION = feature("division", {"type": "Point", "coordinates": [0, 0]})
+
+SEGMENT = feature("segment", {"type": "LineString", "coordinates": [[0, 0], [1, 1]]})
+
+
+def test_default_registry():
+    assert default_registry()["division"] is Division
+    assert load_feature_type("division") is Division
+    assert load_feature_type(f"{__name__}:Segment") is Segment
+    with pytest.raises(ValueError):
+        load_feature_type("foo")
+
+
+def test_registry_dispatch():
+    registry = FeatureRegistry([Division, Segment])
+
+    assert registry.types == {
+        "division": Division,
+        "segment": Segment,
+        "connector": Segment,
+    }
+    assert registry.adapter.core_schema["type"] in ("tagged-union", "definitions")
+    assert isinstance(registry.model_validate(DIVISION), Division)
+    assert isinstance(registry.model_validate(SEGMENT), Segment)
+    assert isinstance(
+        registry.model_validate({**SEGMENT, "type": "connector"}), Segment
+    )
+    assert isinstance(registry.model_validate_json(json.dumps(SEGMENT)), Segment)
+
+
+def test_registry_dispatch_geo_json():
+    registry = FeatureRegistry([Division, Segment])
+    connector = registry.model_validate(SEGMENT).to_geo_json()
+    connector["properties"]["type"] = "connector"
+
+    assert isinstance(registry.model_validate(connector), Segment)
+    assert isinstance(registry.model_validate_json(json.dumps(connector)), Segment)
+    # The GeoJSON `"type": "Feature"` member isn't a feature type.
+    del connector["properties"]["type"]
+    with pytest.raises(ValidationError) as e:
+        registry.model_validate(connector)
+    assert [error["type"] for error in e.value.errors()] == ["union_tag_invalid"]
+
+
+@pytest.mark.parametrize(
+    "value,error_type",
+    [
+        ({**DIVISION, "type": "foo"}, "union_tag_invalid"),
+        ({k: v for k, v in DIVISION.items() if k != "type"}, "union_tag_not_found"),
+        # Only the selected type's errors are reported.
+        ({**SEGMENT, "geometry": DIVISION["geometry"]}, "geometry_type_not_allowed"),
+    ],
+)
+def test_registry_dispatch_invalid(value, error_type):
+    registry = FeatureRegistry([Division, Segment])
+    with pytest.raises(ValidationError) as e:
+        registry.model_validate(value)
+    assert [error["type"] for error in e.value.errors()] == [error_type]
+
+
+def test_registry_single_type():
+    registry = FeatureRegistry([Division])
+    assert isinstance(registry.model_validate(DIVISION), Division)
+
+
+def test_registry_register():
+    registry = FeatureRegistry([Division])
+    registry.adapter
+
+    assert registry.register(Segment) is Segment
+    assert isinstance(registry.model_validate(SEGMENT), Segment)
+    # Registering again is harmless.
+    registry.register(Segment)
+    assert registry.models == [Division, Segment]
+
+
+def test_registry_register_invalid():
+    class DuplicateDivision(Feature):
+        type: Literal["division"]
+
+    class NoLiteral(Feature):
+        pass
+
+    registry = FeatureRegistry([Division])
+    with pytest.raises(ValueError):
+        registry.register(DuplicateDivision)
+    with pytest.raises(TypeError):
+        registry.register(NoLiteral)
+    with pytest.raises(TypeError):
+        registry.register(dict)
+    assert registry.models == [Division]
+
+
+def test_registry_model_construct_trusted():
+    registry = FeatureRegistry([Division, Segment])
+
+    assert isinstance(registry.model_construct_trusted(SEGMENT), Segment)
+    assert isinstance(
+        registry.model_construct_trusted({**SEGMENT, "type": "connector"}), Segment
+    )
+    with pytest.raises(ValidationError):
+        registry.model_construct_trusted({**SEGMENT, "type": "foo"})
+
+
+def test_registry_pickle():
+    registry = pickle.loads(pickle.dumps(FeatureRegistry([Division, Segment])))
+    assert isinstance(registry.model_validate(SEGMENT), Segment)
+
+
+def test_registry_threads():
+    registry = FeatureRegistry([Division, Segment])
+    with ThreadPoolExecutor(8) as pool:
+        adapters = set(map(id, pool.map(lambda _: registry.adapter, range(32))))
+        results = list(pool.map(registry.model_validate, [DIVISION, SEGMENT] * 16))
+    # Built once, however many threads asked for it first.
+    assert len(adapters) == 1
+    assert [type(r) for r in results] == [Division, Segment] * 16
+
+
+def test_registry_register_threads():
+    models = [
+        type(f"Road{i}", (Feature,), {"__annotations__": {"type": Literal["road"]}})
+        for i in range(16)
+    ]
+    registry = FeatureRegistry()
+
+    def register(model):
+        try:
+            return registry.register(model)
+        except ValueError:
+            return None
+
+    with ThreadPoolExecutor(8) as pool:
+        registered = [m for m in pool.map(register, models) if m is not None]
+    # Only one of the models that raced for the same type wins.
+    assert len(registered) == 1
+    assert registry.models == registered
+
+
+def test_registry_validate_stream():
+    registry = FeatureRegistry([Division, Segment])
+    lines = [json.dumps(v) for v in (DIVISION, SEGMENT, {**SEGMENT, "type": "foo"})]
+
+    results = list(validate_stream(registry, lines))
+
+    assert isinstance(results[0].feature, Division)
+    assert isinstance(results[1].feature, Segment)
+    assert not results[2].valid
@@ -0,0 +1,84 @@
+from overture_schema_pydantic.sampling import Sample
+
+import itertools
+import pickle
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+
+def test_select_stratified():
+    sample = Sample(rate=0.1, seed=0)
+    indices = sample.select(95)
+
+    # One record from every block of ten, including the last, partial one.
+    assert list(indices // 10) == list(range(10))
+    assert indices[-1] < 95
+    assert len(sample.select(3)) == 1
+    assert len(sample.select(0)) == 0
+
+
+def test_select_random():
+    sample = Sample(rate=0.1, stratified=False, seed=0)
+    indices = sample.select(10_000)
+
+    assert 800 < len(indices) < 1200
+    assert np.all(np.diff(indices) > 0)
+
+
+def test_select_seed():
+    assert list(Sample(rate=0.1, seed=1).select(100)) == list(
+        Sample(rate=0.1, seed=1).select(100)
+    )
+
+
+def test_flags():
+    flags = list(itertools.islice(Sample(rate=0.25, seed=0).flags(), 100))
+    assert [sum(flags[i : i + 4]) for i in range(0, 100, 4)] == [1] * 25
+
+
+@pytest.mark.parametrize("kwargs", [{"rate": 0}, {"rate": 2}, {"confidence": 1}])
+def test_invalid(kwargs):
+    with pytest.raises(ValueError):
+        Sample(**kwargs)
+
+
+def test_estimate():
+    sample = Sample()
+    assert sample.error_rate == 0
+    assert sample.error_rate_upper_bound == 1
+
+    sample.update(records=1_000_000, sampled=1000)
+    assert sample.error_rate == 0
+    # Close to the "rule of three" bound of 3 / n.
+    assert 0.002 < sample.error_rate_upper_bound < 0.004
+
+    sample.update(invalid=10)
+    assert sample.error_rate == 0.01
+    assert sample.estimated_invalid == 10_000
+    assert 0.01 < sample.error_rate_upper_bound < 0.02
+    assert "1.000%" in str(sample)
+
+
+def test_update_threads():
+    sample = Sample(0.5)
+
+    def update(_):
+        for _ in range(1000):
+            sample.update(records=2, sampled=1)
+
+    with ThreadPoolExecutor(8) as pool:
+        list(pool.map(update, range(8)))
+    assert (sample.records, sample.sampled) == (16000, 8000)
+
+
+def test_pickle():
+    sample = Sample(0.5, seed=0)
+    sample.update(records=10, sampled=5, invalid=1)
+
+    copy = pickle.loads(pickle.dumps(sample))
+
+    assert copy == sample
+    copy.update(records=1)
+    assert copy.records == 11
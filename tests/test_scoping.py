@@ -1,6 +1,9 @@
+from overture_schema_pydantic.errors import format_error
+from overture_schema_pydantic import scoping
 from overture_schema_pydantic.scoping import Scope, scoped
 
 import pytest
+from pydantic import BaseModel, ValidationError
 
 import re
 
@@ -30,3 +33,125 @@ def test_scoped_error_allowed_empty():
 def test_scoped_error_required_not_in_allowed():
     with pytest.raises(ValueError):
         scoped([Scope.HEADING, Scope.SIDE], required=[Scope.GEOMETRIC_RANGE])
+
+
+def errors_of(model: type[BaseModel], value: dict) -> list[tuple[str, tuple]]:
+    with pytest.raises(ValidationError) as e:
+        model.model_validate(value)
+    return [(error["type"], error["loc"]) for error in e.value.errors()]
+
+
+@pytest.fixture
+def label_scope(monkeypatch):
+    # Only `heading` is a `when` field so far, so this makes `Scope.VEHICLE` stand in for a second
+    # one, `label`, while the test runs.
+    def clear_caches():
+        scoping._make_scoped_fields.cache_clear()
+        scoping._make_when_field.cache_clear()
+
+    monkeypatch.setattr(
+        scoping,
+        "_WHEN_FIELDS",
+        {**scoping._WHEN_FIELDS, Scope.VEHICLE: ("label", str)},
+    )
+    clear_caches()
+    yield Scope.VEHICLE
+    clear_caches()
+
+
+@pytest.fixture
+def rule(label_scope) -> type[BaseModel]:
+    @scoped([Scope.HEADING, label_scope, Scope.GEOMETRIC_RANGE])
+    class Rule(BaseModel):
+        value: int
+
+    return Rule
+
+
+def test_scoped_when_at_least_one(rule):
+    assert rule.model_validate({"value": 1}).when is None
+    when = rule.model_validate({"value": 1, "when": {"label": "foo"}}).when
+    assert (when.heading, when.label) == (None, "foo")
+    when = rule.model_validate(
+        {"value": 1, "when": {"heading": "forward", "label": "foo"}}
+    ).when
+    assert (when.heading, when.label) == ("forward", "foo")
+
+    assert errors_of(rule, {"value": 1, "when": {}}) == [("scope_missing", ("when",))]
+    # Unset fields default to `None`, but can't be set to `null`.
+    assert errors_of(rule, {"value": 1, "when": {"heading": None}}) == [
+        ("enum", ("when", "heading"))
+    ]
+
+
+def test_scoped_when_at_least_one_message(rule):
+    with pytest.raises(ValidationError) as e:
+        rule.model_validate({"value": 1, "when": {}})
+    error = e.value.errors()[0]
+    assert error["msg"] == "at least one of `heading`, `label` must be set"
+    assert format_error(error["type"], error["ctx"]) == error["msg"]
+
+
+def test_scoped_when_at_least_one_never_dumps(rule, monkeypatch):
+    def model_dump(*args, **kwargs):
+        raise AssertionError("model_dump called")
+
+    monkeypatch.setattr(when_of(rule), "model_dump", model_dump)
+    rule.model_validate({"value": 1, "when": {"heading": "backward"}})
+
+
+def test_scoped_when_at_least_one_json_schema(rule):
+    when_schema = rule.model_json_schema()["$defs"]["When"]
+    assert when_schema["minProperties"] == 1
+    assert "required" not in when_schema
+
+
+def test_scoped_when_single_optional():
+    @scoped(Scope.HEADING)
+    class HeadingRule(BaseModel):
+        value: int
+
+    assert HeadingRule.model_validate({"value": 1}).when is None
+    assert errors_of(HeadingRule, {"value": 1, "when": {}}) == [
+        ("missing", ("when", "heading"))
+    ]
+    when_schema = HeadingRule.model_json_schema()["$defs"]["When"]
+    assert when_schema["required"] == ["heading"]
+
+
+def test_scoped_when_required(label_scope):
+    @scoped([Scope.HEADING, label_scope], required=label_scope)
+    class LabelRule(BaseModel):
+        value: int
+
+    assert errors_of(LabelRule, {"value": 1}) == [("missing", ("when",))]
+    assert errors_of(LabelRule, {"value": 1, "when": {"heading": "forward"}}) == [
+        ("missing", ("when", "label"))
+    ]
+    when = LabelRule.model_validate({"value": 1, "when": {"label": "foo"}}).when
+    assert (when.heading, when.label) == (None, "foo")
+
+
+def when_of(model: type[BaseModel]) -> type[BaseModel]:
+    return model.model_fields["when"].annotation.__args__[0]
+
+
+def test_scoped_when_shared():
+    @scoped(Scope.HEADING)
+    class Other(BaseModel):
+        name: str
+
+    @scoped([Scope.HEADING, Scope.GEOMETRIC_POINT])
+    class PointRule(BaseModel):
+        value: int
+
+    @scoped([Scope.HEADING, Scope.GEOMETRIC_POINT], required=Scope.HEADING)
+    class HeadingRule(BaseModel):
+        value: int
+
+    assert when_of(PointRule) is when_of(Other)
+    assert HeadingRule.model_fields["when"].annotation is not when_of(Other)
+    assert "at" in PointRule.model_fields and "at" not in Other.model_fields
+    assert errors_of(Other, {"name": "a", "when": {}}) == [
+        ("missing", ("when", "heading"))
+    ]
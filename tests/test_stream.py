@@ -0,0 +1,147 @@
+from overture_schema_pydantic import main
+from overture_schema_pydantic.divisions import Division
+from overture_schema_pydantic.sampling import Sample
+from overture_schema_pydantic.stream import validate_stream, StreamStats
+
+import json
+
+import pytest
+
+
+VALID_FEATURE = {
+    "type": "Feature",
+    "id": "foo",
+    "geometry": {"type": "Point", "coordinates": [0, 0]},
+    "properties": {
+        "type": "division",
+        "sources": [{"property": "", "dataset": "foo"}],
+    },
+}
+
+INVALID_FEATURE = {
+    **VALID_FEATURE,
+    "geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+}
+
+
+def lines(*values) -> list[bytes]:
+    return [
+        v if isinstance(v, bytes) else json.dumps(v).encode() + b"\n" for v in values
+    ]
+
+
+def test_validate_stream():
+    stats = StreamStats()
+    results = list(
+        validate_stream(
+            Division,
+            lines(
+                VALID_FEATURE,
+                INVALID_FEATURE,
+                b"\n",
+                b"{",
+                b"\x1e" + lines(VALID_FEATURE)[0],
+            ),
+            stats,
+        )
+    )
+
+    assert [(r.line, r.valid) for r in results] == [
+        (1, True),
+        (2, False),
+        (4, False),
+        (5, True),
+    ]
+    assert results[0].feature.id == "foo"
+    assert results[1].errors[0]["loc"][0] == "geometry"
+    assert results[2].errors[0]["type"] == "json_invalid"
+    assert stats.count == 4
+    assert stats.valid == 2
+    assert stats.invalid == 2
+    assert stats.features_per_second > 0
+
+
+def test_validate_stream_flat_layout():
+    flat = {
+        "id": "foo",
+        "geometry": {"type": "Point", "coordinates": [0, 0]},
+        **VALID_FEATURE["properties"],
+    }
+    (result,) = validate_stream(Division, [json.dumps(flat)])
+    assert result.valid
+
+
+def test_validate_stream_sample():
+    sample = Sample(rate=0.5, seed=0)
+    stats = StreamStats()
+    values = [VALID_FEATURE, INVALID_FEATURE] * 50
+
+    results = list(validate_stream(Division, lines(*values), stats, sample=sample))
+
+    assert sample.records == 100
+    assert sample.sampled == 50
+    # Only sampled invalid features are found.
+    assert sample.invalid == stats.invalid
+    assert 0 < sample.invalid < 50
+    # Unsampled features are constructed, so invalid ones pass, with lazy geometry.
+    trusted = [r for r in results if r.line % 2 == 0 and r.valid]
+    assert len(trusted) == 50 - sample.invalid
+    assert all(r.feature.geometry.is_lazy for r in trusted)
+
+
+def test_validate_stream_sample_unconstructable():
+    # Trusted input that can't even be constructed is reported as invalid.
+    value = {**VALID_FEATURE, "geometry": {"type": "Foo"}}
+    (result,) = validate_stream(
+        Division, lines(value), sample=Sample(rate=0.001, seed=0)
+    )
+    assert not result.valid
+
+
+def test_validate_stream_is_lazy():
+    def endless():
+        while True:
+            yield json.dumps(VALID_FEATURE)
+
+    stream = validate_stream(Division, endless())
+    assert all(next(stream).valid for _ in range(10))
+
+
+def test_main_validate(tmp_path, capsys):
+    path = tmp_path / "features.geojsonl"
+    path.write_bytes(b"".join(lines(VALID_FEATURE, INVALID_FEATURE)))
+
+    assert main(["validate", "--type", "division", str(path)]) == 1
+
+    out, err = capsys.readouterr()
+    (error_line,) = out.splitlines()
+    assert json.loads(error_line)["line"] == 2
+    assert "features/s" in err
+
+
+def test_main_validate_unknown_type(tmp_path):
+    with pytest.raises(SystemExit):
+        main(["validate", "--type", "foo", str(tmp_path / "missing.geojsonl")])
+
+
+def test_main_validate_mixed_types(tmp_path, capsys):
+    path = tmp_path / "features.geojsonl"
+    path.write_bytes(b"".join(lines(VALID_FEATURE, INVALID_FEATURE)))
+
+    assert main(["validate", str(path)]) == 1
+
+    out, _ = capsys.readouterr()
+    (error_line,) = out.splitlines()
+    assert json.loads(error_line)["line"] == 2
+
+
+def test_main_validate_sample(tmp_path, capsys):
+    path = tmp_path / "features.geojsonl"
+    path.write_bytes(b"".join(lines(VALID_FEATURE, INVALID_FEATURE)))
+
+    assert main(["validate", "--sample-rate", "1", str(path)]) == 1
+
+    _, err = capsys.readouterr()
+    assert "sampled 2 of 2 records (1 invalid)" in err
+    with pytest.raises(SystemExit):
+        main(["validate", "--sample-rate", "0", str(path)])